@@ -3,15 +3,31 @@ from flask import Flask
 from config import Config
 from .exceptions import register_error_handlers
 from .extensions import csrf, db, migrate
+from .utils.audit import init_audit
+from .utils.cache import init_catalog_caches
+from .utils.compression import init_compression
+from .utils.csrf import init_csrf_masking
+from .utils.fragments import init_fragment_caches
+from .utils.health import init_readiness
+from .utils.instrumentation import init_instrumentation
+from .utils.pool import init_pool_metrics
+from .utils.replicas import init_replicas
+from .utils.templates import init_template_cache, warm_templates
 
 
-def create_app():
+def create_app(config_class=Config, precompile_templates=None):
     """
     Factory de la aplicación Flask.
 
     Crea y configura la instancia de la aplicación Flask,
     inicializa extensiones y registra blueprints.
 
+    Args:
+        config_class: Clase de configuración (por defecto `Config`; las
+            pruebas usan una subclase con SQLite en memoria)
+        precompile_templates: Compila todas las plantillas al arrancar
+            (por defecto, según `TEMPLATE_PRECOMPILE`)
+
     Returns:
         Flask: Instancia configurada de la aplicación
     """
@@ -19,12 +35,14 @@ def create_app():
     app = Flask(__name__)
 
     # Initialize environment variables
-    app.config.from_object(Config)
+    app.config.from_object(config_class)
 
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
     csrf.init_app(app)
+    # Per-response CSRF token mask so compressed pages don't leak it (BREACH)
+    init_csrf_masking(app)
 
     # Import models to register them with SQLAlchemy
     from . import models  # noqa: F401
@@ -33,6 +51,9 @@ def create_app():
     register_error_handlers(app)
 
     # Register blueprints
+    from .health import health_bp
+    app.register_blueprint(health_bp)
+
     from .catalogs.colors import colors_bp
     app.register_blueprint(colors_bp, url_prefix='/colors')
     
@@ -42,4 +63,54 @@ def create_app():
     from .catalogs.wood_types import woods_types_bp
     app.register_blueprint(woods_types_bp, url_prefix='/wood-types')
 
+    from .api import api_bp
+    app.register_blueprint(api_bp, url_prefix='/api/v1')
+    # JSON API: bodies are application/json (never a cross-site form), so no CSRF token
+    csrf.exempt(api_bp)
+
+    from .events import events_bp
+    app.register_blueprint(events_bp, url_prefix='/events')
+
+    if app.config["INTERNAL_ENDPOINTS_ENABLED"]:
+        from .internal import internal_bp
+        app.register_blueprint(internal_bp, url_prefix='/internal')
+
+    # Register CLI commands
+    from .catalogs.cli import catalogs_cli
+    app.cli.add_command(catalogs_cli)
+
+    # Apply cache settings to the catalog caches created by the services
+    init_catalog_caches(app)
+    init_fragment_caches(app)
+
+    # Lazily built prefix indexes for /<catalog>/suggest
+    from .catalogs.suggest import init_suggest_indexes
+    init_suggest_indexes(app)
+
+    # Cached database ping for /readyz
+    init_readiness(app)
+
+    # gzip/brotli responses and precompressed static files
+    init_compression(app)
+
+    # Track connection pool usage for /internal/pool
+    with app.app_context():
+        init_pool_metrics(app, db.engine)
+        # Route request reads to healthy replicas, if configured
+        init_replicas(app)
+        # Background writer for audit_log
+        init_audit(app, db.engine)
+        # Server-Sent Events of catalog changes for /events/catalogs
+        from .events.broker import init_events
+        init_events(app, db.engine)
+        # Opt-in Server-Timing instrumentation
+        init_instrumentation(app, db.engine)
+
+    # Jinja bytecode cache on disk and optional template warm-up
+    init_template_cache(app)
+    if precompile_templates is None:
+        precompile_templates = app.config["TEMPLATE_PRECOMPILE"]
+    if precompile_templates:
+        warm_templates(app)
+
     return app
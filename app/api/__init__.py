@@ -0,0 +1,12 @@
+"""
+API JSON versionada de catálogos (`/api/v1/<catalog>`).
+
+Expone listado paginado, consulta, alta, actualización y eliminación lógica
+de los catálogos para los frontends de punto de venta y comercio electrónico.
+"""
+
+from flask import Blueprint
+
+api_bp = Blueprint('api', __name__)
+
+from . import routes  # noqa: E402, F401
@@ -0,0 +1,58 @@
+"""
+Documentos JSON de la API, compartidos por las rutas de Flask y las de ASGI.
+"""
+
+import json
+from typing import Optional
+
+from app.catalogs.registry import CatalogSpec
+from app.utils.pagination import Page
+from app.utils.serializers import ModelSerializer, get_serializer
+
+
+def page_link_params(
+    spec: CatalogSpec, serializer: ModelSerializer, page: Page, show_deleted: bool
+) -> dict:
+    """
+    Query params que conservan los enlaces `next`/`prev` además del cursor.
+
+    Args:
+        spec: Catálogo listado
+        serializer: Serializador del fieldset pedido
+        page: Página actual
+        show_deleted: True si se listan los registros eliminados
+
+    Returns:
+        dict: limit y, si aplica, fields y deleted
+    """
+    params = {"limit": page.limit}
+    if serializer is not get_serializer(spec.model):
+        params["fields"] = ",".join(serializer.fields)
+    if show_deleted:
+        params["deleted"] = 1
+    return params
+
+
+def page_document(
+    serializer: ModelSerializer, page: Page, next_url: Optional[str], prev_url: Optional[str]
+) -> str:
+    """
+    Documento JSON de una página de registros.
+
+    Args:
+        serializer: Serializador del fieldset pedido
+        page: Página a serializar
+        next_url: Enlace a la página siguiente (None si no hay)
+        prev_url: Enlace a la página anterior (None si no hay)
+
+    Returns:
+        str: {"data": [...], "meta": {...}, "links": {...}}
+    """
+    meta = {"limit": page.limit, "next_cursor": page.next_cursor, "prev_cursor": page.prev_cursor}
+    links = {"next": next_url, "prev": prev_url}
+    # El arreglo de registros ya viene como texto JSON del serializador
+    return (
+        '{"data":' + serializer.dumps_many(page.items)
+        + ',"meta":' + json.dumps(meta)
+        + ',"links":' + json.dumps(links) + "}"
+    )
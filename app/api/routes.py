@@ -0,0 +1,130 @@
+"""
+Rutas/Endpoints de la API JSON de catálogos.
+"""
+
+from flask import Response, jsonify, request, url_for
+from werkzeug.exceptions import HTTPException
+
+from app.catalogs.registry import get_catalog
+from app.exceptions import AppException
+from app.utils.conditional import conditional_get
+from app.utils.pagination import parse_page_args
+from app.utils.serializers import get_serializer
+from . import api_bp
+from .documents import page_document, page_link_params
+from .services import CatalogApiService
+
+
+def _serializer(spec):
+    """Serializador del fieldset pedido en `?fields=`; siempre incluye la llave primaria."""
+    return get_serializer(spec.model).subset(request.args.get("fields"), always=(spec.pk,))
+
+
+def _record_response(spec, row) -> Response:
+    """Registro escrito con todos los campos públicos, serializado como en GET."""
+    serializer = get_serializer(spec.model)
+    return Response('{"data":' + serializer.dumps(row) + "}", mimetype="application/json")
+
+
+@api_bp.route("/<catalog>", methods=["GET"])
+@conditional_get(lambda catalog: CatalogApiService.get_list_validator(get_catalog(catalog)))
+def list_items(catalog: str):
+    """
+    Lista paginada (keyset) de registros de un catálogo.
+
+    Query params:
+        after / before / limit: Cursores y tamaño de página
+        deleted: 1 para listar los registros eliminados
+        fields: Campos a incluir separados por comas (sparse fieldset)
+
+    Returns:
+        JSON: {"data": [...], "meta": {...}, "links": {...}}
+    """
+    spec = get_catalog(catalog)
+    serializer = _serializer(spec)
+    after, before, limit = parse_page_args(request.args)
+    show_deleted = request.args.get("deleted", type=int) == 1
+    page = CatalogApiService.get_page(spec, serializer, after, before, limit, active=not show_deleted)
+
+    params = page_link_params(spec, serializer, page, show_deleted)
+    next_url = (
+        url_for("api.list_items", catalog=catalog, after=page.next_cursor, **params)
+        if page.has_next else None
+    )
+    prev_url = (
+        url_for("api.list_items", catalog=catalog, before=page.prev_cursor, **params)
+        if page.has_prev else None
+    )
+    body = page_document(serializer, page, next_url, prev_url)
+    return Response(body, mimetype="application/json")
+
+
+@api_bp.route("/<catalog>/<int:pk>", methods=["GET"])
+def get_item(catalog: str, pk: int):
+    """
+    Obtiene un registro por su ID.
+
+    Query params:
+        fields: Campos a incluir separados por comas (sparse fieldset)
+
+    Returns:
+        JSON: {"data": {...}}
+    """
+    spec = get_catalog(catalog)
+    serializer = _serializer(spec)
+    row = CatalogApiService.get(spec, serializer, pk)
+    return Response('{"data":' + serializer.dumps(row) + "}", mimetype="application/json")
+
+
+@api_bp.route("/<catalog>", methods=["POST"])
+def create_item(catalog: str):
+    """
+    Crea un registro a partir de un cuerpo JSON con los campos editables.
+
+    Returns:
+        JSON: 201 con el registro completo (igual que GET) y la cabecera Location
+    """
+    spec = get_catalog(catalog)
+    row = CatalogApiService.create(spec, request.get_json())
+    response = _record_response(spec, row)
+    response.status_code = 201
+    response.headers["Location"] = url_for(
+        "api.get_item", catalog=catalog, pk=getattr(row, spec.pk)
+    )
+    return response
+
+
+@api_bp.route("/<catalog>/<int:pk>", methods=["PUT"])
+def update_item(catalog: str, pk: int):
+    """
+    Reemplaza los campos editables de un registro.
+
+    Returns:
+        JSON: {"data": {...}} con el registro completo, igual que GET
+    """
+    spec = get_catalog(catalog)
+    return _record_response(spec, CatalogApiService.update(spec, pk, request.get_json()))
+
+
+@api_bp.route("/<catalog>/<int:pk>", methods=["DELETE"])
+def delete_item(catalog: str, pk: int):
+    """
+    Elimina lógicamente un registro.
+
+    Returns:
+        204 sin contenido
+    """
+    CatalogApiService.delete(get_catalog(catalog), pk)
+    return "", 204
+
+
+@api_bp.errorhandler(AppException)
+def handle_app_exception(error: AppException):
+    """Errores de negocio como JSON en lugar de la página HTML de error."""
+    return jsonify(error.to_dict()), error.status_code
+
+
+@api_bp.errorhandler(HTTPException)
+def handle_http_exception(error: HTTPException):
+    """Errores HTTP (ej. cuerpo JSON inválido) como JSON."""
+    return jsonify(AppException(error.description, error.code).to_dict()), error.code
@@ -0,0 +1,154 @@
+"""
+Servicios de la API JSON de catálogos.
+
+Las escrituras se delegan a los servicios de cada catálogo (validaciones de
+negocio, versión y señal de cambio); las lecturas usan consultas proyectadas
+con solo las columnas del fieldset pedido.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+
+from app.catalogs.colors.services import ColorService
+from app.catalogs.registry import CatalogSpec
+from app.catalogs.roles.services import RoleService
+from app.catalogs.wood_types.services import WoodTypeService
+from app.exceptions import NotFoundError, ValidationError
+from app.extensions import db
+from app.utils.cache import get_catalog_cache
+from app.utils.conditional import Validator
+from app.utils.pagination import DEFAULT_PAGE_SIZE, Page, build_page, keyset_select
+from app.utils.serializers import ModelSerializer
+
+SERVICES = {"colors": ColorService, "roles": RoleService, "wood_types": WoodTypeService}
+
+
+class CatalogApiService:
+    """Operaciones de la API sobre cualquier catálogo del registro."""
+
+    @staticmethod
+    def get_page(
+        spec: CatalogSpec,
+        serializer: ModelSerializer,
+        after: Optional[int] = None,
+        before: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        active: bool = True,
+    ) -> Page:
+        """
+        Obtiene una página de registros con solo las columnas del serializador.
+
+        Las filas (`Row`, inmutables) se cachean en la caché del catálogo.
+
+        Args:
+            spec: Catálogo consultado
+            serializer: Serializador del fieldset pedido (incluye la llave primaria)
+            after: Devuelve los registros con ID mayor a este valor
+            before: Devuelve los registros con ID menor a este valor
+            limit: Tamaño de página
+            active: True para los registros activos, False para los eliminados
+
+        Returns:
+            Page: Página de filas ordenadas por ID
+        """
+        def load() -> Page:
+            stmt = keyset_select(
+                select(*serializer.columns).where(spec.model.active.is_(active)),
+                spec.pk_column, after, before, limit,
+            )
+            return build_page(db.session.execute(stmt).all(), spec.pk, after, before, limit)
+
+        key = ("api", serializer.fields, active, after, before, limit)
+        return get_catalog_cache(spec.name).get_or_load(key, load)
+
+    @staticmethod
+    def get_list_validator(spec: CatalogSpec) -> Validator:
+        """Validador (ETag) del catálogo, compartido con las vistas HTML."""
+        return SERVICES[spec.name].get_list_validator()
+
+    @staticmethod
+    def get(spec: CatalogSpec, serializer: ModelSerializer, pk: int) -> Any:
+        """
+        Obtiene un registro (activo o eliminado) por su ID.
+
+        Args:
+            spec: Catálogo consultado
+            serializer: Serializador del fieldset pedido
+            pk: ID del registro
+
+        Returns:
+            Row: Fila con las columnas del serializador
+
+        Raises:
+            NotFoundError: Si el registro no existe
+        """
+        row = db.session.execute(
+            select(*serializer.columns).where(spec.pk_column == pk)
+        ).first()
+        if row is None:
+            raise NotFoundError(f"No existe el registro con ID {pk} en {spec.label}")
+        return row
+
+    @staticmethod
+    def create(spec: CatalogSpec, payload: Any) -> Row:
+        """
+        Crea un registro a partir del cuerpo JSON.
+
+        Returns:
+            Row: Fila escrita con todas las columnas
+
+        Raises:
+            ValidationError: Si el cuerpo es inválido
+            ConflictError: Si el nombre ya existe
+        """
+        return SERVICES[spec.name].create(_clean_payload(spec, payload))
+
+    @staticmethod
+    def update(spec: CatalogSpec, pk: int, payload: Any) -> Row:
+        """
+        Reemplaza los campos editables de un registro.
+
+        Returns:
+            Row: Fila escrita con todas las columnas
+
+        Raises:
+            ValidationError: Si el cuerpo es inválido
+            NotFoundError: Si el registro no existe
+            ConflictError: Si el nombre ya existe
+        """
+        return SERVICES[spec.name].update(pk, _clean_payload(spec, payload))
+
+    @staticmethod
+    def delete(spec: CatalogSpec, pk: int) -> None:
+        """
+        Elimina lógicamente un registro.
+
+        Raises:
+            NotFoundError: Si el registro no existe
+        """
+        SERVICES[spec.name].delete(pk)
+
+
+def _clean_payload(spec: CatalogSpec, payload: Any) -> dict:
+    """Valida que el cuerpo sea un objeto con los campos editables del catálogo."""
+    if not isinstance(payload, dict):
+        raise ValidationError("El cuerpo debe ser un objeto JSON")
+
+    unknown = set(payload).difference(spec.fields)
+    if unknown:
+        raise ValidationError(
+            f"Campos no editables: {', '.join(sorted(unknown))}",
+            payload={"allowed": list(spec.fields)},
+        )
+
+    data = {}
+    for field in spec.fields:
+        value = payload.get(field)
+        if value is not None and not isinstance(value, str):
+            raise ValidationError(f"'{field}' debe ser texto")
+        if value and len(value.strip()) > spec.max_length(field):
+            raise ValidationError(f"'{field}' excede {spec.max_length(field)} caracteres")
+        data[field] = value
+    return data
@@ -0,0 +1,362 @@
+"""
+Aplicación ASGI: lecturas de la API con SQLAlchemy asíncrono y el resto en Flask.
+
+`GET`/`HEAD` de `/api/v1/<catalog>` y `/api/v1/<catalog>/<id>` se atienden en
+el event loop con sesiones asíncronas (`app/catalogs/async_services.py`), así
+un solo proceso sostiene muchas lecturas concurrentes sin ocupar un hilo por
+petición. Todas las demás rutas (páginas HTML, escrituras, /internal,
+/events, estáticos) se delegan a la aplicación Flask con `ThreadPoolWsgi`, en
+un pool de `WORKER_THREADS` hilos: cada petición (y cada stream SSE abierto)
+ocupa uno.
+
+Requiere un driver asíncrono (aiosqlite, aiomysql); se sirve con un servidor
+ASGI, ej. `uvicorn asgi:app`.
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl, urlencode
+
+from werkzeug.datastructures import Headers, MultiDict
+from werkzeug.http import parse_accept_header, parse_etags, quote_etag
+
+from app import create_app
+from app.api.documents import page_document, page_link_params
+from app.catalogs.async_services import AsyncCatalogService
+from app.catalogs.registry import CATALOGS, get_catalog
+from app.exceptions import AppException
+from app.utils.async_db import create_async_db
+from app.utils.compression import compress, negotiate_encoding
+from app.utils.pagination import parse_page_args
+from app.utils.serializers import get_serializer
+from config import Config
+
+API_PREFIX = "/api/v1"
+LIST_PATH = re.compile(rf"^{API_PREFIX}/(?P<catalog>[a-z_-]+)/?$")
+ITEM_PATH = re.compile(rf"^{API_PREFIX}/(?P<catalog>[a-z_-]+)/(?P<pk>\d+)$")
+
+
+# Mensajes de respuesta pendientes de enviar por petición delegada a Flask
+WSGI_QUEUE_SIZE = 8
+
+
+class ThreadPoolWsgi:
+    """
+    Adaptador WSGI -> ASGI que corre cada petición de Flask en un pool de hilos.
+
+    El hilo entrega los mensajes de la respuesta (encabezados y cada bloque
+    del cuerpo) por una cola acotada que el event loop envía al cliente: un
+    cliente lento frena al generador en lugar de acumular bloques. Si el
+    cliente se desconecta, el hilo deja de iterar y cierra la respuesta (ej.
+    un stream SSE libera su suscripción).
+
+    Attributes:
+        wsgi_application: Aplicación WSGI (Flask).
+        executor: Pool de hilos en el que corren las peticiones.
+    """
+
+    def __init__(self, wsgi_application, executor: ThreadPoolExecutor):
+        self.wsgi_application = wsgi_application
+        self.executor = executor
+
+    async def __call__(self, scope: dict, receive, send) -> None:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(WSGI_QUEUE_SIZE)
+        stop = threading.Event()
+
+        # Lo cierra el hilo al terminar: puede seguir leyéndolo tras una desconexión
+        body = SpooledTemporaryFile(max_size=65536)
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                body.close()
+                return
+            body.write(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        body.seek(0)
+
+        def emit(message: Optional[dict]) -> None:
+            put = queue.put(message)
+            try:
+                future = asyncio.run_coroutine_threadsafe(put, loop)
+            except RuntimeError:
+                put.close()
+                raise ConnectionAbortedError("El event loop terminó")
+            while True:
+                try:
+                    future.result(timeout=0.5)
+                    return
+                except concurrent.futures.TimeoutError:
+                    if stop.is_set():
+                        future.cancel()
+                        raise ConnectionAbortedError("El cliente se desconectó")
+
+        worker = loop.run_in_executor(
+            self.executor, self._run, _wsgi_environ(scope, body), emit, stop
+        )
+        watcher = asyncio.ensure_future(_wait_disconnect(receive, queue, stop))
+        try:
+            while (message := await queue.get()) is not None and not stop.is_set():
+                await send(message)
+            if not stop.is_set():
+                await worker
+        finally:
+            stop.set()
+            watcher.cancel()
+            # Si el cliente se fue, el hilo termina al producir su siguiente bloque
+            worker.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+    def _run(self, environ: dict, emit: Callable, stop: threading.Event) -> None:
+        start: dict = {}
+
+        def start_response(status: str, headers: list, exc_info=None):
+            if exc_info is not None and start.get("sent"):
+                raise exc_info[1].with_traceback(exc_info[2])
+            start["message"] = {
+                "type": "http.response.start",
+                "status": int(status.split(" ", 1)[0]),
+                "headers": [
+                    (name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in headers
+                ],
+            }
+            return write
+
+        def write(data: bytes) -> None:
+            if not start.get("sent"):
+                start["sent"] = True
+                emit(start["message"])
+            if data:
+                emit({"type": "http.response.body", "body": data, "more_body": True})
+
+        try:
+            result = self.wsgi_application(environ, start_response)
+            try:
+                for chunk in result:
+                    if stop.is_set():
+                        break
+                    write(chunk)
+            finally:
+                close = getattr(result, "close", None)
+                if close is not None:
+                    close()
+            if not stop.is_set():
+                write(b"")
+                emit({"type": "http.response.body"})
+        except ConnectionAbortedError:
+            pass
+        finally:
+            environ["wsgi.input"].close()
+            # Fin de la respuesta; si ya nadie lee la cola, se descarta
+            try:
+                emit(None)
+            except ConnectionAbortedError:
+                pass
+
+
+def _wsgi_environ(scope: dict, body) -> dict:
+    """Environ WSGI de una petición HTTP ASGI (PEP 3333)."""
+    root_path = scope.get("root_path", "")
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+    server = scope.get("server") or ("localhost", 80)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope["query_string"].decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": body,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    if scope.get("client"):
+        environ["REMOTE_ADDR"] = scope["client"][0]
+    for name, value in scope.get("headers", []):
+        name, value = name.decode("latin-1"), value.decode("latin-1")
+        if name == "content-type":
+            key = "CONTENT_TYPE"
+        elif name == "content-length":
+            key = "CONTENT_LENGTH"
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+        if key in environ:
+            # Encabezados repetidos: las cookies se separan con ';', el resto con ','
+            value = environ[key] + ("; " if key == "HTTP_COOKIE" else ",") + value
+        environ[key] = value
+    return environ
+
+
+async def _wait_disconnect(receive, queue: asyncio.Queue, stop: threading.Event) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+    stop.set()
+    if not queue.full():
+        # Despierta al envío si estaba esperando el siguiente bloque
+        queue.put_nowait(None)
+
+
+class CatalogReadApp:
+    """
+    Aplicación ASGI que atiende las lecturas de la API de forma asíncrona.
+
+    Attributes:
+        flask_app: Aplicación Flask que atiende el resto de las rutas.
+        engine: Motor asíncrono de SQLAlchemy.
+        services: Lecturas asíncronas por catálogo.
+    """
+
+    def __init__(self, flask_app, engine, sessions):
+        self.flask_app = flask_app
+        self.engine = engine
+        self.services = {
+            name: AsyncCatalogService(spec, sessions) for name, spec in CATALOGS.items()
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=flask_app.config["WORKER_THREADS"], thread_name_prefix="flask"
+        )
+        self._wsgi = ThreadPoolWsgi(flask_app, self._executor)
+
+    async def __call__(self, scope: dict, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            match = LIST_PATH.match(scope["path"])
+            if match:
+                await self._handle(scope, send, self._list, match["catalog"])
+                return
+            match = ITEM_PATH.match(scope["path"])
+            if match:
+                await self._handle(scope, send, self._item, match["catalog"], int(match["pk"]))
+                return
+
+        await self._wsgi(scope, receive, send)
+
+    async def _list(self, args: MultiDict, headers: Headers, catalog: str) -> tuple:
+        spec = get_catalog(catalog)
+        service = self.services[spec.name]
+        serializer = get_serializer(spec.model).subset(args.get("fields"), always=(spec.pk,))
+        after, before, limit = parse_page_args(args)
+        show_deleted = args.get("deleted", type=int) == 1
+
+        # La versión del catálogo es el validador: un 304 cuesta una sola consulta
+        version = await service.get_version()
+        etag = f"{spec.name}-{version}"
+        extra = {"ETag": quote_etag(etag, weak=True), "Cache-Control": "no-cache"}
+        if parse_etags(headers.get("If-None-Match")).contains_weak(etag):
+            return 304, None, extra
+
+        page = await service.get_page(
+            serializer, after, before, limit, active=not show_deleted, version=version
+        )
+        params = page_link_params(spec, serializer, page, show_deleted)
+        base = f"{API_PREFIX}/{catalog}"
+        next_url = (
+            f"{base}?{urlencode({'after': page.next_cursor, **params})}" if page.has_next else None
+        )
+        prev_url = (
+            f"{base}?{urlencode({'before': page.prev_cursor, **params})}" if page.has_prev else None
+        )
+        return 200, page_document(serializer, page, next_url, prev_url), extra
+
+    async def _item(self, args: MultiDict, headers: Headers, catalog: str, pk: int) -> tuple:
+        spec = get_catalog(catalog)
+        serializer = get_serializer(spec.model).subset(args.get("fields"), always=(spec.pk,))
+        row = await self.services[spec.name].get(serializer, pk)
+        return 200, '{"data":' + serializer.dumps(row) + "}", {}
+
+    async def _handle(self, scope: dict, send, handler, *params: Any) -> None:
+        headers = Headers(
+            [(key.decode("latin-1"), value.decode("latin-1")) for key, value in scope["headers"]]
+        )
+        args = MultiDict(
+            parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True)
+        )
+        try:
+            status, body, extra = await handler(args, headers, *params)
+        except AppException as e:
+            status, body, extra = e.status_code, json.dumps(e.to_dict()), {}
+        await self._send(scope, send, status, body, headers, extra)
+
+    async def _send(
+        self, scope: dict, send, status: int, body: Optional[str], headers: Headers, extra: dict
+    ) -> None:
+        config = self.flask_app.config
+        data = body.encode("utf-8") if body is not None else b""
+        response_headers = [(b"content-type", b"application/json")] if body is not None else []
+        response_headers += [
+            (key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in extra.items()
+        ]
+
+        if config["COMPRESS_ENABLED"] and body is not None:
+            response_headers.append((b"vary", b"Accept-Encoding"))
+            encoding = negotiate_encoding(parse_accept_header(headers.get("Accept-Encoding")))
+            if encoding and len(data) >= config["COMPRESS_MIN_SIZE"]:
+                data = compress(
+                    data, encoding, config["COMPRESS_LEVEL"], config["COMPRESS_BROTLI_QUALITY"]
+                )
+                response_headers.append((b"content-encoding", encoding.encode("latin-1")))
+
+        if status != 304:
+            response_headers.append((b"content-length", str(len(data)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": response_headers})
+        if scope["method"] == "HEAD":
+            data = b""
+        await send({"type": "http.response.body", "body": data})
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self._shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _shutdown(self) -> None:
+        # Los streams SSE terminan antes de que el servidor espere a sus hilos
+        broker = self.flask_app.extensions.get("events")
+        if broker is not None:
+            broker.close()
+        # La escritura pendiente de auditoría bloquea: se hace fuera del event loop
+        writer = self.flask_app.extensions.get("audit")
+        if writer is not None:
+            await asyncio.to_thread(writer.close)
+        self._executor.shutdown(wait=False)
+        await self.engine.dispose()
+
+
+def create_asgi_app(config_class=Config) -> CatalogReadApp:
+    """
+    Factory de la aplicación ASGI.
+
+    Crea la aplicación Flask con `create_app` y el motor asíncrono con la misma
+    configuración (`ASYNC_DATABASE_URI` o la URL síncrona con driver asíncrono).
+
+    Args:
+        config_class: Clase de configuración
+
+    Returns:
+        CatalogReadApp: Aplicación ASGI
+    """
+    flask_app = create_app(config_class)
+    engine, sessions = create_async_db(flask_app)
+    return CatalogReadApp(flask_app, engine, sessions)
@@ -0,0 +1,3 @@
+"""
+Módulo de catálogos del sistema (colores, roles, tipos de madera).
+"""
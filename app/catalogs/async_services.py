@@ -0,0 +1,124 @@
+"""
+Lecturas asíncronas de catálogos para el modo ASGI.
+
+Solo cubren lo que atiende `app/asgi.py`: la lista paginada y el registro
+individual de `/api/v1`. Equivalen a `CatalogApiService.get_page` y `get`
+pero sobre `sqlalchemy.ext.asyncio`, con los mismos modelos, las mismas
+columnas proyectadas y las mismas cachés de catálogo: una escritura hecha por
+Flask en el mismo proceso invalida también lo que leen estas rutas.
+"""
+
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.catalogs.registry import CatalogSpec
+from app.exceptions import NotFoundError
+from app.utils.cache import get_catalog_cache
+from app.utils.catalog_versions import fetch_version
+from app.utils.pagination import DEFAULT_PAGE_SIZE, Page, build_page, keyset_select
+from app.utils.serializers import ModelSerializer
+
+
+class AsyncCatalogService:
+    """
+    Lecturas de un catálogo con sesiones asíncronas.
+
+    Attributes:
+        spec: Catálogo consultado.
+        sessions: Fábrica de `AsyncSession`.
+    """
+
+    def __init__(self, spec: CatalogSpec, sessions: async_sessionmaker):
+        self.spec = spec
+        self.sessions = sessions
+        self._cache = get_catalog_cache(spec.name)
+
+    async def get_version(self) -> int:
+        """
+        Obtiene la versión compartida del catálogo.
+
+        Returns:
+            int: Versión del catálogo (también sirve como validador de las listas)
+        """
+        async with self.sessions() as session:
+            return await fetch_version(session, self.spec.name)
+
+    async def _cached(
+        self, version: int, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self._cache.maxsize <= 0:
+            return await loader()
+        found, value, generation = self._cache.lookup(key, version)
+        if found:
+            return value
+        value = await loader()
+        self._cache.store(key, value, generation)
+        return value
+
+    async def get_page(
+        self,
+        serializer: ModelSerializer,
+        after: Optional[int] = None,
+        before: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        active: bool = True,
+        version: Optional[int] = None,
+    ) -> Page:
+        """
+        Obtiene una página de registros con solo las columnas del serializador.
+
+        Comparte llaves de caché con `CatalogApiService.get_page`.
+
+        Args:
+            serializer: Serializador del fieldset pedido (incluye la llave primaria)
+            after: Devuelve los registros con ID mayor a este valor
+            before: Devuelve los registros con ID menor a este valor
+            limit: Tamaño de página
+            active: True para los registros activos, False para los eliminados
+            version: Versión ya consultada en la petición (se consulta si es None)
+
+        Returns:
+            Page: Página de filas ordenadas por ID
+        """
+        spec = self.spec
+
+        async with self.sessions() as session:
+            if version is None:
+                version = await fetch_version(session, spec.name)
+
+            async def load() -> Page:
+                stmt = keyset_select(
+                    select(*serializer.columns).where(spec.model.active.is_(active)),
+                    spec.pk_column, after, before, limit,
+                )
+                result = await session.execute(stmt)
+                return build_page(result.all(), spec.pk, after, before, limit)
+
+            key = ("api", serializer.fields, active, after, before, limit)
+            return await self._cached(version, key, load)
+
+    async def get(self, serializer: ModelSerializer, pk: int) -> Row:
+        """
+        Obtiene un registro (activo o eliminado) con las columnas del serializador.
+
+        Args:
+            serializer: Serializador del fieldset pedido
+            pk: ID del registro
+
+        Returns:
+            Row: Fila con las columnas del serializador
+
+        Raises:
+            NotFoundError: Si el registro no existe
+        """
+        async with self.sessions() as session:
+            result = await session.execute(
+                select(*serializer.columns).where(self.spec.pk_column == pk)
+            )
+            row = result.first()
+        if row is None:
+            raise NotFoundError(f"No existe el registro con ID {pk} en {self.spec.label}")
+        return row
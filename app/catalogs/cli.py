@@ -0,0 +1,93 @@
+"""
+Comandos de consola (`flask catalogs ...`) para administrar catálogos.
+"""
+
+import os
+from typing import Optional
+
+import click
+from flask.cli import AppGroup
+
+from app.catalogs.exporter import EXPORT_FORMATS, iter_export
+from app.catalogs.importer import DEFAULT_BATCH_SIZE, CatalogImporter, read_records
+from app.catalogs.registry import CATALOGS, get_catalog
+from app.catalogs.seeder import DEFAULT_SEED_BATCH_SIZE, seed_catalog
+
+catalogs_cli = AppGroup("catalogs", help="Herramientas de administración de catálogos.")
+
+
+def _detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+@catalogs_cli.command("import")
+@click.argument("catalog", type=click.Choice(sorted(CATALOGS)))
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "fmt", type=click.Choice(["csv", "jsonl"]), help="Formato (por extensión).")
+@click.option("--batch-size", default=DEFAULT_BATCH_SIZE, show_default=True, type=click.IntRange(1))
+@click.option("--report", "report_path", type=click.Path(dir_okay=False), help="Archivo del reporte.")
+@click.option("--dry-run", is_flag=True, help="Valida e informa sin guardar cambios.")
+def import_catalog(catalog, path, fmt, batch_size, report_path, dry_run):
+    """
+    Importa registros de un archivo CSV o JSONL a un catálogo.
+
+    El CSV debe tener encabezados con los campos del catálogo (name y, para
+    wood_types, description); en JSONL cada línea es un objeto con esos campos.
+    """
+    spec = get_catalog(catalog)
+    fmt = _detect_format(path, fmt)
+    report_path = report_path or f"{os.path.splitext(path)[0]}.report.csv"
+
+    with open(path, newline="", encoding="utf-8-sig") as stream, open(
+        report_path, "w", newline="", encoding="utf-8"
+    ) as report:
+        importer = CatalogImporter(spec, report, batch_size=batch_size, dry_run=dry_run)
+        result = importer.run(read_records(stream, fmt))
+
+    prefix = "[simulación] " if dry_run else ""
+    click.echo(
+        f"{prefix}{spec.label}: {result.read} leídos, {result.inserted} insertados, "
+        f"{result.duplicates} duplicados, {result.rejected} rechazados"
+    )
+    click.echo(f"Reporte: {report_path}")
+
+
+@catalogs_cli.command("export")
+@click.argument("catalog", type=click.Choice(sorted(CATALOGS)))
+@click.option("--format", "fmt", type=click.Choice(sorted(EXPORT_FORMATS)), default="csv", show_default=True)
+@click.option("--output", "output_path", default="-", show_default=True, help="Archivo destino ('-' = stdout).")
+def export_catalog(catalog, fmt, output_path):
+    """
+    Exporta los registros activos de un catálogo a CSV o JSONL en streaming.
+    """
+    spec = get_catalog(catalog)
+    with click.open_file(output_path, "w", encoding="utf-8") as output:
+        for chunk in iter_export(spec, fmt):
+            output.write(chunk)
+
+
+@catalogs_cli.command("seed")
+@click.argument("catalogs", nargs=-1, type=click.Choice(sorted(CATALOGS)))
+@click.option("--count", default=1000, show_default=True, type=click.IntRange(0), help="Registros por catálogo.")
+@click.option("--deleted-fraction", default=0.1, show_default=True, type=click.FloatRange(0, 1),
+              help="Fracción de registros eliminados lógicamente.")
+@click.option("--days", default=365, show_default=True, type=click.IntRange(1),
+              help="Días hacia atrás en los que se reparten created_at/updated_at.")
+@click.option("--seed", default=42, show_default=True, type=int, help="Semilla de generación.")
+@click.option("--batch-size", default=DEFAULT_SEED_BATCH_SIZE, show_default=True, type=click.IntRange(1))
+def seed_catalogs(catalogs, count, deleted_fraction, days, seed, batch_size):
+    """
+    Genera registros sintéticos en los catálogos (todos si no se indica ninguno).
+
+    Los nombres son únicos, en español y con acentos; la misma semilla
+    produce los mismos registros. Ejecutarlo de nuevo agrega registros sin
+    repetir nombres.
+    """
+    for catalog in catalogs or sorted(CATALOGS):
+        spec = get_catalog(catalog)
+        inserted = seed_catalog(
+            spec, count, seed=seed, deleted_fraction=deleted_fraction, days=days, batch_size=batch_size
+        )
+        click.echo(f"{spec.label}: {inserted} registros generados")
@@ -4,22 +4,75 @@ Rutas/Endpoints para el módulo de colores.
 
 from flask import flash, redirect, render_template, request, url_for
 
+from app.catalogs.exporter import export_response
+from app.catalogs.registry import get_catalog
+from app.catalogs.suggest import suggest_response
 from app.exceptions import ConflictError, NotFoundError, ValidationError
+from app.utils.conditional import conditional_get
+from app.utils.fragments import render_fragment
+from app.utils.pagination import parse_page_args
 from . import colors_bp
 from .forms import ColorForm
 from .services import ColorService
 
 
 @colors_bp.route("/", methods=["GET"])
+@conditional_get(ColorService.get_list_validator)
 def list_colors():
     """
-    Muestra la lista de colores del catálogo.
+    Muestra la lista paginada de colores del catálogo.
+
+    Query params:
+        after: ID a partir del cual se muestra la página siguiente
+        before: ID a partir del cual se muestra la página anterior
+        limit: Cantidad de registros por página
+        deleted: 1 para listar los registros eliminados
 
     Returns:
         HTML: Página con la lista de colores
     """
-    colors = ColorService.get_all()
-    return render_template("colors/list.html", colors=colors)
+    after, before, limit = parse_page_args(request.args)
+    show_deleted = request.args.get("deleted", type=int) == 1
+    page = ColorService.get_page(after=after, before=before, limit=limit, active=not show_deleted)
+    # Las filas se cachean por versión y página; CSRF y flash se renderizan siempre
+    rows_html = render_fragment(
+        "colors", (show_deleted, after, before, limit), "colors/_rows.html",
+        colors=page.items, show_deleted=show_deleted,
+    )
+    return render_template(
+        "colors/list.html", colors=page.items, page=page, show_deleted=show_deleted, rows_html=rows_html
+    )
+
+
+@colors_bp.route("/export", methods=["GET"])
+def export_colors():
+    """
+    Exporta los colores activos en streaming.
+
+    Query params:
+        format: Formato de salida ('csv' por defecto o 'jsonl')
+
+    Returns:
+        Response: Archivo CSV/JSONL generado en streaming
+    """
+    return export_response(get_catalog("colors"), request.args.get("format", "csv"))
+
+
+@colors_bp.route("/suggest", methods=["GET"])
+def suggest_colors():
+    """
+    Sugiere colores activos cuyo nombre empieza con el texto capturado.
+
+    No consulta la base de datos: busca en el índice en memoria del catálogo.
+
+    Query params:
+        q: Texto capturado (sin distinguir mayúsculas ni acentos)
+        limit: Máximo de sugerencias (10 por defecto)
+
+    Returns:
+        JSON: Lista de sugerencias con ID y nombre
+    """
+    return suggest_response(get_catalog("colors"), request.args)
 
 
 @colors_bp.route("/create", methods=["GET", "POST"])
@@ -49,6 +102,7 @@ def create_color():
 
 
 @colors_bp.route("/<int:id_color>/edit", methods=["GET", "POST"])
+@conditional_get(ColorService.get_row_validator)
 def edit_color(id_color: int):
     """
     Muestra el formulario pre-poblado y actualiza un color existente.
@@ -60,24 +114,28 @@ def edit_color(id_color: int):
         GET - HTML: Página con el formulario de edición de color.
         POST - Redirect: Redirige al formulario con mensaje flash
     """
-    try:
-        color = ColorService.get_by_id(id_color)
-    except NotFoundError as e:
-        flash(e.message, "error")
-        return redirect(url_for("colors.list_colors"))
-
     form = ColorForm()
 
     if form.validate_on_submit():
+        # El UPDATE detecta por sí solo si el color no existe: no se consulta antes
         data = {"name": form.name.data}
         try:
             ColorService.update(id_color, data)
             flash("Color actualizado exitosamente", "success")
             return redirect(url_for("colors.list_colors"))
+        except NotFoundError as e:
+            flash(e.message, "error")
+            return redirect(url_for("colors.list_colors"))
         except (ConflictError, ValidationError) as e:
             flash(e.message, "error")
 
-    elif request.method == "GET":
+    try:
+        color = ColorService.get_by_id(id_color)
+    except NotFoundError as e:
+        flash(e.message, "error")
+        return redirect(url_for("colors.list_colors"))
+
+    if request.method == "GET":
         # Pre-poblar el formulario en peticiones GET
         form.name.data = color.name
 
@@ -104,3 +162,43 @@ def delete_color(id_color: int):
         flash(e.message, "error")
 
     return redirect(url_for("colors.list_colors"))
+
+
+@colors_bp.route("/bulk-delete", methods=["POST"])
+def bulk_delete_colors():
+    """
+    Ejecuta la eliminación lógica de los colores seleccionados.
+
+    POST: Marca como inactivos los colores seleccionados (campo `ids`) y redirige.
+
+    Returns:
+        Redirect: Redirige a la lista de colores con mensaje flash
+    """
+    ids = request.form.getlist("ids", type=int)
+    if not ids:
+        flash("Selecciona al menos un color", "error")
+    else:
+        affected = ColorService.bulk_delete(ids)
+        flash(f"{affected} colores eliminados", "success")
+
+    return redirect(url_for("colors.list_colors"))
+
+
+@colors_bp.route("/bulk-restore", methods=["POST"])
+def bulk_restore_colors():
+    """
+    Restaura los colores eliminados seleccionados.
+
+    POST: Marca como activos los colores seleccionados (campo `ids`) y redirige.
+
+    Returns:
+        Redirect: Redirige a la lista de colores eliminados con mensaje flash
+    """
+    ids = request.form.getlist("ids", type=int)
+    if not ids:
+        flash("Selecciona al menos un color", "error")
+    else:
+        affected = ColorService.bulk_restore(ids)
+        flash(f"{affected} colores restaurados", "success")
+
+    return redirect(url_for("colors.list_colors", deleted=1))
@@ -2,37 +2,122 @@
 Servicios de lógica de negocio para colores.
 """
 
-from sqlalchemy import func
+from typing import Iterable, Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
 
 from app.exceptions import ConflictError, ValidationError, NotFoundError
 from app.extensions import db
 from app.models.color import Color
+from app.signals import catalog_changed
+from app.utils.audit import current_actor
+from app.utils.bulk import restore_many, soft_delete_many
+from app.utils.cache import get_catalog_cache
+from app.utils.catalog_versions import bump_version, get_version
+from app.utils.conditional import Validator, catalog_validator, row_validator
+from app.utils.pagination import DEFAULT_PAGE_SIZE, Page, build_page, keyset_select
+from app.utils.text import normalize_name
+from app.utils.writes import execute_returning
+
+CATALOG = "colors"
+_cache = get_catalog_cache(CATALOG)
+
+# Columnas que muestran las listas; se leen como filas, sin instancias ORM
+LIST_COLUMNS = (Color.id_color, Color.name, Color.active, Color.created_at)
 
 
 class ColorService:
     """Servicio para operaciones de negocio relacionadas con colores."""
 
     @staticmethod
-    def get_all() -> list[Color]:
+    def get_all() -> list[Row]:
         """
         Obtiene todos los colores activos.
 
         Returns:
-            list[Color]: Lista de objetos Color activos
+            list[Row]: Filas con las columnas de `LIST_COLUMNS`
+        """
+        return _cache.get_or_load(
+            "all",
+            lambda: db.session.execute(
+                select(*LIST_COLUMNS).filter_by(active=True).order_by(Color.id_color)
+            ).all(),
+        )
+
+    @staticmethod
+    def get_page(
+        after: Optional[int] = None,
+        before: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        active: bool = True,
+    ) -> Page:
+        """
+        Obtiene una página de colores usando paginación keyset.
+
+        El resultado se sirve desde la caché del catálogo hasta la siguiente escritura.
+
+        Args:
+            after: Devuelve los registros con ID mayor a este valor
+            before: Devuelve los registros con ID menor a este valor
+            limit: Tamaño de página
+            active: True para los registros activos, False para los eliminados
+
+        Returns:
+            Page: Página de filas (`LIST_COLUMNS`) ordenadas por ID
+        """
+        def load() -> Page:
+            stmt = keyset_select(
+                select(*LIST_COLUMNS).filter_by(active=active), Color.id_color, after, before, limit
+            )
+            rows = db.session.execute(stmt).all()
+            return build_page(rows, "id_color", after, before, limit)
+
+        return _cache.get_or_load(("page", active, after, before, limit), load)
+
+    @staticmethod
+    def get_list_validator() -> Validator:
+        """
+        Obtiene el validador (ETag) de la lista de colores.
+
+        Se deriva de la versión del catálogo, `max(updated_at)`, `max(deleted_at)`
+        y el número de registros activos, y se cachea hasta la siguiente escritura.
+
+        Returns:
+            Validator: Validador del catálogo
         """
-        return Color.query.filter_by(active=True).all()
+        return _cache.get_or_load(
+            "validator", lambda: catalog_validator(Color, get_version(CATALOG))
+        )
 
     @staticmethod
-    def create(data: dict) -> dict:
+    def get_row_validator(id_color: int) -> Optional[Validator]:
+        """
+        Obtiene el validador (ETag) de un color.
+
+        Args:
+            id_color: Identificador del registro
+
+        Returns:
+            Optional[Validator]: Validador del registro o None si no existe
+        """
+        color = db.session.get(Color, id_color)
+        return row_validator(color, "id_color") if color else None
+
+    @staticmethod
+    def create(data: dict) -> Row:
         """
         Crea un nuevo color en el catálogo.
 
+        No se consulta antes de insertar: un nombre duplicado se detecta por la
+        restricción única de `name_normalized` y se reporta como conflicto.
+
         Args:
             data: Diccionario con los datos del color (name requerido)
 
         Returns:
-            dict: Color creado serializado
+            Row: Fila escrita con todas las columnas
 
         Raises:
             ValidationError: Si el nombre está vacío o no se proporciona
@@ -44,21 +129,29 @@ class ColorService:
             raise ValidationError("El nombre del color es requerido")
 
         name = name.strip()
-
-        existing = Color.query.filter(func.lower(Color.name) == name.lower()).first()
-        if existing:
-            raise ConflictError(f"Ya existe un color con el nombre '{name}'")
-
-        color = Color(name=name)
-        db.session.add(color)
-
+        values = {
+            "name": name,
+            "active": True,
+            "created_by": current_actor(),
+        }
+
+        # La unicidad la garantiza el índice de name_normalized: un solo INSERT;
+        # las fechas las asigna la base de datos y se leen de la fila escrita
         try:
+            row = execute_returning(
+                insert(Color).values(name_normalized=normalize_name(name), **values),
+                Color,
+                Color.id_color,
+            )
+            version = bump_version(CATALOG)
             db.session.commit()
         except IntegrityError:
             db.session.rollback()
             raise ConflictError(f"Ya existe un color con el nombre '{name}'")
 
-        return color.to_dict()
+        id_color = row.id_color
+        catalog_changed.send(CATALOG, op="create", id=id_color, version=version, record=row)
+        return row
 
     @staticmethod
     def get_by_id(id_color: int) -> Color:
@@ -81,49 +174,56 @@ class ColorService:
         return color
 
     @staticmethod
-    def update(id_color: int, data: dict) -> dict:
+    def update(id_color: int, data: dict) -> Row:
         """
         Actualiza un color existente.
 
+        Se ejecuta un solo UPDATE por llave primaria; si no afecta filas el
+        color no existe.
+
         Args:
             id_color: Identificador del color a actualizar
             data: Diccionario con los datos actualizados del color (name requerido)
 
         Returns:
-            dict: Color actualizado serializado
+            Row: Fila escrita con todas las columnas
 
         Raises:
             NotFoundError: Si no se encuentra un color con el ID proporcionado
             ValidationError: Si el nombre está vacío o no se proporciona
             ConflictError: Si ya existe otro color con el mismo nombre
         """
-        color = ColorService.get_by_id(id_color)
-
         name = data.get("name")
         if not name or not name.strip():
             raise ValidationError("El nombre del color es requerido")
 
         name = name.strip()
 
-        existing = (
-                db.session.query(Color.id_color)
-                .filter(func.lower(Color.name) == name.lower(), Color.id_color != id_color)
-                .first()
-                is not None
-        )
-
-        if existing:
-            raise ConflictError(f"Ya existe otro color con el nombre '{name}'")
-
-        color.name = name
-
         try:
+            row = execute_returning(
+                update(Color)
+                .where(Color.id_color == id_color)
+                .values(
+                    name=name,
+                    name_normalized=normalize_name(name),
+                    updated_at=func.current_timestamp(),
+                    updated_by=current_actor(),
+                ),
+                Color,
+                Color.id_color,
+                id_color,
+            )
+            if row is None:
+                db.session.rollback()
+                raise NotFoundError(f"No se encontró un color con ID {id_color}")
+            version = bump_version(CATALOG)
             db.session.commit()
         except IntegrityError:
             db.session.rollback()
             raise ConflictError(f"Ya existe otro color con el nombre '{name}'")
 
-        return color.to_dict()
+        catalog_changed.send(CATALOG, op="update", id=id_color, version=version, record=row)
+        return row
 
     @staticmethod
     def delete(id_color: int) -> None:
@@ -136,9 +236,59 @@ class ColorService:
             NotFoundError: Si no se encuentra un color con el ID
 
         """
-        color = ColorService.get_by_id(id_color)
+        now = func.current_timestamp()
+
+        result = db.session.execute(
+            update(Color)
+            .where(Color.id_color == id_color)
+            .values(active=False, deleted_at=now, deleted_by=current_actor(), updated_at=now)
+        )
+        if result.rowcount == 0:
+            db.session.rollback()
+            raise NotFoundError(f"No se encontró un color con ID {id_color}")
+
+        version = bump_version(CATALOG)
+        db.session.commit()
+        catalog_changed.send(CATALOG, op="delete", id=id_color, version=version)
+
+    @staticmethod
+    def bulk_delete(ids: Iterable[int]) -> int:
+        """
+        Elimina lógicamente varios colores en una sola transacción.
 
-        color.active = False
-        color.deleted_at = func.current_timestamp()
+        Se emite un `UPDATE ... WHERE id IN (...)` por lote de IDs; los IDs
+        inexistentes o ya eliminados se ignoran.
+
+        Args:
+            ids: IDs de los colores a eliminar
+
+        Returns:
+            int: Número de colores eliminados
+        """
+        affected = soft_delete_many(Color, Color.id_color, ids, deleted_by=current_actor())
+        return ColorService._commit_bulk(affected, "delete")
+
+    @staticmethod
+    def bulk_restore(ids: Iterable[int]) -> int:
+        """
+        Restaura varios colores eliminados en una sola transacción.
+
+        Args:
+            ids: IDs de los colores a restaurar
+
+        Returns:
+            int: Número de colores restaurados
+        """
+        affected = restore_many(Color, Color.id_color, ids, updated_by=current_actor())
+        return ColorService._commit_bulk(affected, "restore")
+
+    @staticmethod
+    def _commit_bulk(affected: int, op: str) -> int:
+        if not affected:
+            db.session.rollback()
+            return 0
 
+        version = bump_version(CATALOG)
         db.session.commit()
+        catalog_changed.send(CATALOG, op=op, count=affected, version=version)
+        return affected
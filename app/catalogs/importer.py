@@ -0,0 +1,216 @@
+"""
+Importación masiva de catálogos desde archivos CSV o JSONL.
+
+El archivo se lee en streaming y los registros se insertan por lotes con
+`executemany`, por lo que la memoria usada depende del tamaño del lote y no
+del tamaño del archivo. Los duplicados y registros inválidos no detienen la
+importación: se escriben en un reporte CSV.
+"""
+
+import csv
+import json
+from typing import IO, Iterator, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from app.catalogs.registry import CatalogSpec
+from app.extensions import db
+from app.signals import catalog_changed
+from app.utils.catalog_versions import bump_version
+from app.utils.text import normalize_name
+
+DEFAULT_BATCH_SIZE = 500
+REPORT_FIELDS = ("line", "name", "status", "reason")
+
+
+class ImportResult:
+    """
+    Resumen de una importación.
+
+    Attributes:
+        read: Registros leídos del archivo.
+        inserted: Registros insertados (o que se insertarían en modo simulación).
+        duplicates: Registros omitidos por nombre duplicado.
+        rejected: Registros omitidos por datos inválidos.
+    """
+
+    __slots__ = ("read", "inserted", "duplicates", "rejected")
+
+    def __init__(self):
+        self.read = 0
+        self.inserted = 0
+        self.duplicates = 0
+        self.rejected = 0
+
+
+def read_records(stream: IO[str], fmt: str) -> Iterator[tuple[int, Optional[dict], str]]:
+    """
+    Lee los registros de un archivo uno a uno.
+
+    Args:
+        stream: Archivo de texto abierto
+        fmt: Formato del archivo ('csv' o 'jsonl')
+
+    Yields:
+        tuple: (número de línea, registro o None si es ilegible, motivo del error)
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record, ""
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"JSON inválido: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Se esperaba un objeto JSON"
+            continue
+        yield line_number, record, ""
+
+
+class CatalogImporter:
+    """
+    Importador por lotes de un catálogo.
+
+    Cada lote se ejecuta dentro de un SAVEPOINT: sin modo simulación se
+    confirma al terminar el lote; en modo simulación todo se revierte al final.
+    """
+
+    def __init__(
+        self,
+        spec: CatalogSpec,
+        report: IO[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        dry_run: bool = False,
+    ):
+        self.spec = spec
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.result = ImportResult()
+        self._report = csv.writer(report)
+        self._report.writerow(REPORT_FIELDS)
+        self._lengths = {field: spec.max_length(field) for field in spec.fields}
+        self._version: Optional[int] = None
+
+    def run(self, records: Iterator[tuple[int, Optional[dict], str]]) -> ImportResult:
+        """
+        Importa todos los registros.
+
+        Args:
+            records: Registros producidos por `read_records`
+
+        Returns:
+            ImportResult: Resumen de la importación
+        """
+        batch: dict[str, tuple[int, dict]] = {}
+        try:
+            for line, record, error in records:
+                self.result.read += 1
+                row = self._validate(line, record, error)
+                if row is None:
+                    continue
+
+                key = row["name_normalized"]
+                if key in batch:
+                    self._reject(line, row["name"], "duplicate", f"Repetido en la línea {batch[key][0]}")
+                    continue
+                batch[key] = (line, row)
+
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+                    batch = {}
+
+            if batch:
+                self._flush(batch)
+        except Exception:
+            db.session.rollback()
+            raise
+
+        if self.dry_run:
+            db.session.rollback()
+
+        if self.result.inserted and not self.dry_run:
+            catalog_changed.send(
+                self.spec.name, op="import", count=self.result.inserted, version=self._version
+            )
+        return self.result
+
+    def _validate(self, line: int, record: Optional[dict], error: str) -> Optional[dict]:
+        if record is None:
+            self._reject(line, "", "rejected", error)
+            return None
+
+        for field in self.spec.fields:
+            value = record.get(field)
+            if value is not None and not isinstance(value, str):
+                name = str(record.get("name") or "")
+                self._reject(line, name, "rejected", f"'{field}' debe ser texto")
+                return None
+
+        name = (record.get("name") or "").strip()
+        if not name:
+            self._reject(line, name, "rejected", "El nombre es requerido")
+            return None
+
+        row = {"name": name, "name_normalized": normalize_name(name)}
+        for field in self.spec.fields:
+            if field != "name":
+                row[field] = (record.get(field) or "").strip() or None
+
+        for field, max_length in self._lengths.items():
+            if row[field] and len(row[field]) > max_length:
+                self._reject(line, name, "rejected", f"'{field}' excede {max_length} caracteres")
+                return None
+        return row
+
+    def _flush(self, batch: dict[str, tuple[int, dict]]) -> None:
+        model = self.spec.model
+
+        # Nombres que ya existen en la base de datos (incluye lotes previos)
+        existing = set(
+            db.session.execute(
+                select(model.name_normalized).where(model.name_normalized.in_(batch.keys()))
+            ).scalars()
+        )
+        for key in sorted(existing, key=lambda k: batch[k][0]):
+            line, row = batch.pop(key)
+            self._reject(line, row["name"], "duplicate", "Ya existe en el catálogo")
+
+        if not batch:
+            return
+
+        rows = [row for _, row in batch.values()]
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(model), rows)
+            self.result.inserted += len(rows)
+        except IntegrityError:
+            # Otro proceso insertó alguno de los nombres: se reintenta fila por fila
+            self._insert_one_by_one(batch)
+
+        if not self.dry_run:
+            self._version = bump_version(self.spec.name)
+            db.session.commit()
+
+    def _insert_one_by_one(self, batch: dict[str, tuple[int, dict]]) -> None:
+        for line, row in batch.values():
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(insert(self.spec.model), [row])
+                self.result.inserted += 1
+            except IntegrityError:
+                self._reject(line, row["name"], "duplicate", "Ya existe en el catálogo")
+
+    def _reject(self, line: int, name: str, status: str, reason: str) -> None:
+        if status == "duplicate":
+            self.result.duplicates += 1
+        else:
+            self.result.rejected += 1
+        self._report.writerow((line, name, status, reason))
@@ -0,0 +1,74 @@
+"""
+Registro de catálogos.
+
+Describe cada catálogo (modelo, llave primaria y campos editables) para las
+herramientas que operan sobre todos ellos de forma genérica (CLI, exportación).
+"""
+
+from typing import Any
+
+from app.exceptions import NotFoundError
+from app.models.color import Color
+from app.models.role import Role
+from app.models.wood_type import WoodType
+
+
+class CatalogSpec:
+    """
+    Descripción de un catálogo.
+
+    Attributes:
+        name: Nombre del catálogo (igual al usado en `catalog_versions`).
+        model: Modelo SQLAlchemy del catálogo.
+        pk: Nombre de la columna llave primaria.
+        fields: Campos que se capturan al crear un registro.
+        label: Nombre legible en plural.
+    """
+
+    __slots__ = ("name", "model", "pk", "fields", "label")
+
+    def __init__(self, name: str, model: Any, pk: str, fields: tuple, label: str):
+        self.name = name
+        self.model = model
+        self.pk = pk
+        self.fields = fields
+        self.label = label
+
+    @property
+    def pk_column(self) -> Any:
+        """Columna llave primaria del modelo."""
+        return getattr(self.model, self.pk)
+
+    def max_length(self, field: str) -> int:
+        """Longitud máxima de un campo de texto."""
+        return self.model.__table__.c[field].type.length
+
+
+CATALOGS = {
+    "colors": CatalogSpec("colors", Color, "id_color", ("name",), "colores"),
+    "roles": CatalogSpec("roles", Role, "id_role", ("name",), "roles"),
+    "wood_types": CatalogSpec(
+        "wood_types", WoodType, "id_wood_type", ("name", "description"), "tipos de madera"
+    ),
+}
+
+
+def get_catalog(name: str) -> CatalogSpec:
+    """
+    Obtiene la descripción de un catálogo por nombre.
+
+    Acepta también la forma usada en las URLs (ej. 'wood-types').
+
+    Args:
+        name: Nombre del catálogo
+
+    Returns:
+        CatalogSpec: Descripción del catálogo
+
+    Raises:
+        NotFoundError: Si el catálogo no existe
+    """
+    spec = CATALOGS.get(name.replace("-", "_"))
+    if spec is None:
+        raise NotFoundError(f"No existe el catálogo '{name}'")
+    return spec
@@ -7,19 +7,72 @@ from flask import flash, redirect, render_template, request, url_for
 from . import roles_bp
 from .forms import RoleForm
 from .services import RoleService
+from app.catalogs.exporter import export_response
+from app.catalogs.registry import get_catalog
+from app.catalogs.suggest import suggest_response
 from app.exceptions import ConflictError, NotFoundError, ValidationError
+from app.utils.conditional import conditional_get
+from app.utils.fragments import render_fragment
+from app.utils.pagination import parse_page_args
 
 
 @roles_bp.route("/", methods=["GET"])
+@conditional_get(RoleService.get_list_validator)
 def list_roles():
     """
-    Muestra la lista de roles del catálogo.
+    Muestra la lista paginada de roles del catálogo.
+
+    Query params:
+        after: ID a partir del cual se muestra la página siguiente
+        before: ID a partir del cual se muestra la página anterior
+        limit: Cantidad de registros por página
+        deleted: 1 para listar los registros eliminados
 
     Returns:
         HTML: Página con la lista de roles
     """
-    roles = RoleService.get_all()
-    return render_template("roles/list.html", roles=roles)
+    after, before, limit = parse_page_args(request.args)
+    show_deleted = request.args.get("deleted", type=int) == 1
+    page = RoleService.get_page(after=after, before=before, limit=limit, active=not show_deleted)
+    # Las filas se cachean por versión y página; CSRF y flash se renderizan siempre
+    rows_html = render_fragment(
+        "roles", (show_deleted, after, before, limit), "roles/_rows.html",
+        roles=page.items, show_deleted=show_deleted,
+    )
+    return render_template(
+        "roles/list.html", roles=page.items, page=page, show_deleted=show_deleted, rows_html=rows_html
+    )
+
+
+@roles_bp.route("/export", methods=["GET"])
+def export_roles():
+    """
+    Exporta los roles activos en streaming.
+
+    Query params:
+        format: Formato de salida ('csv' por defecto o 'jsonl')
+
+    Returns:
+        Response: Archivo CSV/JSONL generado en streaming
+    """
+    return export_response(get_catalog("roles"), request.args.get("format", "csv"))
+
+
+@roles_bp.route("/suggest", methods=["GET"])
+def suggest_roles():
+    """
+    Sugiere roles activos cuyo nombre empieza con el texto capturado.
+
+    No consulta la base de datos: busca en el índice en memoria del catálogo.
+
+    Query params:
+        q: Texto capturado (sin distinguir mayúsculas ni acentos)
+        limit: Máximo de sugerencias (10 por defecto)
+
+    Returns:
+        JSON: Lista de sugerencias con ID y nombre
+    """
+    return suggest_response(get_catalog("roles"), request.args)
 
 
 @roles_bp.route("/create", methods=["GET", "POST"])
@@ -49,6 +102,7 @@ def create_role():
 
 
 @roles_bp.route("/<int:id_role>/edit", methods=["GET", "POST"])
+@conditional_get(RoleService.get_row_validator)
 def edit_role(id_role: int):
     """
     Muestra el formulario pre-poblado y actualiza un rol existente.
@@ -60,24 +114,28 @@ def edit_role(id_role: int):
         GET - HTML: Página con el formulario de edición de rol.
         POST - Redirect: Redirige a la lista o al formulario con mensaje flash.
     """
-    try:
-        role = RoleService.get_by_id(id_role)
-    except NotFoundError as e:
-        flash(e.message, "error")
-        return redirect(url_for("roles.list_roles"))
-
     form = RoleForm()
 
     if form.validate_on_submit():
+        # El UPDATE detecta por sí solo si el rol no existe: no se consulta antes
         data = {"name": form.name.data}
         try:
             RoleService.update(id_role, data)
             flash("Rol actualizado exitosamente", "success")
             return redirect(url_for("roles.list_roles"))
+        except NotFoundError as e:
+            flash(e.message, "error")
+            return redirect(url_for("roles.list_roles"))
         except (ConflictError, ValidationError) as e:
             flash(e.message, "error")
-            
-    elif request.method == "GET":
+
+    try:
+        role = RoleService.get_by_id(id_role)
+    except NotFoundError as e:
+        flash(e.message, "error")
+        return redirect(url_for("roles.list_roles"))
+
+    if request.method == "GET":
         # Pre-poblar el formulario en peticiones GET
         form.name.data = role.name
 
@@ -101,4 +159,44 @@ def delete_role(id_role: int):
         flash(e.message, "error")
     
     # Redirección al listado (Patrón PRG)
-    return redirect(url_for("roles.list_roles"))
\ No newline at end of file
+    return redirect(url_for("roles.list_roles"))
+
+
+@roles_bp.route("/bulk-delete", methods=["POST"])
+def bulk_delete_roles():
+    """
+    Ejecuta la eliminación lógica de los roles seleccionados.
+
+    POST: Marca como inactivos los roles seleccionados (campo `ids`) y redirige.
+
+    Returns:
+        Redirect: Redirige a la lista de roles con mensaje flash
+    """
+    ids = request.form.getlist("ids", type=int)
+    if not ids:
+        flash("Selecciona al menos un rol", "error")
+    else:
+        affected = RoleService.bulk_delete(ids)
+        flash(f"{affected} roles eliminados", "success")
+
+    return redirect(url_for("roles.list_roles"))
+
+
+@roles_bp.route("/bulk-restore", methods=["POST"])
+def bulk_restore_roles():
+    """
+    Restaura los roles eliminados seleccionados.
+
+    POST: Marca como activos los roles seleccionados (campo `ids`) y redirige.
+
+    Returns:
+        Redirect: Redirige a la lista de roles eliminados con mensaje flash
+    """
+    ids = request.form.getlist("ids", type=int)
+    if not ids:
+        flash("Selecciona al menos un rol", "error")
+    else:
+        affected = RoleService.bulk_restore(ids)
+        flash(f"{affected} roles restaurados", "success")
+
+    return redirect(url_for("roles.list_roles", deleted=1))
@@ -2,37 +2,122 @@
 Servicios de lógica de negocio para roles.
 """
 
+from typing import Iterable, Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.sql import func
 
 from app.extensions import db
 from app.models.role import Role
 from app.exceptions import ConflictError, ValidationError, NotFoundError
+from app.signals import catalog_changed
+from app.utils.audit import current_actor
+from app.utils.bulk import restore_many, soft_delete_many
+from app.utils.cache import get_catalog_cache
+from app.utils.catalog_versions import bump_version, get_version
+from app.utils.conditional import Validator, catalog_validator, row_validator
+from app.utils.pagination import DEFAULT_PAGE_SIZE, Page, build_page, keyset_select
+from app.utils.text import normalize_name
+from app.utils.writes import execute_returning
+
+CATALOG = "roles"
+_cache = get_catalog_cache(CATALOG)
+
+# Columnas que muestran las listas; se leen como filas, sin instancias ORM
+LIST_COLUMNS = (Role.id_role, Role.name, Role.active, Role.created_at)
 
 
 class RoleService:
     """Servicio para operaciones de negocio relacionadas con roles."""
 
     @staticmethod
-    def get_all() -> list[Role]:
+    def get_all() -> list[Row]:
         """
         Obtiene todos los roles activos.
 
         Returns:
-            list[Role]: Lista de objetos Role activos
+            list[Row]: Filas con las columnas de `LIST_COLUMNS`
+        """
+        return _cache.get_or_load(
+            "all",
+            lambda: db.session.execute(
+                select(*LIST_COLUMNS).filter_by(active=True).order_by(Role.id_role)
+            ).all(),
+        )
+
+    @staticmethod
+    def get_page(
+        after: Optional[int] = None,
+        before: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        active: bool = True,
+    ) -> Page:
+        """
+        Obtiene una página de roles usando paginación keyset.
+
+        El resultado se sirve desde la caché del catálogo hasta la siguiente escritura.
+
+        Args:
+            after: Devuelve los registros con ID mayor a este valor
+            before: Devuelve los registros con ID menor a este valor
+            limit: Tamaño de página
+            active: True para los registros activos, False para los eliminados
+
+        Returns:
+            Page: Página de filas (`LIST_COLUMNS`) ordenadas por ID
+        """
+        def load() -> Page:
+            stmt = keyset_select(
+                select(*LIST_COLUMNS).filter_by(active=active), Role.id_role, after, before, limit
+            )
+            rows = db.session.execute(stmt).all()
+            return build_page(rows, "id_role", after, before, limit)
+
+        return _cache.get_or_load(("page", active, after, before, limit), load)
+
+    @staticmethod
+    def get_list_validator() -> Validator:
         """
-        return Role.query.filter_by(active=True).all()
+        Obtiene el validador (ETag) de la lista de roles.
+
+        Se deriva de la versión del catálogo, `max(updated_at)`, `max(deleted_at)`
+        y el número de registros activos, y se cachea hasta la siguiente escritura.
+
+        Returns:
+            Validator: Validador del catálogo
+        """
+        return _cache.get_or_load(
+            "validator", lambda: catalog_validator(Role, get_version(CATALOG))
+        )
+
+    @staticmethod
+    def get_row_validator(id_role: int) -> Optional[Validator]:
+        """
+        Obtiene el validador (ETag) de un rol.
+
+        Args:
+            id_role: Identificador del registro
+
+        Returns:
+            Optional[Validator]: Validador del registro o None si no existe
+        """
+        role = db.session.get(Role, id_role)
+        return row_validator(role, "id_role") if role else None
     
     @staticmethod
-    def create(data: dict) -> dict:
+    def create(data: dict) -> Row:
         """
         Crea un nuevo rol en el catálogo.
 
+        No se consulta antes de insertar: un nombre duplicado se detecta por la
+        restricción única de `name_normalized` y se reporta como conflicto.
+
         Args:
             data: Diccionario con los datos del rol (name requerido)
 
         Returns:
-            dict: Rol creado serializado
+            Row: Fila escrita con todas las columnas
 
         Raises:
             ValidationError: Si el nombre está vacío o no se proporciona
@@ -44,21 +129,29 @@ class RoleService:
             raise ValidationError("El nombre del rol es requerido")
 
         name = name.strip()
+        values = {
+            "name": name,
+            "active": True,
+            "created_by": current_actor(),
+        }
 
-        existing = Role.query.filter_by(name=name).first()
-        if existing:
-            raise ConflictError(f"Ya existe un rol con el nombre '{name}'")
-
-        role = Role(name=name)
-        db.session.add(role)
-
+        # La unicidad la garantiza el índice de name_normalized: un solo INSERT;
+        # las fechas las asigna la base de datos y se leen de la fila escrita
         try:
+            row = execute_returning(
+                insert(Role).values(name_normalized=normalize_name(name), **values),
+                Role,
+                Role.id_role,
+            )
+            version = bump_version(CATALOG)
             db.session.commit()
         except IntegrityError:
             db.session.rollback()
             raise ConflictError(f"Ya existe un rol con el nombre '{name}'")
 
-        return role.to_dict()
+        id_role = row.id_role
+        catalog_changed.send(CATALOG, op="create", id=id_role, version=version, record=row)
+        return row
     
     @staticmethod
     def get_by_id(id_role: int) -> Role:
@@ -80,44 +173,57 @@ class RoleService:
         return role
 
     @staticmethod
-    def update(id_role: int, data: dict) -> dict:
+    def update(id_role: int, data: dict) -> Row:
         """
         Actualiza un rol existente con validaciones de negocio.
 
+        Se ejecuta un solo UPDATE por llave primaria; si no afecta filas el
+        rol no existe.
+
         Args:
             id_role: ID del rol a actualizar.
             data: Diccionario con los datos del rol (name requerido).
 
         Returns:
-            dict: Rol actualizado serializado.
+            Row: Fila escrita con todas las columnas.
 
         Raises:
             NotFoundError: Si el rol no existe.
             ValidationError: Si el nombre está vacío.
             ConflictError: Si ya existe otro rol con el mismo nombre.
         """
-        role = RoleService.get_by_id(id_role)
-
         name = data.get("name")
         if not name or not name.strip():
             raise ValidationError("El nombre del rol es requerido")
 
         name = name.strip()
 
-        # Verificar si existe OTRO rol diferente que ya tenga este nombre
-        existing = Role.query.filter(Role.name == name, Role.id_role != id_role).first()
-        if existing:
-            raise ConflictError(f"Ya existe un rol con el nombre '{name}'")
-
-        role.name = name
-
         try:
+            row = execute_returning(
+                update(Role)
+                .where(Role.id_role == id_role)
+                .values(
+                    name=name,
+                    name_normalized=normalize_name(name),
+                    updated_at=func.current_timestamp(),
+                    updated_by=current_actor(),
+                ),
+                Role,
+                Role.id_role,
+                id_role,
+            )
+            if row is None:
+                db.session.rollback()
+                raise NotFoundError(f"No se encontró el rol con ID {id_role}")
+            version = bump_version(CATALOG)
             db.session.commit()
         except IntegrityError:
+            # La restricción única de name_normalized detecta OTRO rol con este nombre
             db.session.rollback()
-            raise ConflictError(f"Error de integridad al actualizar el rol '{name}'")
+            raise ConflictError(f"Ya existe un rol con el nombre '{name}'")
 
-        return role.to_dict()
+        catalog_changed.send(CATALOG, op="update", id=id_role, version=version, record=row)
+        return row
 
     @staticmethod
     def delete(id_role: int) -> None:
@@ -133,11 +239,60 @@ class RoleService:
         Raises:
             NotFoundError: Si el rol no existe.
         """
-        # Reutilizamos el método get_by_id para aprovechar la validación de existencia
-        role = RoleService.get_by_id(id_role)
+        now = func.current_timestamp()
+
+        # Aplicamos el Soft Delete con un solo UPDATE por llave primaria
+        result = db.session.execute(
+            update(Role)
+            .where(Role.id_role == id_role)
+            .values(active=False, deleted_at=now, deleted_by=current_actor(), updated_at=now)
+        )
+        if result.rowcount == 0:
+            db.session.rollback()
+            raise NotFoundError(f"No se encontró el rol con ID {id_role}")
+
+        version = bump_version(CATALOG)
+        db.session.commit()
+        catalog_changed.send(CATALOG, op="delete", id=id_role, version=version)
+
+    @staticmethod
+    def bulk_delete(ids: Iterable[int]) -> int:
+        """
+        Elimina lógicamente varios roles en una sola transacción.
+
+        Se emite un `UPDATE ... WHERE id IN (...)` por lote de IDs; los IDs
+        inexistentes o ya eliminados se ignoran.
 
-        # Aplicamos el Soft Delete
-        role.active = False
-        role.deleted_at = func.current_timestamp()
+        Args:
+            ids: IDs de los roles a eliminar
+
+        Returns:
+            int: Número de roles eliminados
+        """
+        affected = soft_delete_many(Role, Role.id_role, ids, deleted_by=current_actor())
+        return RoleService._commit_bulk(affected, "delete")
+
+    @staticmethod
+    def bulk_restore(ids: Iterable[int]) -> int:
+        """
+        Restaura varios roles eliminados en una sola transacción.
+
+        Args:
+            ids: IDs de los roles a restaurar
+
+        Returns:
+            int: Número de roles restaurados
+        """
+        affected = restore_many(Role, Role.id_role, ids, updated_by=current_actor())
+        return RoleService._commit_bulk(affected, "restore")
+
+    @staticmethod
+    def _commit_bulk(affected: int, op: str) -> int:
+        if not affected:
+            db.session.rollback()
+            return 0
 
+        version = bump_version(CATALOG)
         db.session.commit()
+        catalog_changed.send(CATALOG, op=op, count=affected, version=version)
+        return affected
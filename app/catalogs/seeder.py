@@ -0,0 +1,250 @@
+"""
+Generación de datos sintéticos para pruebas de escala de los catálogos.
+
+Los nombres se arman combinando listas de palabras en español (con acentos)
+y son únicos incluso después de normalizarlos: cada índice corresponde a una
+combinación distinta y, agotadas las combinaciones, se agrega un número de
+serie. Todo se deriva de una semilla, por lo que dos ejecuciones con la misma
+semilla generan exactamente los mismos registros.
+"""
+
+import math
+import random
+from itertools import count as count_from, islice
+from datetime import datetime, timedelta
+from typing import Iterator, Optional, Sequence
+
+from sqlalchemy import func, insert, select
+
+from app.catalogs.registry import CatalogSpec
+from app.extensions import db
+from app.signals import catalog_changed
+from app.utils.catalog_versions import bump_version
+from app.utils.text import normalize_name
+
+DEFAULT_SEED_BATCH_SIZE = 5000
+
+COLOR_WORDS = (
+    (
+        "Rojo", "Azul", "Verde", "Amarillo", "Marrón", "Café", "Púrpura", "Índigo",
+        "Añil", "Carmesí", "Turquesa", "Ámbar", "Marfil", "Ocre", "Salmón", "Limón",
+        "Caoba", "Nogal", "Perla", "Rosa", "Granate", "Bermellón", "Lavanda", "Oliva",
+        "Chocolate", "Canela", "Arena", "Grafito", "Plata", "Oro", "Cobre", "Bronce",
+        "Hueso", "Crema", "Champán", "Vino", "Mostaza", "Terracota", "Magenta", "Cian",
+    ),
+    (
+        "claro", "oscuro", "pálido", "intenso", "mate", "satinado", "brillante",
+        "cálido", "frío", "pastel", "metálico", "envejecido", "rústico", "ahumado",
+        "nacarado", "translúcido", "aterciopelado", "profundo", "suave", "vibrante",
+    ),
+    (
+        "de Sevilla", "de Oaxaca", "del Caribe", "de Córdoba", "de Mérida", "de Málaga",
+        "de Cádiz", "de Puebla", "de Yucatán", "del Pacífico", "de Bogotá", "de Cancún",
+        "de Querétaro", "de Michoacán", "de León", "de Jalapa", "de Morelia", "de Tepic",
+        "de Valparaíso", "de Cusco", "de Toledo", "de Granada", "de Almería", "de Tánger",
+        "de Atacama", "de Mazatlán", "de Ensenada", "de Zacatecas", "de Cholula", "de Taxco",
+    ),
+)
+
+ROLE_WORDS = (
+    (
+        "Administrador", "Vendedor", "Carpintero", "Ebanista", "Barnizador", "Tapicero",
+        "Almacenista", "Diseñador", "Técnico", "Supervisor", "Jefe", "Auxiliar",
+        "Contador", "Cajero", "Chofer", "Instalador", "Lijador", "Ensamblador",
+        "Pintor", "Gerente", "Analista", "Coordinador", "Inspector", "Capturista",
+    ),
+    (
+        "de ventas", "de producción", "de almacén", "de tapicería", "de barnizado",
+        "de diseño", "de logística", "de compras", "de calidad", "de mantenimiento",
+        "de ensamble", "de acabados", "de exhibición", "de atención", "de inventario",
+        "de corte", "de lijado", "de embarques", "de cobranza", "de nómina",
+    ),
+    (
+        "júnior", "sénior", "en formación", "titular", "suplente", "matutino",
+        "vespertino", "nocturno", "de guardia", "regional", "líder", "certificado",
+        "temporal", "de planta", "itinerante", "práctico", "externo", "interno",
+    ),
+)
+
+WOOD_TYPE_WORDS = (
+    (
+        "Pino", "Cedro", "Roble", "Nogal", "Caoba", "Encino", "Fresno", "Haya",
+        "Abedul", "Arce", "Cerezo", "Olmo", "Álamo", "Teca", "Ébano", "Palisandro",
+        "Wengué", "Jatobá", "Ipé", "Sapelli", "Bambú", "Castaño", "Ciprés", "Abeto",
+        "Alerce", "Tzalam", "Parota", "Guanacaste", "Mezquite", "Chicozapote",
+    ),
+    (
+        "blanco", "rojo", "negro", "americano", "europeo", "macizo", "laminado",
+        "tropical", "rústico", "envejecido", "termotratado", "aserrado", "cepillado",
+        "selecto", "veteado",
+    ),
+    (
+        "de Chiapas", "de Durango", "de Oaxaca", "de Michoacán", "de Quintana Roo",
+        "de Chihuahua", "de Veracruz", "de Campeche", "de Jalisco", "de Guerrero",
+        "del Petén", "de Canadá", "de Brasil", "de Finlandia", "de Perú", "de Bolivia",
+        "de Honduras", "de Nicaragua", "de Camerún", "de Indonesia",
+    ),
+)
+
+CATALOG_WORDS = {"colors": COLOR_WORDS, "roles": ROLE_WORDS, "wood_types": WOOD_TYPE_WORDS}
+
+DESCRIPTION_PARTS = (
+    ("blanda", "semidura", "dura", "muy dura", "ligera", "densa"),
+    ("veta recta", "veta ondulada", "grano fino", "grano abierto", "textura uniforme",
+     "tono cálido", "nudos visibles"),
+    ("ideal para mesas", "recomendada para sillas", "usada en clósets",
+     "apta para exteriores", "para ebanistería fina", "para molduras y marcos",
+     "para pisos y lambrines", "para muebles de cocina"),
+)
+
+
+class NameGenerator:
+    """
+    Genera nombres únicos y deterministas a partir de listas de palabras.
+
+    El índice se recorre con un salto coprimo con el total de combinaciones,
+    así nombres consecutivos no comparten las primeras palabras.
+
+    Attributes:
+        parts: Listas de palabras (barajadas con la semilla).
+        space: Número de combinaciones distintas.
+    """
+
+    def __init__(self, parts: Sequence[Sequence[str]], seed: int):
+        rng = random.Random(seed)
+        self.parts = [rng.sample(list(words), len(words)) for words in parts]
+        self.space = math.prod(len(words) for words in self.parts)
+        self._step = next(
+            step for step in iter(lambda: rng.randrange(1, self.space), None)
+            if math.gcd(step, self.space) == 1
+        )
+
+    def name(self, index: int) -> str:
+        """
+        Obtiene el nombre correspondiente a un índice.
+
+        Args:
+            index: Posición del registro (0, 1, 2, ...)
+
+        Returns:
+            str: Nombre único para ese índice
+        """
+        series, position = divmod(index, self.space)
+        position = position * self._step % self.space
+        words = []
+        for part in self.parts:
+            position, offset = divmod(position, len(part))
+            words.append(part[offset])
+        name = " ".join(words)
+        return f"{name} {series + 1}" if series else name
+
+
+def _description(rng: random.Random, name: str) -> str:
+    hardness, grain, use = (rng.choice(options) for options in DESCRIPTION_PARTS)
+    return f"Madera {hardness} de {name.split()[0].lower()}, {grain}, {use}."
+
+
+def generate_records(
+    spec: CatalogSpec,
+    count: Optional[int],
+    seed: int = 42,
+    start: int = 0,
+    deleted_fraction: float = 0.0,
+    days: int = 365,
+    until: Optional[datetime] = None,
+) -> Iterator[dict]:
+    """
+    Genera registros sintéticos listos para un INSERT de SQLAlchemy Core.
+
+    Args:
+        spec: Catálogo destino
+        count: Número de registros a generar (None: sin límite)
+        seed: Semilla; la misma semilla produce los mismos registros
+        start: Índice del primer registro (para agregar a un catálogo ya poblado)
+        deleted_fraction: Fracción de registros eliminados lógicamente (0 a 1)
+        days: Días hacia atrás en los que se reparten las fechas de creación
+        until: Fecha más reciente posible (por defecto, hoy a medianoche)
+
+    Yields:
+        dict: Valores de columna de cada registro
+    """
+    names = NameGenerator(CATALOG_WORDS[spec.name], seed)
+    rng = random.Random(f"{seed}:{spec.name}:{start}")
+    until = until or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    window = max(1, days * 86400)
+
+    indexes = count_from(start) if count is None else range(start, start + count)
+    for index in indexes:
+        name = names.name(index)
+        created_at = until - timedelta(seconds=rng.randrange(window))
+        updated_at = created_at + timedelta(
+            seconds=rng.randrange(int((until - created_at).total_seconds()) + 1)
+        )
+        record = {
+            "name": name,
+            "name_normalized": normalize_name(name),
+            "active": True,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "deleted_at": None,
+        }
+        if "description" in spec.fields:
+            record["description"] = _description(rng, name)
+        if rng.random() < deleted_fraction:
+            record.update(active=False, deleted_at=updated_at)
+        yield record
+
+
+def seed_catalog(
+    spec: CatalogSpec,
+    count: int,
+    seed: int = 42,
+    deleted_fraction: float = 0.0,
+    days: int = 365,
+    batch_size: int = DEFAULT_SEED_BATCH_SIZE,
+) -> int:
+    """
+    Inserta `count` registros sintéticos en un catálogo.
+
+    La generación continúa a partir del número de registros existentes. Los
+    nombres que ya existen (de una ejecución con otra semilla, de la
+    importación o capturados a mano) se descartan con una consulta `IN` por
+    lote y se siguen generando registros hasta insertar `count` nuevos. Cada
+    lote es un INSERT multi-fila con su propio commit.
+
+    Args:
+        spec: Catálogo destino
+        count: Número de registros a insertar
+        seed: Semilla de generación
+        deleted_fraction: Fracción de registros eliminados lógicamente
+        days: Días hacia atrás en los que se reparten las fechas
+        batch_size: Registros por INSERT
+
+    Returns:
+        int: Número de registros insertados
+    """
+    start = db.session.execute(select(func.count()).select_from(spec.model)).scalar_one()
+    records = generate_records(spec, None, seed, start, deleted_fraction, days)
+    model = spec.model
+
+    inserted = 0
+    while inserted < count:
+        batch = {
+            record["name_normalized"]: record
+            for record in islice(records, min(batch_size, count - inserted))
+        }
+        existing = db.session.execute(
+            select(model.name_normalized).where(model.name_normalized.in_(batch.keys()))
+        ).scalars()
+        for key in existing:
+            del batch[key]
+        if batch:
+            db.session.execute(insert(model.__table__), list(batch.values()))
+            db.session.commit()
+            inserted += len(batch)
+
+    if inserted:
+        version = bump_version(spec.name)
+        db.session.commit()
+        catalog_changed.send(spec.name, op="seed", count=inserted, version=version)
+    return inserted
@@ -0,0 +1,204 @@
+"""
+Autocompletado por prefijo de los nombres de catálogos.
+
+Cada catálogo tiene un `SuggestIndex`: una lista ordenada de los nombres
+normalizados de los registros activos en la que se busca el prefijo con
+`bisect`, sin consultar la base de datos. El índice se construye en la primera
+búsqueda; las altas, ediciones y bajas que emite el servicio del catálogo con
+`catalog_changed` se aplican sobre la lista ordenada sin volver a leer la
+tabla. Las operaciones masivas (importación, seeder, eliminación y
+restauración por lote) y los saltos de versión por escrituras de otros
+procesos descartan el índice, que se reconstruye en la siguiente búsqueda; esas
+escrituras también se detectan revisando la versión compartida del catálogo
+como máximo cada `SUGGEST_REFRESH_INTERVAL` segundos.
+"""
+
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Any, Optional
+
+from flask import Response, current_app, has_app_context, jsonify
+from sqlalchemy import select
+from werkzeug.datastructures import MultiDict
+
+from app.catalogs.registry import CATALOGS, CatalogSpec
+from app.extensions import db
+from app.signals import catalog_changed
+from app.utils.catalog_versions import get_version
+from app.utils.text import normalize_name
+
+DEFAULT_SUGGEST_LIMIT = 10
+MAX_SUGGEST_LIMIT = 50
+
+
+class SuggestIndex:
+    """
+    Índice ordenado de nombres normalizados de un catálogo.
+
+    Attributes:
+        spec: Catálogo indexado.
+        refresh_interval: Segundos entre revisiones de la versión compartida.
+    """
+
+    def __init__(self, spec: CatalogSpec, refresh_interval: float = 5.0):
+        self.spec = spec
+        self.refresh_interval = refresh_interval
+        # (llave normalizada, id, nombre) ordenadas por llave
+        self._entries: Optional[list[tuple[str, int, str]]] = None
+        # Entrada de cada ID indexado, para ubicarla al editar o eliminar
+        self._by_id: dict[int, tuple[str, int, str]] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def search(self, query: str, limit: int = DEFAULT_SUGGEST_LIMIT) -> list[tuple[int, str]]:
+        """
+        Busca los nombres que empiezan con `query`.
+
+        La comparación ignora mayúsculas, acentos y espacios repetidos.
+
+        Args:
+            query: Texto capturado por el usuario
+            limit: Máximo de resultados
+
+        Returns:
+            list[tuple[int, str]]: (id, nombre) en orden alfabético normalizado
+        """
+        prefix = normalize_name(query)
+        if not prefix:
+            return []
+
+        entries = self._current()
+        start = bisect_left(entries, (prefix,))
+        matches = []
+        for key, pk, name in entries[start:start + limit]:
+            if not key.startswith(prefix):
+                break
+            matches.append((pk, name))
+        return matches
+
+    def invalidate(self) -> None:
+        """Descarta el índice; se reconstruye en la siguiente búsqueda."""
+        with self._lock:
+            self._entries = None
+
+    def apply(self, op: str, pk: Optional[int], record: Any, version: Optional[int]) -> None:
+        """
+        Aplica al índice una escritura de este proceso.
+
+        Solo se aplica si la escritura sigue inmediatamente a la versión
+        indexada; si entre ambas escribió otro proceso, o la operación no es
+        de un solo registro, el índice se descarta.
+
+        Args:
+            op: Operación de `catalog_changed`
+            pk: ID del registro afectado (None en operaciones masivas)
+            record: Fila escrita (create/update) o None
+            version: Versión del catálogo después de la escritura
+        """
+        with self._lock:
+            if self._entries is None:
+                return
+            if (
+                pk is None
+                or version is None
+                or version != self._version + 1
+                or op not in ("create", "update", "delete")
+                or (op != "delete" and record is None)
+            ):
+                self._entries = None
+                return
+
+            # Copia al escribir: las búsquedas leen la lista sin tomar el candado
+            entries = list(self._entries)
+            previous = self._by_id.pop(pk, None)
+            if previous is not None:
+                entries.remove(previous)
+            if op != "delete" and record.active:
+                entry = (record.name_normalized, pk, record.name)
+                insort(entries, entry)
+                self._by_id[pk] = entry
+            self._entries = entries
+            self._version = version
+
+    def _current(self) -> list[tuple[str, int, str]]:
+        entries = self._entries
+        if entries is not None and time.monotonic() - self._checked_at < self.refresh_interval:
+            return entries
+
+        with self._lock:
+            now = time.monotonic()
+            if self._entries is not None and now - self._checked_at < self.refresh_interval:
+                return self._entries
+            version = get_version(self.spec.name)
+            if self._entries is None or version != self._version:
+                self._entries = self._build()
+                self._version = version
+            self._checked_at = now
+            return self._entries
+
+    def _build(self) -> list[tuple[str, int, str]]:
+        model = self.spec.model
+        rows = db.session.execute(
+            select(model.name_normalized, self.spec.pk_column, model.name)
+            .where(model.active.is_(True))
+        ).all()
+        # Se ordena en Python: bisect necesita el orden de str, no la collation de la BD
+        entries = sorted(tuple(row) for row in rows)
+        self._by_id = {entry[1]: entry for entry in entries}
+        return entries
+
+
+def init_suggest_indexes(app) -> None:
+    """
+    Crea los índices de autocompletado de la aplicación (vacíos hasta su primer uso).
+
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    interval = app.config["SUGGEST_REFRESH_INTERVAL"]
+    app.extensions["suggest_indexes"] = {
+        name: SuggestIndex(spec, interval) for name, spec in CATALOGS.items()
+    }
+
+
+def get_suggest_index(spec: CatalogSpec) -> SuggestIndex:
+    """
+    Obtiene el índice de autocompletado de un catálogo.
+
+    Args:
+        spec: Catálogo
+
+    Returns:
+        SuggestIndex: Índice de la aplicación actual
+    """
+    return current_app.extensions["suggest_indexes"][spec.name]
+
+
+def suggest_response(spec: CatalogSpec, args: MultiDict) -> Response:
+    """
+    Respuesta JSON con las sugerencias para `?q=`.
+
+    Args:
+        spec: Catálogo consultado
+        args: Query params (`q` y `limit` opcional)
+
+    Returns:
+        Response: {"data": [{"<pk>": ..., "name": ...}, ...]}
+    """
+    limit = args.get("limit", DEFAULT_SUGGEST_LIMIT, type=int)
+    limit = max(1, min(limit, MAX_SUGGEST_LIMIT))
+    matches = get_suggest_index(spec).search(args.get("q", ""), limit)
+    return jsonify(data=[{spec.pk: pk, "name": name} for pk, name in matches])
+
+
+@catalog_changed.connect
+def _update_suggest_index(sender: str, **extra) -> None:
+    if has_app_context():
+        index = current_app.extensions.get("suggest_indexes", {}).get(sender)
+        if index is not None:
+            index.apply(
+                extra.get("op", "update"), extra.get("id"), extra.get("record"),
+                extra.get("version"),
+            )
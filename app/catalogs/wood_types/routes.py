@@ -1,23 +1,76 @@
 """"
 Rutas/Endpoints para el módulo de tipos de madera.
 """
-from flask import flash, redirect, render_template, url_for
+from flask import flash, redirect, render_template, request, url_for
 from . import woods_types_bp
 from .forms import WoodTypeForm 
 from .services import WoodTypeService
+from app.catalogs.exporter import export_response
+from app.catalogs.registry import get_catalog
+from app.catalogs.suggest import suggest_response
 from app.exceptions import ConflictError
+from app.utils.conditional import conditional_get
+from app.utils.fragments import render_fragment
+from app.utils.pagination import parse_page_args
 
 
 @woods_types_bp.route("/", methods=["GET"])
+@conditional_get(WoodTypeService.get_list_validator)
 def list_wood_types():
     """
-    Muestra la lista de tipos de madera del catálogo.
+    Muestra la lista paginada de tipos de madera del catálogo.
+
+    Query params:
+        after: ID a partir del cual se muestra la página siguiente
+        before: ID a partir del cual se muestra la página anterior
+        limit: Cantidad de registros por página
+        deleted: 1 para listar los registros eliminados
 
     Returns:
         HTML: Página con la lista de tipos de madera
     """
-    wood_types = WoodTypeService.get_all()
-    return render_template("wood_types/list.html", wood_types=wood_types)
+    after, before, limit = parse_page_args(request.args)
+    show_deleted = request.args.get("deleted", type=int) == 1
+    page = WoodTypeService.get_page(after=after, before=before, limit=limit, active=not show_deleted)
+    # Las filas se cachean por versión y página; CSRF y flash se renderizan siempre
+    rows_html = render_fragment(
+        "wood_types", (show_deleted, after, before, limit), "wood_types/_rows.html",
+        wood_types=page.items, show_deleted=show_deleted,
+    )
+    return render_template(
+        "wood_types/list.html", wood_types=page.items, page=page, show_deleted=show_deleted, rows_html=rows_html
+    )
+
+@woods_types_bp.route("/export", methods=["GET"])
+def export_wood_types():
+    """
+    Exporta los tipos de madera activos en streaming.
+
+    Query params:
+        format: Formato de salida ('csv' por defecto o 'jsonl')
+
+    Returns:
+        Response: Archivo CSV/JSONL generado en streaming
+    """
+    return export_response(get_catalog("wood_types"), request.args.get("format", "csv"))
+
+
+@woods_types_bp.route("/suggest", methods=["GET"])
+def suggest_wood_types():
+    """
+    Sugiere tipos de madera activos cuyo nombre empieza con el texto capturado.
+
+    No consulta la base de datos: busca en el índice en memoria del catálogo.
+
+    Query params:
+        q: Texto capturado (sin distinguir mayúsculas ni acentos)
+        limit: Máximo de sugerencias (10 por defecto)
+
+    Returns:
+        JSON: Lista de sugerencias con ID y nombre
+    """
+    return suggest_response(get_catalog("wood_types"), request.args)
+
 
 @woods_types_bp.route("/create", methods=["GET", "POST"])
 def create_wood_type(): 
@@ -47,6 +100,7 @@ def create_wood_type():
     return render_template("wood_types/create.html", form=form)
 
 @woods_types_bp.route("/<int:id_wood_type>/edit", methods=["GET", "POST"])
+@conditional_get(WoodTypeService.get_row_validator)
 def edit_wood_type(id_wood_type: int):  
     """
     Muestra el formulario pre-poblado y actualiza un tipo de madera existente.
@@ -99,4 +153,44 @@ def delete_wood_type(id_wood_type: int):
     except Exception as e:
         flash(str(e), "error")
 
-    return redirect(url_for("woods_types.list_wood_types"))
\ No newline at end of file
+    return redirect(url_for("woods_types.list_wood_types"))
+
+
+@woods_types_bp.route("/bulk-delete", methods=["POST"])
+def bulk_delete_wood_types():
+    """
+    Ejecuta la eliminación lógica de los tipos de madera seleccionados.
+
+    POST: Marca como inactivos los tipos de madera seleccionados (campo `ids`) y redirige.
+
+    Returns:
+        Redirect: Redirige a la lista de tipos de madera con mensaje flash
+    """
+    ids = request.form.getlist("ids", type=int)
+    if not ids:
+        flash("Selecciona al menos un tipo de madera", "error")
+    else:
+        affected = WoodTypeService.bulk_delete(ids)
+        flash(f"{affected} tipos de madera eliminados", "success")
+
+    return redirect(url_for("woods_types.list_wood_types"))
+
+
+@woods_types_bp.route("/bulk-restore", methods=["POST"])
+def bulk_restore_wood_types():
+    """
+    Restaura los tipos de madera eliminados seleccionados.
+
+    POST: Marca como activos los tipos de madera seleccionados (campo `ids`) y redirige.
+
+    Returns:
+        Redirect: Redirige a la lista de tipos de madera eliminados con mensaje flash
+    """
+    ids = request.form.getlist("ids", type=int)
+    if not ids:
+        flash("Selecciona al menos un tipo de madera", "error")
+    else:
+        affected = WoodTypeService.bulk_restore(ids)
+        flash(f"{affected} tipos de madera restaurados", "success")
+
+    return redirect(url_for("woods_types.list_wood_types", deleted=1))
@@ -2,35 +2,128 @@
 Servicios de lógica de negocio para tipos de madera.
 """
 
+from typing import Iterable, Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
 from app.extensions import db
 from app.exceptions import ConflictError, NotFoundError, ValidationError
 from app.models.role import Role
 from app.models.wood_type import WoodType
+from app.signals import catalog_changed
+from app.utils.audit import current_actor
+from app.utils.bulk import restore_many, soft_delete_many
+from app.utils.cache import get_catalog_cache
+from app.utils.catalog_versions import bump_version, get_version
+from app.utils.conditional import Validator, catalog_validator, row_validator
+from app.utils.pagination import DEFAULT_PAGE_SIZE, Page, build_page, keyset_select
+from app.utils.text import normalize_name
+from app.utils.writes import execute_returning
+
+CATALOG = "wood_types"
+_cache = get_catalog_cache(CATALOG)
+
+# Columnas que muestran las listas; se leen como filas, sin instancias ORM
+LIST_COLUMNS = (
+    WoodType.id_wood_type,
+    WoodType.name,
+    WoodType.description,
+    WoodType.active,
+    WoodType.created_at,
+)
+
 
 class WoodTypeService:
     """Servicio para operaciones de negocio relacionadas con tipos de madera."""
 
     @staticmethod
-    def get_all() -> list[WoodType]:
+    def get_all() -> list[Row]:
         """
         Obtiene todos los tipos de madera activos.
 
         Returns:
-            list[WoodType]: Lista de objetos WoodType activos
+            list[Row]: Filas con las columnas de `LIST_COLUMNS`
+        """
+        return _cache.get_or_load(
+            "all",
+            lambda: db.session.execute(
+                select(*LIST_COLUMNS).filter_by(active=True).order_by(WoodType.id_wood_type)
+            ).all(),
+        )
+
+    @staticmethod
+    def get_page(
+        after: Optional[int] = None,
+        before: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        active: bool = True,
+    ) -> Page:
+        """
+        Obtiene una página de tipos de madera usando paginación keyset.
+
+        El resultado se sirve desde la caché del catálogo hasta la siguiente escritura.
+
+        Args:
+            after: Devuelve los registros con ID mayor a este valor
+            before: Devuelve los registros con ID menor a este valor
+            limit: Tamaño de página
+            active: True para los registros activos, False para los eliminados
+
+        Returns:
+            Page: Página de filas (`LIST_COLUMNS`) ordenadas por ID
+        """
+        def load() -> Page:
+            stmt = keyset_select(
+                select(*LIST_COLUMNS).filter_by(active=active), WoodType.id_wood_type, after, before, limit
+            )
+            rows = db.session.execute(stmt).all()
+            return build_page(rows, "id_wood_type", after, before, limit)
+
+        return _cache.get_or_load(("page", active, after, before, limit), load)
+
+    @staticmethod
+    def get_list_validator() -> Validator:
+        """
+        Obtiene el validador (ETag) de la lista de tipos de madera.
+
+        Se deriva de la versión del catálogo, `max(updated_at)`, `max(deleted_at)`
+        y el número de registros activos, y se cachea hasta la siguiente escritura.
+
+        Returns:
+            Validator: Validador del catálogo
+        """
+        return _cache.get_or_load(
+            "validator", lambda: catalog_validator(WoodType, get_version(CATALOG))
+        )
+
+    @staticmethod
+    def get_row_validator(id_wood_type: int) -> Optional[Validator]:
+        """
+        Obtiene el validador (ETag) de un tipo de madera.
+
+        Args:
+            id_wood_type: Identificador del registro
+
+        Returns:
+            Optional[Validator]: Validador del registro o None si no existe
         """
-        return WoodType.query.filter_by(active=True).all()
+        wood_type = db.session.get(WoodType, id_wood_type)
+        return row_validator(wood_type, "id_wood_type") if wood_type else None
 
     @staticmethod
-    def create(data: dict) -> dict:
+    def create(data: dict) -> Row:
         """
         Crea un nuevo tipo de madera en el catálogo.
 
+        No se consulta antes de insertar: un nombre duplicado se detecta por la
+        restricción única de `name_normalized` y se reporta como conflicto.
+
         Args:
             data: Diccionario con los datos del tipo de madera (name requerido)
 
         Returns:
-            dict: Tipo de madera creado serializado
+            Row: Fila escrita con todas las columnas
 
         Raises:
             ValidationError: Si el nombre está vacío o no se proporciona
@@ -43,21 +136,30 @@ class WoodTypeService:
             raise ValidationError("El nombre del tipo de madera es requerido")
 
         name = name.strip()
+        values = {
+            "name": name,
+            "description": description,
+            "active": True,
+            "created_by": current_actor(),
+        }
 
-        existing = WoodType.query.filter_by(name=name).first()
-        if existing:
-            raise ConflictError(f"Ya existe un tipo de madera con el nombre '{name}'")
-
-        wood_type = WoodType(name=name, description=description)
-        db.session.add(wood_type)
-
+        # La unicidad la garantiza el índice de name_normalized: un solo INSERT;
+        # las fechas las asigna la base de datos y se leen de la fila escrita
         try:
+            row = execute_returning(
+                insert(WoodType).values(name_normalized=normalize_name(name), **values),
+                WoodType,
+                WoodType.id_wood_type,
+            )
+            version = bump_version(CATALOG)
             db.session.commit()
         except IntegrityError:
             db.session.rollback()
             raise ConflictError(f"Ya existe un tipo de madera con el nombre '{name}'")
 
-        return wood_type.to_dict()
+        id_wood_type = row.id_wood_type
+        catalog_changed.send(CATALOG, op="create", id=id_wood_type, version=version, record=row)
+        return row
 
     @staticmethod
     def get_by_id(id_wood_type: int) -> WoodType:
@@ -79,26 +181,25 @@ class WoodTypeService:
         return wood_type    
 
     @staticmethod
-    def update(id_wood_type: int, data: dict) -> dict:
+    def update(id_wood_type: int, data: dict) -> Row:
         """
         Actualiza un tipo de madera existente.
 
+        Se ejecuta un solo UPDATE por llave primaria; si no afecta filas el
+        tipo de madera no existe o está inactivo.
+
         Args:
             id_wood_type: ID del tipo de madera a actualizar
             data: Diccionario con los datos a actualizar (name, description)
 
         Returns:
-            dict: Tipo de madera actualizado serializado
+            Row: Fila escrita con todas las columnas
 
         Raises:
             ValidationError: Si el nombre está vacío o no se proporciona
             ConflictError: Si ya existe otro tipo de madera con el mismo nombre
             NotFoundError: Si no se encuentra el tipo de madera por ID
         """
-        wood_type = WoodType.query.get(id_wood_type)
-        if not wood_type or not wood_type.active:
-            raise NotFoundError(f"No se encontró el tipo de madera con ID {id_wood_type}")
-
         name = data.get("name")
         description = data.get("description")
 
@@ -107,20 +208,32 @@ class WoodTypeService:
 
         name = name.strip()
 
-        existing = WoodType.query.filter(WoodType.name == name, WoodType.id_wood_type != id_wood_type).first()
-        if existing:
-            raise ConflictError(f"Ya existe otro tipo de madera con el nombre '{name}'")
-
-        wood_type.name = name
-        wood_type.description = description
-
         try:
+            row = execute_returning(
+                update(WoodType)
+                .where(WoodType.id_wood_type == id_wood_type, WoodType.active.is_(True))
+                .values(
+                    name=name,
+                    name_normalized=normalize_name(name),
+                    description=description,
+                    updated_at=func.current_timestamp(),
+                    updated_by=current_actor(),
+                ),
+                WoodType,
+                WoodType.id_wood_type,
+                id_wood_type,
+            )
+            if row is None:
+                db.session.rollback()
+                raise NotFoundError(f"No se encontró el tipo de madera con ID {id_wood_type}")
+            version = bump_version(CATALOG)
             db.session.commit()
         except IntegrityError:
             db.session.rollback()
             raise ConflictError(f"Ya existe otro tipo de madera con el nombre '{name}'")
 
-        return wood_type.to_dict()
+        catalog_changed.send(CATALOG, op="update", id=id_wood_type, version=version, record=row)
+        return row
     
     @staticmethod
     def delete(id_wood_type: int) -> None:
@@ -133,9 +246,61 @@ class WoodTypeService:
         Raises:
             NotFoundError: Si no se encuentra el tipo de madera por ID
         """
-        wood_type = WoodType.query.get(id_wood_type)
-        if not wood_type or not wood_type.active:
+        now = func.current_timestamp()
+
+        result = db.session.execute(
+            update(WoodType)
+            .where(WoodType.id_wood_type == id_wood_type, WoodType.active.is_(True))
+            .values(active=False, deleted_at=now, deleted_by=current_actor(), updated_at=now)
+        )
+        if result.rowcount == 0:
+            db.session.rollback()
             raise NotFoundError(f"No se encontró el tipo de madera con ID {id_wood_type}")
 
-        wood_type.active = False
-        db.session.commit()
\ No newline at end of file
+        version = bump_version(CATALOG)
+        db.session.commit()
+        catalog_changed.send(CATALOG, op="delete", id=id_wood_type, version=version)
+
+    @staticmethod
+    def bulk_delete(ids: Iterable[int]) -> int:
+        """
+        Elimina lógicamente varios tipos de madera en una sola transacción.
+
+        Se emite un `UPDATE ... WHERE id IN (...)` por lote de IDs; los IDs
+        inexistentes o ya eliminados se ignoran.
+
+        Args:
+            ids: IDs de los tipos de madera a eliminar
+
+        Returns:
+            int: Número de tipos de madera eliminados
+        """
+        affected = soft_delete_many(
+            WoodType, WoodType.id_wood_type, ids, deleted_by=current_actor()
+        )
+        return WoodTypeService._commit_bulk(affected, "delete")
+
+    @staticmethod
+    def bulk_restore(ids: Iterable[int]) -> int:
+        """
+        Restaura varios tipos de madera eliminados en una sola transacción.
+
+        Args:
+            ids: IDs de los tipos de madera a restaurar
+
+        Returns:
+            int: Número de tipos de madera restaurados
+        """
+        affected = restore_many(WoodType, WoodType.id_wood_type, ids, updated_by=current_actor())
+        return WoodTypeService._commit_bulk(affected, "restore")
+
+    @staticmethod
+    def _commit_bulk(affected: int, op: str) -> int:
+        if not affected:
+            db.session.rollback()
+            return 0
+
+        version = bump_version(CATALOG)
+        db.session.commit()
+        catalog_changed.send(CATALOG, op=op, count=affected, version=version)
+        return affected
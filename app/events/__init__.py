@@ -0,0 +1,13 @@
+"""
+Módulo de eventos en tiempo real.
+
+Expone `/events/catalogs`, un stream Server-Sent Events con los cambios de
+los catálogos, para que los clientes no tengan que consultar las listas
+periódicamente.
+"""
+
+from flask import Blueprint
+
+events_bp = Blueprint('events', __name__)
+
+from . import routes  # noqa: E402, F401
@@ -0,0 +1,361 @@
+"""
+Difusión de los cambios de catálogos a los suscriptores de `/events/catalogs`.
+
+Cada escritura confirmada (`catalog_changed`) se publica como un evento
+`change` con el catálogo, el ID afectado, la operación y la nueva versión del
+catálogo, que viene en la señal (publicar no consulta la base). Los eventos se
+guardan en un buffer circular de `EVENTS_BUFFER_SIZE` entradas para que un
+cliente que se reconecta con `Last-Event-ID` reciba lo que se perdió.
+
+Cada conexión ocupa un hilo de petición mientras está abierta (también con
+`asgi.py`, donde Flask corre en el pool de hilos de `ThreadPoolWsgi`); ver
+`init_events` para el límite por proceso.
+
+Los IDs de evento son `<token>-<secuencia>`, con un token por proceso. Si el
+ID no es de este proceso (otro worker o un reinicio) o ya salió del buffer,
+el cliente recibe un evento `reset` y debe volver a leer los catálogos.
+
+Las escrituras de otros procesos se detectan comparando `catalog_versions`
+cada `EVENTS_POLL_INTERVAL` segundos (una consulta por proceso, no por
+suscriptor) y se publican como `change` con `op` "change" e `id` nulo.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Iterator, Optional
+
+from flask import current_app, has_app_context
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.signals import catalog_changed
+from app.utils.catalog_versions import read_versions
+
+# Milisegundos que espera el navegador antes de reconectarse
+RETRY_MS = 3000
+
+
+class SubscriberLimitError(Exception):
+    """Se alcanzó `EVENTS_MAX_SUBSCRIBERS`."""
+
+
+class Subscriber:
+    """
+    Conexión abierta a `/events/catalogs`.
+
+    Attributes:
+        queue: Eventos pendientes de enviar como (secuencia, texto SSE).
+        overflowed: True si se descartaron eventos por cola llena.
+    """
+
+    def __init__(self, maxsize: int):
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+
+class ChangeBroker:
+    """
+    Buffer circular de eventos de cambio y suscriptores del proceso.
+
+    Attributes:
+        engine: Motor de la base principal (versiones de catálogos).
+        max_subscribers: Conexiones simultáneas permitidas.
+        poll_interval: Segundos entre revisiones de versiones de otros procesos.
+        heartbeat_interval: Segundos sin eventos antes de enviar un comentario keep-alive.
+        queue_size: Eventos pendientes por suscriptor antes de forzar un `reset`.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        buffer_size: int = 1000,
+        max_subscribers: int = 100,
+        poll_interval: float = 2.0,
+        heartbeat_interval: float = 15.0,
+        queue_size: int = 100,
+        logger=None,
+    ):
+        self.engine = engine
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.queue_size = queue_size
+        self.logger = logger
+        self.published = 0
+        self.rejected = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._reset_process()
+
+    def _reset_process(self) -> None:
+        # Estado propio de cada proceso: tras un fork se empieza de cero
+        self._pid = os.getpid()
+        self._token = uuid.uuid4().hex[:12]
+        self._seq = 0
+        self._buffer: deque = deque(maxlen=self.buffer_size)
+        self._subscribers: set[Subscriber] = set()
+        self._versions: dict[str, int] = {}
+        self._checked_at = float("-inf")
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._reset_process()
+
+    def subscribe(self) -> Subscriber:
+        """
+        Registra una conexión nueva.
+
+        Returns:
+            Subscriber: Suscriptor registrado
+
+        Raises:
+            SubscriberLimitError: Si ya hay `max_subscribers` conexiones abiertas o el
+                broker se cerró
+        """
+        self._check_fork()
+        with self._lock:
+            if self._closed or len(self._subscribers) >= self.max_subscribers:
+                self.rejected += 1
+                raise SubscriberLimitError()
+            subscriber = Subscriber(self.queue_size)
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Quita una conexión cerrada."""
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def close(self) -> None:
+        """Termina los streams abiertos y rechaza conexiones nuevas (apagado del servidor)."""
+        with self._lock:
+            self._closed = True
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.queue.put_nowait(None)
+            except queue.Full:
+                subscriber.overflowed = True
+
+    def publish(self, catalog: str, op: str, record_id: Optional[int], version: int) -> None:
+        """
+        Guarda un evento en el buffer y lo entrega a los suscriptores.
+
+        Args:
+            catalog: Nombre del catálogo
+            op: Operación ('create', 'update', 'delete', 'restore', ...)
+            record_id: ID del registro afectado (None si fueron varios)
+            version: Versión del catálogo después del cambio
+        """
+        self._check_fork()
+        data = json.dumps(
+            {"catalog": catalog, "id": record_id, "op": op, "version": version},
+            separators=(",", ":"),
+        )
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            text = f"id: {self._token}-{seq}\nevent: change\ndata: {data}\n\n"
+            self._buffer.append((seq, text))
+            self._versions[catalog] = max(version, self._versions.get(catalog, version))
+            self.published += 1
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            try:
+                subscriber.queue.put_nowait((seq, text))
+            except queue.Full:
+                subscriber.overflowed = True
+
+    def publish_change(
+        self, catalog: str, op: str, record_id: Optional[int], version: Optional[int] = None
+    ) -> None:
+        """
+        Publica una escritura local.
+
+        Las escrituras de los servicios envían la versión nueva con `catalog_changed`;
+        solo si falta se lee de la base principal, y no sin suscriptores (el
+        siguiente `check_versions` la detecta).
+
+        Args:
+            catalog: Nombre del catálogo
+            op: Operación realizada
+            record_id: ID del registro afectado (None si fueron varios)
+            version: Versión del catálogo después del cambio
+        """
+        if version is None:
+            self._check_fork()
+            if not self._subscribers:
+                return
+            try:
+                with self.engine.connect() as connection:
+                    version = read_versions(connection).get(catalog, 0)
+            except SQLAlchemyError:
+                if self.logger is not None:
+                    self.logger.exception("No se pudo leer la versión de %s", catalog)
+                return
+        self.publish(catalog, op, record_id, version)
+
+    def check_versions(self) -> None:
+        """Publica los cambios hechos por otros procesos (a lo más una consulta por intervalo)."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < self.poll_interval:
+                return
+            self._checked_at = now
+
+        try:
+            with self.engine.connect() as connection:
+                versions = read_versions(connection)
+        except SQLAlchemyError:
+            if self.logger is not None:
+                self.logger.warning("No se pudieron revisar las versiones de catálogos")
+            return
+
+        for catalog, version in sorted(versions.items()):
+            known = self._versions.setdefault(catalog, version)
+            if version > known:
+                self.publish(catalog, "change", None, version)
+
+    def stream(self, subscriber: Subscriber, last_event_id: Optional[str]) -> Iterator[str]:
+        """
+        Crea el stream SSE de una conexión.
+
+        Primero reenvía lo posterior a `last_event_id` (o un `reset` si no se
+        puede reanudar) y después los eventos nuevos, con comentarios
+        keep-alive durante los silencios. Al cerrarse la conexión se quita el
+        suscriptor.
+
+        El buffer se lee aquí y no al empezar a iterar: los eventos publicados
+        mientras tanto ya están en la cola del suscriptor.
+
+        Args:
+            subscriber: Suscriptor ya registrado con `subscribe`
+            last_event_id: Encabezado `Last-Event-ID` del cliente
+
+        Returns:
+            Iterator[str]: Fragmentos del stream text/event-stream
+        """
+        sent, backlog, resumable = self._replay(last_event_id)
+        return self._events(subscriber, sent, backlog, resumable)
+
+    def _events(
+        self, subscriber: Subscriber, sent: int, backlog: list, resumable: bool
+    ) -> Iterator[str]:
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            if not resumable:
+                yield self._reset_event(sent)
+            for seq, text in backlog:
+                yield text
+
+            idle = 0.0
+            while not subscriber.overflowed:
+                try:
+                    item = subscriber.queue.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    self.check_versions()
+                    idle += self.poll_interval
+                    if idle >= self.heartbeat_interval:
+                        idle = 0.0
+                        yield ": keep-alive\n\n"
+                    continue
+                if item is None:
+                    # Apagado: el cliente se reconecta a otro proceso y recibe un `reset`
+                    return
+                seq, text = item
+                # Los eventos ya reenviados desde el buffer pueden llegar también por la cola
+                if seq > sent:
+                    sent = seq
+                    idle = 0.0
+                    yield text
+
+            # El cliente no consumió a tiempo: debe releer los catálogos
+            yield self._reset_event(self._seq)
+        finally:
+            self.unsubscribe(subscriber)
+
+    def stats(self) -> dict:
+        """
+        Obtiene las métricas del broker.
+
+        Returns:
+            dict: Suscriptores, eventos publicados, conexiones rechazadas y ocupación del buffer
+        """
+        return {
+            "subscribers": len(self._subscribers),
+            "max_subscribers": self.max_subscribers,
+            "published": self.published,
+            "rejected": self.rejected,
+            "buffered": len(self._buffer),
+            "buffer_size": self.buffer_size,
+        }
+
+    def _replay(self, last_event_id: Optional[str]) -> tuple[int, list, bool]:
+        with self._lock:
+            current = self._seq
+            backlog = list(self._buffer)
+
+        if not last_event_id:
+            return current, [], True
+
+        token, _, seq = last_event_id.strip().rpartition("-")
+        if token != self._token or not seq.isdigit() or int(seq) > current:
+            return current, [], False
+
+        last = int(seq)
+        oldest = backlog[0][0] if backlog else current + 1
+        if last < oldest - 1:
+            return current, [], False
+        missed = [(s, text) for s, text in backlog if s > last]
+        return (missed[-1][0] if missed else last), missed, True
+
+    def _reset_event(self, seq: int) -> str:
+        return f"id: {self._token}-{seq}\nevent: reset\ndata: {{}}\n\n"
+
+
+def init_events(app, engine: Engine) -> None:
+    """
+    Crea el broker de eventos si `EVENTS_ENABLED`.
+
+    Las conexiones simultáneas se limitan a `EVENTS_MAX_SUBSCRIBERS` y a la
+    fracción `EVENTS_THREAD_SHARE` de `WORKER_THREADS`.
+
+    Args:
+        app: Instancia de la aplicación Flask
+        engine: Motor de la base principal
+    """
+    if not app.config["EVENTS_ENABLED"]:
+        return
+
+    # Cada stream ocupa un hilo de petición: se dejan hilos libres para el resto de las rutas
+    thread_cap = max(int(app.config["WORKER_THREADS"] * app.config["EVENTS_THREAD_SHARE"]), 1)
+    max_subscribers = min(app.config["EVENTS_MAX_SUBSCRIBERS"], thread_cap)
+    app.extensions["events"] = ChangeBroker(
+        engine,
+        buffer_size=app.config["EVENTS_BUFFER_SIZE"],
+        max_subscribers=max_subscribers,
+        poll_interval=app.config["EVENTS_POLL_INTERVAL"],
+        heartbeat_interval=app.config["EVENTS_HEARTBEAT_INTERVAL"],
+        queue_size=app.config["EVENTS_QUEUE_SIZE"],
+        logger=app.logger,
+    )
+
+
+@catalog_changed.connect
+def _publish_change(sender: str, **extra) -> None:
+    broker: Optional[ChangeBroker] = (
+        current_app.extensions.get("events") if has_app_context() else None
+    )
+    if broker is not None:
+        broker.publish_change(
+            sender, extra.get("op", "update"), extra.get("id"), extra.get("version")
+        )
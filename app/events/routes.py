@@ -0,0 +1,42 @@
+"""
+Rutas/Endpoints de eventos Server-Sent Events.
+"""
+
+from flask import Response, abort, current_app, jsonify, request
+
+from .broker import SubscriberLimitError
+from . import events_bp
+
+
+@events_bp.route("/catalogs", methods=["GET"])
+def catalog_events():
+    """
+    Stream de cambios de los catálogos (text/event-stream).
+
+    Cada evento `change` trae `{"catalog", "id", "op", "version"}`. Con el
+    encabezado `Last-Event-ID` se reenvían los eventos perdidos; si ya no están
+    en el buffer se envía un evento `reset` y el cliente debe releer los catálogos.
+
+    Returns:
+        Response: Stream SSE; 503 si se alcanzó `EVENTS_MAX_SUBSCRIBERS`
+    """
+    broker = current_app.extensions.get("events")
+    if broker is None:
+        abort(404)
+
+    try:
+        subscriber = broker.subscribe()
+    except SubscriberLimitError:
+        response = jsonify({"status": "unavailable", "message": "Demasiadas conexiones abiertas"})
+        response.status_code = 503
+        response.headers["Retry-After"] = "30"
+        return response
+
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    response = Response(broker.stream(subscriber, last_event_id), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    # Evita que un proxy (nginx) acumule el stream en su buffer
+    response.headers["X-Accel-Buffering"] = "no"
+    # También si el cliente se desconecta antes de empezar a leer el stream
+    response.call_on_close(lambda: broker.unsubscribe(subscriber))
+    return response
@@ -2,6 +2,9 @@ from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 from flask_wtf.csrf import CSRFProtect
 
-db = SQLAlchemy()
+from .utils.replicas import RoutingSession
+
+# Los SELECT de las peticiones se envían a una réplica si hay réplicas configuradas
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 migrate = Migrate()
 csrf = CSRFProtect()
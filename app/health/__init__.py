@@ -0,0 +1,12 @@
+"""
+Módulo de verificación de salud de la aplicación.
+
+Expone `/healthz` (el proceso responde) y `/readyz` (la base de datos
+responde) para los balanceadores de carga y orquestadores.
+"""
+
+from flask import Blueprint
+
+health_bp = Blueprint('health', __name__)
+
+from . import routes  # noqa: E402, F401
@@ -0,0 +1,37 @@
+"""
+Rutas/Endpoints de verificación de salud.
+"""
+
+from flask import current_app, jsonify
+
+from . import health_bp
+
+
+@health_bp.route("/healthz", methods=["GET"])
+def healthz():
+    """
+    Indica que el proceso está vivo. No consulta la base de datos.
+
+    Returns:
+        JSON: {"status": "ok"}
+    """
+    response = jsonify({"status": "ok"})
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@health_bp.route("/readyz", methods=["GET"])
+def readyz():
+    """
+    Indica si la aplicación puede atender peticiones (la base de datos responde).
+
+    El ping a la base de datos se cachea por `READINESS_CACHE_TTL` segundos.
+
+    Returns:
+        JSON: Estado del chequeo; 200 si está disponible, 503 si no
+    """
+    status = current_app.extensions["readiness"].status()
+    response = jsonify({"status": "ok" if status["ready"] else "unavailable", **status})
+    response.status_code = 200 if status["ready"] else 503
+    response.headers["Cache-Control"] = "no-store"
+    return response
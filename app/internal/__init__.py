@@ -0,0 +1,11 @@
+"""
+Módulo de endpoints internos de diagnóstico.
+
+Expone métricas de operación (cachés, conexiones) en formato JSON.
+"""
+
+from flask import Blueprint
+
+internal_bp = Blueprint('internal', __name__)
+
+from . import routes  # noqa: E402, F401
@@ -0,0 +1,78 @@
+"""
+Rutas/Endpoints internos de diagnóstico.
+"""
+
+from flask import current_app, jsonify
+
+from app.utils.cache import catalog_caches
+from app.utils.fragments import fragment_caches
+from . import internal_bp
+
+
+@internal_bp.route("/cache", methods=["GET"])
+def cache_stats():
+    """
+    Muestra las métricas de las cachés de catálogos.
+
+    Returns:
+        JSON: Aciertos, fallos y ocupación por catálogo
+    """
+    return jsonify({name: cache.stats() for name, cache in sorted(catalog_caches.items())})
+
+
+@internal_bp.route("/fragments", methods=["GET"])
+def fragment_stats():
+    """
+    Muestra las métricas de las cachés de fragmentos HTML.
+
+    Returns:
+        JSON: Aciertos, fallos y caracteres guardados por catálogo
+    """
+    return jsonify({name: cache.stats() for name, cache in sorted(fragment_caches.items())})
+
+
+@internal_bp.route("/pool", methods=["GET"])
+def pool_stats():
+    """
+    Muestra el estado del pool de conexiones a la base de datos.
+
+    Returns:
+        JSON: Conexiones en uso, overflow, saturación, tiempos de retención y contadores
+    """
+    return jsonify(current_app.extensions["pool_metrics"].stats())
+
+
+@internal_bp.route("/replicas", methods=["GET"])
+def replica_stats():
+    """
+    Muestra el estado de las réplicas de lectura.
+
+    Returns:
+        JSON: Réplicas configuradas, expulsiones y tiempo restante de expulsión
+    """
+    replicas = current_app.extensions.get("replicas")
+    return jsonify(replicas.stats() if replicas else {"ejections": 0, "replicas": []})
+
+
+@internal_bp.route("/audit", methods=["GET"])
+def audit_stats():
+    """
+    Muestra el estado de la cola de auditoría.
+
+    Returns:
+        JSON: Eventos pendientes, escritos, descartados, fallidos y lotes escritos
+    """
+    writer = current_app.extensions.get("audit")
+    return jsonify(writer.stats() if writer else {"enabled": False})
+
+
+@internal_bp.route("/events", methods=["GET"])
+def event_stats():
+    """
+    Muestra el estado del stream de eventos de catálogos.
+
+    Returns:
+        JSON: Suscriptores, eventos publicados, conexiones rechazadas y ocupación del buffer
+    """
+    broker = current_app.extensions.get("events")
+    return jsonify(broker.stats() if broker else {"enabled": False})
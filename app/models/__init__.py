@@ -1,3 +1,5 @@
+from .audit_log import AuditLog
+from .catalog_version import CatalogVersion
 from .color import Color
 from .role import Role
-from .wood_type import WoodType 
\ No newline at end of file
+from .wood_type import WoodType
@@ -0,0 +1,33 @@
+from ..extensions import db
+
+
+class AuditLog(db.Model):
+    """
+    Modelo de bitácora de auditoría de las escrituras en catálogos.
+
+    Las filas las escribe en lotes `app.utils.audit.AuditWriter`, fuera de la
+    transacción de la petición.
+
+    Attributes:
+          id_audit_log: Identificador único del evento.
+          catalog: Nombre del catálogo modificado (ej. 'colors').
+          action: Operación realizada ('create', 'update', 'delete', 'restore', 'import', 'seed').
+          record_id: ID del registro afectado; nulo en operaciones sobre varios registros.
+          affected: Número de registros afectados.
+          actor: Usuario que realizó la operación (encabezado de identidad de la petición).
+          created_at: Fecha en que ocurrió la operación.
+    """
+
+    __tablename__ = 'audit_log'
+    __table_args__ = (db.Index('ix_audit_log_catalog_record', 'catalog', 'record_id'),)
+
+    # SQLite solo autoincrementa llaves INTEGER
+    id_audit_log = db.Column(
+        db.BigInteger().with_variant(db.Integer(), 'sqlite'), primary_key=True
+    )
+    catalog = db.Column(db.String(50), nullable=False)
+    action = db.Column(db.String(20), nullable=False)
+    record_id = db.Column(db.Integer, nullable=True)
+    affected = db.Column(db.Integer, nullable=False, default=1)
+    actor = db.Column(db.String(100), nullable=True)
+    created_at = db.Column(db.TIMESTAMP, nullable=False)
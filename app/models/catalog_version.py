@@ -0,0 +1,29 @@
+from sqlalchemy.sql import func
+
+from ..extensions import db
+
+
+class CatalogVersion(db.Model):
+    """
+    Modelo de versión de catálogo para coherencia de cachés entre procesos.
+
+    Cada escritura en un catálogo incrementa su versión dentro de la misma
+    transacción; los lectores comparan la versión para validar su caché.
+
+    Attributes:
+          catalog: Nombre del catálogo (ej. 'colors').
+          version: Contador de cambios del catálogo.
+          updated_at: Fecha del último cambio.
+    """
+
+    __tablename__ = 'catalog_versions'
+
+    catalog = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+    updated_at = db.Column(
+        db.TIMESTAMP,
+        nullable=False,
+        server_default=func.current_timestamp(),
+        server_onupdate=func.current_timestamp()
+    )
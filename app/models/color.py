@@ -1,6 +1,8 @@
+from sqlalchemy.orm import deferred, validates
 from sqlalchemy.sql import func
 
 from ..extensions import db
+from ..utils.text import normalize_name
 
 
 class Color(db.Model):
@@ -10,6 +12,7 @@ class Color(db.Model):
     Attributes:
           id_color: Identificador único del color.
           name: Nombre del color.
+          name_normalized: Nombre normalizado (sin acentos ni mayúsculas) para unicidad.
           active: Indica si el color está activo o no.
 
           created_at: Fecha de creación del color.
@@ -25,6 +28,7 @@ class Color(db.Model):
 
     id_color = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), nullable=False, unique=True)
+    name_normalized = db.Column(db.String(100), nullable=False, unique=True, index=True)
     active = db.Column(db.Boolean, nullable=False, default=True)
 
     created_at = db.Column(
@@ -40,9 +44,16 @@ class Color(db.Model):
     )
     deleted_at = db.Column(db.TIMESTAMP, nullable=True)
 
-    created_by = db.Column(db.String(100), nullable=True)
-    updated_by = db.Column(db.String(100), nullable=True)
-    deleted_by = db.Column(db.String(100), nullable=True)
+    # Columnas de auditoría: no se cargan hasta que se accede a ellas
+    created_by = deferred(db.Column(db.String(100), nullable=True))
+    updated_by = deferred(db.Column(db.String(100), nullable=True))
+    deleted_by = deferred(db.Column(db.String(100), nullable=True))
+
+    @validates("name")
+    def _sync_name_normalized(self, key: str, value: str) -> str:
+        """Mantiene `name_normalized` sincronizado con `name`."""
+        self.name_normalized = normalize_name(value) if value is not None else None
+        return value
 
     def to_dict(self) -> dict:
         """
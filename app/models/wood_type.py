@@ -1,5 +1,7 @@
+from sqlalchemy.orm import deferred, validates
 from sqlalchemy.sql import func
 from ..extensions import db
+from ..utils.text import normalize_name
 
 
 class WoodType(db.Model):
@@ -9,6 +11,7 @@ class WoodType(db.Model):
     Attributes:
         id_wood_type: Identificador único del tipo de madera.
         name: Nombre del tipo de madera.
+        name_normalized: Nombre normalizado (sin acentos ni mayúsculas) para unicidad.
         description: Descripción opcional del tipo de madera.
         active: Indica si el tipo de madera está activo o no.
 
@@ -25,6 +28,7 @@ class WoodType(db.Model):
 
     id_wood_type = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False, unique=True)
+    name_normalized = db.Column(db.String(200), nullable=False, unique=True, index=True)
     description = db.Column(db.String(255), nullable=True)
     active = db.Column(db.Boolean, nullable=False, default=True)
 
@@ -41,17 +45,30 @@ class WoodType(db.Model):
     )
     deleted_at = db.Column(db.TIMESTAMP, nullable=True)
 
-    created_by = db.Column(db.String(100), nullable=True)
-    updated_by = db.Column(db.String(100), nullable=True)
-    deleted_by = db.Column(db.String(100), nullable=True)
+    # Columnas de auditoría: no se cargan hasta que se accede a ellas
+    created_by = deferred(db.Column(db.String(100), nullable=True))
+    updated_by = deferred(db.Column(db.String(100), nullable=True))
+    deleted_by = deferred(db.Column(db.String(100), nullable=True))
     
-    def to_dict(self):
+    @validates("name")
+    def _sync_name_normalized(self, key: str, value: str) -> str:
+        """Mantiene `name_normalized` sincronizado con `name`."""
+        self.name_normalized = normalize_name(value) if value is not None else None
+        return value
+
+    def to_dict(self) -> dict:
+        """
+        Serializa el modelo a diccionario.
+
+        Returns:
+            dict: Representación del tipo de madera con fechas en ISO 8601
+        """
         return {
-        "id_wood_type": self.id_wood_type,
-        "name": self.name,
-        "description": self.description,
-        "active": self.active,
-        "created_at": self.created_at,
-        "updated_at": self.updated_at,
-        "deleted_at": self.deleted_at,
-    }
\ No newline at end of file
+            "id_wood_type": self.id_wood_type,
+            "name": self.name,
+            "description": self.description,
+            "active": self.active,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
+        }
\ No newline at end of file
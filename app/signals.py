@@ -0,0 +1,19 @@
+"""
+Señales de la aplicación.
+
+Permiten desacoplar a los servicios de los componentes que necesitan
+reaccionar a sus cambios (cachés, índices, notificaciones).
+"""
+
+from blinker import Namespace
+
+_signals = Namespace()
+
+# Se emite después de confirmar (commit) una escritura en un catálogo.
+# sender: nombre del catálogo ("colors", "roles", "wood_types")
+# op: operación ("create", "update", "delete", "restore", "import", "seed")
+# id: ID del registro afectado (None si la operación afectó a varios)
+# count: número de registros afectados (1 si se omite)
+# version: versión del catálogo después de la escritura (ver bump_version)
+# record: fila escrita completa (solo en create y update)
+catalog_changed = _signals.signal("catalog-changed")
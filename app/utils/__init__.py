@@ -0,0 +1,3 @@
+"""
+Utilidades reutilizables compartidas por los módulos de la aplicación.
+"""
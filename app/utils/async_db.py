@@ -0,0 +1,94 @@
+"""
+Motor y sesiones asíncronas de SQLAlchemy para el modo ASGI.
+
+Se usan los mismos modelos que Flask-SQLAlchemy: solo cambia el driver de la
+URL (ej. `mysql+pymysql` -> `mysql+aiomysql`, `sqlite` -> `sqlite+aiosqlite`).
+"""
+
+from typing import Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+# Driver asíncrono equivalente por backend
+ASYNC_DRIVERS = {
+    "mysql": "aiomysql",
+    "mariadb": "aiomysql",
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+# Opciones de SQLALCHEMY_ENGINE_OPTIONS que también aplican al motor asíncrono;
+# el resto (ej. connect_args) es propio del driver síncrono
+POOL_OPTIONS = ("pool_size", "max_overflow", "pool_timeout", "pool_recycle", "pool_pre_ping")
+
+# Solo aplican a un pool de tamaño fijo (AsyncAdaptedQueuePool)
+QUEUE_POOL_OPTIONS = ("pool_size", "max_overflow", "pool_timeout")
+
+
+def async_database_uri(uri: str, override: Optional[str] = None) -> str:
+    """
+    Obtiene la URL asíncrona equivalente a la URL síncrona de la aplicación.
+
+    Args:
+        uri: `SQLALCHEMY_DATABASE_URI`
+        override: URL asíncrona explícita (`ASYNC_DATABASE_URI`), si se configuró
+
+    Returns:
+        str: URL con un driver asíncrono
+
+    Example:
+        >>> async_database_uri("mysql+pymysql://u:p@db/store")
+        'mysql+aiomysql://u:p@db/store'
+    """
+    if override:
+        return override
+    url = make_url(uri)
+    backend = url.get_backend_name()
+    url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return url.render_as_string(hide_password=False)
+
+
+def async_engine_options(uri: str, options: dict) -> dict:
+    """
+    Obtiene las opciones del pool síncrono que aplican al motor asíncrono.
+
+    Args:
+        uri: URL asíncrona
+        options: `SQLALCHEMY_ENGINE_OPTIONS`
+
+    Returns:
+        dict: Opciones para `create_async_engine`
+
+    Example:
+        >>> async_engine_options("sqlite+aiosqlite://", {"pool_size": 10, "pool_recycle": 280})
+        {'pool_recycle': 280}
+    """
+    selected = {key: value for key, value in options.items() if key in POOL_OPTIONS}
+    url = make_url(uri)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # SQLite en memoria usa StaticPool: una sola conexión, sin tamaño de pool
+        for key in QUEUE_POOL_OPTIONS:
+            selected.pop(key, None)
+    return selected
+
+
+def create_async_db(app) -> tuple[AsyncEngine, async_sessionmaker]:
+    """
+    Crea el motor asíncrono y su fábrica de sesiones con la configuración de la aplicación.
+
+    Se reutilizan las opciones del pool de `SQLALCHEMY_ENGINE_OPTIONS` que
+    aplican al driver asíncrono (ver `async_engine_options`).
+
+    Args:
+        app: Instancia de la aplicación Flask
+
+    Returns:
+        tuple: (AsyncEngine, async_sessionmaker)
+    """
+    uri = async_database_uri(
+        app.config["SQLALCHEMY_DATABASE_URI"], app.config.get("ASYNC_DATABASE_URI")
+    )
+    options = async_engine_options(uri, app.config["SQLALCHEMY_ENGINE_OPTIONS"])
+    engine = create_async_engine(uri, **options)
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
@@ -0,0 +1,222 @@
+"""
+Auditoría de las escrituras en catálogos.
+
+Cada escritura confirmada emite `catalog_changed` con la operación (`op`), el
+ID afectado (`id`) y el número de registros (`count`); este módulo la
+convierte en un evento de `audit_log` con el usuario de la petición, leído
+del encabezado `AUDIT_ACTOR_HEADER` (el mismo que llena las columnas
+`created_by`/`updated_by`/`deleted_by`). Por defecto no se configura: el
+cliente controla sus encabezados y solo un proxy que los sobrescribe los
+vuelve confiables.
+
+Los eventos no se escriben en la transacción de la petición: se encolan en
+memoria y un hilo de fondo los inserta en lotes con un solo INSERT multi-fila
+cada `AUDIT_FLUSH_INTERVAL` segundos o al juntar `AUDIT_BATCH_SIZE` eventos.
+Lo pendiente se escribe al terminar el proceso (`atexit`). Si la cola llega a
+`AUDIT_QUEUE_MAXSIZE` los eventos nuevos se descartan y se cuentan.
+"""
+
+import atexit
+import os
+import queue
+import threading
+from datetime import datetime
+from typing import Optional
+
+from flask import current_app, has_app_context, has_request_context, request
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.audit_log import AuditLog
+from app.signals import catalog_changed
+
+# Longitud de las columnas *_by y de audit_log.actor
+ACTOR_MAX_LENGTH = 100
+
+
+def current_actor() -> Optional[str]:
+    """
+    Obtiene el usuario que realiza la petición actual.
+
+    El encabezado lo controla el cliente: solo es confiable si un proxy que
+    autentica al usuario lo sobrescribe. Sin `AUDIT_ACTOR_HEADER` no hay usuario.
+
+    Returns:
+        Optional[str]: Valor del encabezado `AUDIT_ACTOR_HEADER` o None fuera
+        de una petición (CLI), si no está configurado o si no se envió
+    """
+    header = current_app.config["AUDIT_ACTOR_HEADER"] if has_request_context() else ""
+    if not header:
+        return None
+    actor = request.headers.get(header, "").strip()
+    return actor[:ACTOR_MAX_LENGTH] or None
+
+
+class AuditWriter:
+    """
+    Cola de eventos de auditoría escrita en lotes por un hilo de fondo.
+
+    Attributes:
+        engine: Motor de la base principal.
+        batch_size: Eventos máximos por INSERT.
+        flush_interval: Segundos máximos que un evento espera en la cola.
+        written: Eventos escritos.
+        dropped: Eventos descartados por cola llena.
+        failed: Eventos perdidos por errores de escritura.
+        batches: INSERT ejecutados.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        max_queue: int = 10000,
+        logger=None,
+    ):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.logger = logger
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def record(self, event: dict) -> None:
+        """
+        Encola un evento sin bloquear la petición.
+
+        Args:
+            event: Valores de una fila de `audit_log`
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """
+        Escribe todos los eventos encolados.
+
+        Returns:
+            int: Número de eventos escritos
+        """
+        written = 0
+        with self._flush_lock:
+            while True:
+                batch = self._drain()
+                if not batch:
+                    return written
+                try:
+                    with self.engine.begin() as connection:
+                        connection.execute(insert(AuditLog.__table__).values(batch))
+                except SQLAlchemyError:
+                    self.failed += len(batch)
+                    if self.logger is not None:
+                        self.logger.exception(
+                            "No se pudieron escribir %d eventos de auditoría", len(batch)
+                        )
+                    continue
+                self.batches += 1
+                self.written += len(batch)
+                written += len(batch)
+
+    def close(self) -> None:
+        """Detiene el hilo de fondo y escribe lo pendiente."""
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+
+    def stats(self) -> dict:
+        """
+        Obtiene las métricas de la cola.
+
+        Returns:
+            dict: Eventos pendientes, escritos, descartados, fallidos y lotes
+        """
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+    def _drain(self) -> list[dict]:
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _ensure_started(self) -> None:
+        # El hilo se crea en el proceso que escribe (después del fork de los workers)
+        if self._pid == os.getpid() or self._stop.is_set():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+            atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+def init_audit(app, engine: Engine) -> None:
+    """
+    Crea el escritor de auditoría si `AUDIT_ENABLED`.
+
+    Args:
+        app: Instancia de la aplicación Flask
+        engine: Motor de la base principal
+    """
+    if not app.config["AUDIT_ENABLED"]:
+        return
+    app.extensions["audit"] = AuditWriter(
+        engine,
+        batch_size=app.config["AUDIT_BATCH_SIZE"],
+        flush_interval=app.config["AUDIT_FLUSH_INTERVAL"],
+        max_queue=app.config["AUDIT_QUEUE_MAXSIZE"],
+        logger=app.logger,
+    )
+
+
+@catalog_changed.connect
+def _record_change(sender: str, **extra) -> None:
+    writer: Optional[AuditWriter] = (
+        current_app.extensions.get("audit") if has_app_context() else None
+    )
+    if writer is None:
+        return
+    writer.record({
+        "catalog": sender,
+        "action": extra.get("op", "update"),
+        "record_id": extra.get("id"),
+        "affected": extra.get("count", 1),
+        "actor": current_actor(),
+        "created_at": datetime.now().replace(microsecond=0),
+    })
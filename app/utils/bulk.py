@@ -0,0 +1,89 @@
+"""
+Operaciones masivas de eliminación lógica y restauración.
+
+Cada lote de IDs se actualiza con un solo `UPDATE ... WHERE id IN (...)`, sin
+cargar las instancias en la sesión.
+"""
+
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import func, update
+
+from app.extensions import db
+
+BULK_BATCH_SIZE = 500
+
+
+def soft_delete_many(
+    model: Any, pk_column: Any, ids: Iterable[int], deleted_by: Optional[str] = None
+) -> int:
+    """
+    Marca como eliminados (inactivos) los registros activos indicados.
+
+    No confirma la transacción; el servicio decide cuándo hacer commit.
+
+    Args:
+        model: Modelo del catálogo
+        pk_column: Columna llave primaria
+        ids: IDs de los registros a eliminar
+        deleted_by: Usuario que realiza la eliminación
+
+    Returns:
+        int: Número de registros afectados
+    """
+    now = func.current_timestamp()
+    return _bulk_update(
+        model,
+        pk_column,
+        ids,
+        model.active.is_(True),
+        active=False,
+        deleted_at=now,
+        deleted_by=deleted_by,
+        updated_at=now,
+    )
+
+
+def restore_many(
+    model: Any, pk_column: Any, ids: Iterable[int], updated_by: Optional[str] = None
+) -> int:
+    """
+    Restaura (reactiva) los registros eliminados indicados.
+
+    No confirma la transacción; el servicio decide cuándo hacer commit.
+
+    Args:
+        model: Modelo del catálogo
+        pk_column: Columna llave primaria
+        ids: IDs de los registros a restaurar
+        updated_by: Usuario que realiza la restauración
+
+    Returns:
+        int: Número de registros afectados
+    """
+    return _bulk_update(
+        model,
+        pk_column,
+        ids,
+        model.active.is_(False),
+        active=True,
+        deleted_at=None,
+        deleted_by=None,
+        updated_at=func.current_timestamp(),
+        updated_by=updated_by,
+    )
+
+
+def _bulk_update(model: Any, pk_column: Any, ids: Iterable[int], condition: Any, **values) -> int:
+    unique_ids = sorted(set(ids))
+    affected = 0
+    for start in range(0, len(unique_ids), BULK_BATCH_SIZE):
+        batch = unique_ids[start:start + BULK_BATCH_SIZE]
+        result = db.session.execute(
+            update(model)
+            .where(pk_column.in_(batch), condition)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        affected += result.rowcount
+    return affected
@@ -0,0 +1,232 @@
+"""
+Caché en memoria para lecturas de catálogos.
+
+Cada catálogo tiene su propia instancia de `CatalogCache`: un LRU con
+expiración por TTL y un límite total de registros para acotar la memoria.
+Los servicios la invalidan al emitir `catalog_changed` tras cada escritura, y
+la versión de `catalog_versions` la invalida cuando escribe otro proceso.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Hashable, Optional
+
+from app.signals import catalog_changed
+from app.utils.catalog_versions import get_version
+
+
+class CatalogCache:
+    """
+    Caché LRU con TTL para los resultados de lectura de un catálogo.
+
+    Attributes:
+        name: Nombre del catálogo asociado.
+        maxsize: Número máximo de entradas (0 deshabilita la caché).
+        ttl: Segundos de vida de cada entrada.
+        max_rows: Número máximo de registros sumando todas las entradas.
+        version_source: Función que devuelve la versión compartida del catálogo.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 128,
+        ttl: float = 60.0,
+        max_rows: int = 20000,
+        version_source: Optional[Callable[[], int]] = None,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.version_source = version_source
+        self._version: Optional[int] = None
+        self._data: OrderedDict = OrderedDict()
+        self._rows = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, maxsize: int, ttl: float, max_rows: int) -> None:
+        """Actualiza los límites de la caché y descarta su contenido."""
+        with self._lock:
+            self.maxsize = maxsize
+            self.ttl = ttl
+            self.max_rows = max_rows
+            self._clear()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Obtiene un valor de la caché o lo carga con `loader`.
+
+        Antes de buscar la llave se compara la versión compartida del
+        catálogo; si otro proceso la incrementó, la caché se vacía.
+
+        Args:
+            key: Llave de la entrada (ej. parámetros de la página)
+            loader: Función que obtiene el valor desde la base de datos
+
+        Returns:
+            Any: Valor cacheado o recién cargado
+        """
+        if self.maxsize <= 0:
+            return loader()
+
+        version = self.version_source() if self.version_source else None
+        found, value, generation = self.lookup(key, version)
+        if found:
+            return value
+
+        value = loader()
+        self.store(key, value, generation)
+        return value
+
+    def lookup(self, key: Hashable, version: Optional[int]) -> tuple[bool, Any, int]:
+        """
+        Busca una llave con una versión ya obtenida, sin cargar el valor.
+
+        La usan los lectores que consultan la versión por su cuenta (ej. los
+        asíncronos); `get_or_load` es el camino habitual.
+
+        Args:
+            key: Llave de la entrada
+            version: Versión compartida actual del catálogo
+
+        Returns:
+            tuple[bool, Any, int]: (encontrado, valor, generación para `store`)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if version != self._version:
+                self._clear()
+                self._version = version
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True, entry[1], self._generation
+            self.misses += 1
+            return False, None, self._generation
+
+    def store(self, key: Hashable, value: Any, generation: int) -> None:
+        """
+        Guarda un valor cargado tras un `lookup` fallido.
+
+        Args:
+            key: Llave de la entrada
+            value: Valor cargado
+            generation: Generación devuelta por `lookup`
+        """
+        if self.maxsize > 0:
+            self._store(key, value, time.monotonic() + self.ttl, generation)
+
+    def invalidate(self) -> None:
+        """Descarta todas las entradas de la caché."""
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> dict:
+        """
+        Obtiene las métricas de uso de la caché.
+
+        Returns:
+            dict: Contadores de aciertos, fallos, desalojos y ocupación
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._data),
+                "rows": self._rows,
+                "maxsize": self.maxsize,
+                "max_rows": self.max_rows,
+                "ttl": self.ttl,
+                "version": self._version,
+            }
+
+    def _weigh(self, value: Any) -> int:
+        """Peso de una entrada para el límite `max_rows` (registros que contiene)."""
+        return _weight(value)
+
+    def _store(self, key: Hashable, value: Any, expires_at: float, generation: int) -> None:
+        weight = self._weigh(value)
+        if weight > self.max_rows:
+            return
+
+        with self._lock:
+            # Una invalidación durante la carga vuelve obsoleto el valor leído
+            if generation != self._generation:
+                return
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._rows -= previous[2]
+            self._data[key] = (expires_at, value, weight)
+            self._rows += weight
+
+            while len(self._data) > self.maxsize or self._rows > self.max_rows:
+                _, evicted = self._data.popitem(last=False)
+                self._rows -= evicted[2]
+                self.evictions += 1
+
+    def _clear(self) -> None:
+        self._data.clear()
+        self._rows = 0
+        self._generation += 1
+
+
+def _weight(value: Any) -> int:
+    items = getattr(value, "items", value)
+    try:
+        return max(len(items), 1)
+    except TypeError:
+        return 1
+
+
+catalog_caches: dict[str, CatalogCache] = {}
+_settings = {"maxsize": 128, "ttl": 60.0, "max_rows": 20000}
+
+
+def get_catalog_cache(name: str) -> CatalogCache:
+    """
+    Obtiene (o crea) la caché asociada a un catálogo.
+
+    Args:
+        name: Nombre del catálogo
+
+    Returns:
+        CatalogCache: Caché del catálogo
+    """
+    cache = catalog_caches.get(name)
+    if cache is None:
+        cache = catalog_caches.setdefault(
+            name, CatalogCache(name, version_source=partial(get_version, name), **_settings)
+        )
+    return cache
+
+
+def init_catalog_caches(app) -> None:
+    """
+    Aplica la configuración de la aplicación a las cachés de catálogos.
+
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    _settings.update(
+        maxsize=app.config["CATALOG_CACHE_MAXSIZE"] if app.config["CATALOG_CACHE_ENABLED"] else 0,
+        ttl=app.config["CATALOG_CACHE_TTL"],
+        max_rows=app.config["CATALOG_CACHE_MAX_ROWS"],
+    )
+    for cache in catalog_caches.values():
+        cache.configure(**_settings)
+
+
+@catalog_changed.connect
+def _invalidate_catalog_cache(sender: str, **extra) -> None:
+    get_catalog_cache(sender).invalidate()
@@ -0,0 +1,105 @@
+"""
+Versiones de catálogos compartidas entre procesos.
+
+La tabla `catalog_versions` guarda un contador por catálogo. Las escrituras lo
+incrementan en la misma transacción y los lectores lo consultan (una vez por
+petición) para saber si su caché local sigue vigente, de modo que todos los
+workers comparten cachés coherentes sin un servicio externo.
+"""
+
+from flask import g, has_request_context
+from sqlalchemy import func, insert, select, update
+
+from app.extensions import db
+from app.models.catalog_version import CatalogVersion
+
+_table = CatalogVersion.__table__
+
+
+def get_version(catalog: str) -> int:
+    """
+    Obtiene la versión actual de un catálogo.
+
+    Dentro de una petición el valor se consulta una sola vez.
+
+    Args:
+        catalog: Nombre del catálogo
+
+    Returns:
+        int: Versión del catálogo (0 si aún no tiene registro)
+    """
+    memo = g.setdefault("_catalog_versions", {}) if has_request_context() else {}
+    if catalog not in memo:
+        version = db.session.execute(
+            select(_table.c.version).where(_table.c.catalog == catalog)
+        ).scalar()
+        memo[catalog] = version or 0
+    return memo[catalog]
+
+
+def read_versions(connection) -> dict[str, int]:
+    """
+    Lee las versiones de todos los catálogos con una conexión propia.
+
+    Para lecturas fuera de la sesión de la petición (ej. hilos de streaming).
+
+    Args:
+        connection: Conexión de SQLAlchemy a la base principal
+
+    Returns:
+        dict[str, int]: Versión por nombre de catálogo
+    """
+    return dict(connection.execute(select(_table.c.catalog, _table.c.version)).all())
+
+
+async def fetch_version(session, catalog: str) -> int:
+    """
+    Obtiene la versión actual de un catálogo con una sesión asíncrona.
+
+    Args:
+        session: `AsyncSession` de la petición
+        catalog: Nombre del catálogo
+
+    Returns:
+        int: Versión del catálogo (0 si aún no tiene registro)
+    """
+    result = await session.execute(select(_table.c.version).where(_table.c.catalog == catalog))
+    return result.scalar() or 0
+
+
+def bump_version(catalog: str) -> int:
+    """
+    Incrementa la versión de un catálogo en la transacción actual.
+
+    Debe llamarse antes del commit de la escritura para que el cambio de
+    datos y el de versión se confirmen juntos.
+
+    Args:
+        catalog: Nombre del catálogo modificado
+
+    Returns:
+        int: Versión nueva (se envía con `catalog_changed` para no releerla)
+    """
+    # La conexión de la transacción es la de la base principal (nunca una réplica)
+    connection = db.session.connection()
+    stmt = (
+        update(_table)
+        .where(_table.c.catalog == catalog)
+        .values(version=_table.c.version + 1, updated_at=func.current_timestamp())
+    )
+    if connection.dialect.update_returning:
+        version = connection.execute(stmt.returning(_table.c.version)).scalar()
+    elif connection.execute(stmt).rowcount:
+        # MySQL no tiene UPDATE ... RETURNING; el UPDATE ya bloqueó la fila
+        version = connection.execute(
+            select(_table.c.version).where(_table.c.catalog == catalog)
+        ).scalar()
+    else:
+        version = None
+    if version is None:
+        connection.execute(insert(_table).values(catalog=catalog, version=1))
+        version = 1
+
+    if has_request_context():
+        g.get("_catalog_versions", {}).pop(catalog, None)
+    return version
@@ -0,0 +1,275 @@
+"""
+Compresión de respuestas HTTP (gzip y, si está instalado, brotli).
+
+La codificación se negocia con `Accept-Encoding`. Las respuestas completas se
+comprimen solo a partir de `COMPRESS_MIN_SIZE` bytes; las respuestas en
+streaming (ej. exportaciones) se comprimen bloque a bloque con un flush por
+bloque, así el cliente sigue recibiendo datos a medida que se generan. Los
+eventos `text/event-stream` nunca se comprimen. Las páginas HTML sí, porque
+el token CSRF que contienen va enmascarado distinto en cada respuesta (ver
+`app.utils.csrf`), lo que evita deducirlo por el tamaño comprimido (BREACH).
+
+Los archivos estáticos se comprimen una sola vez al arrancar (`.gz` y `.br`
+junto al original) y la vista `static` entrega la variante precomprimida, de
+modo que nunca se comprimen por petición.
+"""
+
+import gzip
+import mimetypes
+import os
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from flask import Response, request, send_from_directory
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende de las dependencias instaladas
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+COMPRESSIBLE_TYPES = frozenset({
+    "text/html",
+    "text/css",
+    "text/plain",
+    "text/csv",
+    "text/javascript",
+    "application/javascript",
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "image/svg+xml",
+})
+# Extensión de los archivos estáticos precomprimidos por codificación
+STATIC_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Codificaciones soportadas, en orden de preferencia."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encodings) -> Optional[str]:
+    """
+    Elige la codificación a usar según `Accept-Encoding`.
+
+    Args:
+        accept_encodings: `request.accept_encodings`
+
+    Returns:
+        Optional[str]: 'br', 'gzip' o None si el cliente no acepta ninguna
+    """
+    best, best_quality = None, 0.0
+    for encoding in available_encodings():
+        quality = accept_encodings.quality(encoding)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(mimetype: Optional[str]) -> bool:
+    """Indica si un tipo de contenido vale la pena comprimirse."""
+    return mimetype in COMPRESSIBLE_TYPES
+
+
+def compress(data: bytes, encoding: str, level: int, brotli_quality: int) -> bytes:
+    """
+    Comprime un cuerpo completo.
+
+    Args:
+        data: Contenido original
+        encoding: 'br' o 'gzip'
+        level: Nivel de gzip (1-9)
+        brotli_quality: Calidad de brotli (0-11)
+
+    Returns:
+        bytes: Contenido comprimido
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+class _GzipStream:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def compress_stream(
+    chunks: Iterable[bytes], encoding: str, level: int, brotli_quality: int
+) -> Iterator[bytes]:
+    """
+    Comprime un cuerpo en streaming, emitiendo un bloque comprimido por bloque leído.
+
+    Args:
+        chunks: Bloques originales
+        encoding: 'br' o 'gzip'
+        level: Nivel de gzip (1-9)
+        brotli_quality: Calidad de brotli (0-11)
+
+    Yields:
+        bytes: Bloques comprimidos
+    """
+    stream = _BrotliStream(brotli_quality) if encoding == "br" else _GzipStream(level)
+    try:
+        for chunk in chunks:
+            data = stream.compress(chunk)
+            if data:
+                yield data
+        yield stream.finish()
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+def _compress_response(app, response: Response) -> Response:
+    if (
+        response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or request.method == "HEAD"
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or not is_compressible(response.mimetype)
+        or "no-transform" in response.headers.get("Cache-Control", "")
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = negotiate_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    level = app.config["COMPRESS_LEVEL"]
+    quality = app.config["COMPRESS_BROTLI_QUALITY"]
+
+    if response.is_streamed:
+        response.response = compress_stream(response.iter_encoded(), encoding, level, quality)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < app.config["COMPRESS_MIN_SIZE"]:
+            return response
+        response.set_data(compress(data, encoding, level, quality))
+
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def precompress_static(app) -> int:
+    """
+    Genera las variantes `.gz` (y `.br`) de los archivos estáticos comprimibles.
+
+    Solo se regeneran las variantes más antiguas que su archivo original.
+
+    Args:
+        app: Instancia de la aplicación Flask
+
+    Returns:
+        int: Número de variantes escritas
+    """
+    folder = app.static_folder
+    if not folder or not os.path.isdir(folder):
+        return 0
+
+    written = 0
+    for root, _, files in os.walk(folder):
+        for name in files:
+            path = os.path.join(root, name)
+            if name.endswith(tuple(STATIC_SUFFIXES.values())):
+                continue
+            if not is_compressible(mimetypes.guess_type(name)[0]):
+                continue
+            if os.path.getsize(path) < app.config["COMPRESS_MIN_SIZE"]:
+                continue
+
+            source_mtime = os.path.getmtime(path)
+            data = None
+            for encoding in available_encodings():
+                target = path + STATIC_SUFFIXES[encoding]
+                if os.path.exists(target) and os.path.getmtime(target) >= source_mtime:
+                    continue
+                if data is None:
+                    with open(path, "rb") as fh:
+                        data = fh.read()
+                try:
+                    # Máxima compresión: se paga una sola vez, no por petición
+                    _write_atomic(target, compress(data, encoding, level=9, brotli_quality=11))
+                    written += 1
+                except OSError as e:
+                    app.logger.warning("No se pudo precomprimir %s: %s", target, e)
+    return written
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, "wb") as fh:
+        fh.write(data)
+    os.replace(temporary, path)
+
+
+def _precompressed_static_view(app):
+    serve_static = app.view_functions["static"]
+
+    def static(filename: str) -> Response:
+        mimetype = mimetypes.guess_type(filename)[0]
+        if not is_compressible(mimetype):
+            return serve_static(filename=filename)
+
+        encoding = negotiate_encoding(request.accept_encodings)
+        suffix = STATIC_SUFFIXES.get(encoding)
+        variant = safe_join(app.static_folder, filename + suffix) if suffix else None
+        if variant and os.path.isfile(variant):
+            response = send_from_directory(
+                app.static_folder,
+                filename + suffix,
+                mimetype=mimetype,
+                max_age=app.get_send_file_max_age(filename),
+            )
+            response.headers["Content-Encoding"] = encoding
+        else:
+            response = serve_static(filename=filename)
+        response.vary.add("Accept-Encoding")
+        return response
+
+    return static
+
+
+def init_compression(app) -> None:
+    """
+    Activa la compresión de respuestas y de archivos estáticos si `COMPRESS_ENABLED`.
+
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    if not app.config["COMPRESS_ENABLED"]:
+        return
+
+    # Se ejecuta después de los demás after_request de la aplicación
+    app.after_request_funcs.setdefault(None, []).insert(
+        0, lambda response: _compress_response(app, response)
+    )
+
+    if app.config["COMPRESS_STATIC"] and app.has_static_folder:
+        precompress_static(app)
+        app.view_functions["static"] = _precompressed_static_view(app)
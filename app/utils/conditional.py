@@ -0,0 +1,144 @@
+"""
+Soporte de GET condicional (ETag) para vistas de catálogos.
+
+Los validadores se derivan de los datos (`updated_at`, `deleted_at`, conteo de
+activos y versión del catálogo) sin renderizar la vista, de modo que una
+petición con `If-None-Match` vigente se responde con 304 antes de tocar el
+template.
+
+No se envía `Last-Modified` ni se atiende `If-Modified-Since`: las páginas
+incluyen el token CSRF de la sesión, que cambia sin que cambien los datos, y
+solo el ETag lo toma en cuenta (ver `_client_etag`).
+"""
+
+import hashlib
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from flask import current_app, g, make_response, request, session
+from sqlalchemy import case, func, select
+
+from app.extensions import db
+
+
+class Validator:
+    """
+    Huella de la versión de un recurso.
+
+    Attributes:
+        etag: Identificador opaco del estado de los datos.
+    """
+
+    __slots__ = ("etag",)
+
+    def __init__(self, etag: str):
+        self.etag = etag
+
+
+def catalog_validator(model: Any, version: int) -> Validator:
+    """
+    Calcula el validador de un catálogo completo.
+
+    Args:
+        model: Modelo del catálogo
+        version: Versión del catálogo en `catalog_versions`
+
+    Returns:
+        Validator: Validador del catálogo
+    """
+    max_updated, max_deleted, active_count = db.session.execute(
+        select(
+            func.max(model.updated_at),
+            func.max(model.deleted_at),
+            func.coalesce(func.sum(case((model.active.is_(True), 1), else_=0)), 0),
+        )
+    ).one()
+    return _build_validator(
+        (model.__tablename__, version, max_updated, max_deleted, int(active_count))
+    )
+
+
+def row_validator(obj: Any, key_attr: str) -> Validator:
+    """
+    Calcula el validador de un registro.
+
+    La instancia se conserva en `g` hasta el final de la petición: el identity
+    map de la sesión guarda referencias débiles y, sin ella, la vista volvería
+    a consultar el mismo registro.
+
+    Args:
+        obj: Instancia del modelo
+        key_attr: Nombre del atributo llave primaria
+
+    Returns:
+        Validator: Validador del registro
+    """
+    g.setdefault("_validated_rows", []).append(obj)
+    return _build_validator(
+        (obj.__tablename__, getattr(obj, key_attr), obj.active, obj.updated_at, obj.deleted_at)
+    )
+
+
+def conditional_get(validator_fn: Callable[..., Optional[Validator]]) -> Callable:
+    """
+    Decorador que agrega el ETag y responde 304 a peticiones GET con `If-None-Match` vigente.
+
+    `validator_fn` recibe los mismos argumentos de la vista y puede devolver
+    None para omitir la validación (ej. registro inexistente).
+
+    Args:
+        validator_fn: Función que obtiene el validador del recurso
+
+    Returns:
+        Callable: Decorador de la vista
+    """
+
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != "GET":
+                return view(*args, **kwargs)
+
+            validator = validator_fn(**kwargs)
+            # Los mensajes flash son parte de la respuesta: no se valida ni se
+            # entrega un ETag que después coincida con una página sin ellos
+            if validator is None or session.get("_flashes"):
+                return view(*args, **kwargs)
+
+            if _is_not_modified(validator):
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(_client_etag(validator), weak=True)
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _build_validator(parts: tuple) -> Validator:
+    return Validator(hashlib.sha1(repr(parts).encode()).hexdigest())
+
+
+def _client_etag(validator: Validator) -> str:
+    # La página incluye el token CSRF de la sesión: el ETag se liga a la
+    # sesión y se renueva antes de que el token renderizado expire
+    parts = [validator.etag, session.get(current_app.config["WTF_CSRF_FIELD_NAME"], "")]
+    time_limit = current_app.config["WTF_CSRF_TIME_LIMIT"]
+    if time_limit:
+        parts.append(str(int(time.time() // max(time_limit // 2, 1))))
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+def _is_not_modified(validator: Validator) -> bool:
+    # If-Modified-Since se ignora: una fecha no puede reflejar el token CSRF de la página
+    return bool(request.if_none_match) and request.if_none_match.contains_weak(
+        _client_etag(validator)
+    )
@@ -0,0 +1,104 @@
+"""
+Enmascarado del token CSRF por respuesta (mitigación de BREACH).
+
+Las páginas HTML se comprimen y contienen el token CSRF junto a entrada
+reflejada (búsquedas, errores de formulario); si el token fuera el mismo en
+cada respuesta, el tamaño comprimido permitiría deducirlo carácter por
+carácter. Antes de enviar la página, el token que Flask-WTF generó en la
+petición se reemplaza por `pad + (token XOR pad)` con un `pad` aleatorio
+distinto en cada respuesta, así el texto comprimido nunca se repite.
+
+Al recibir un formulario, el campo se desenmascara antes de que
+`CSRFProtect` y los formularios lo validen. Un token sin enmascarar (los de
+Flask-WTF siempre contienen '.') se acepta tal cual.
+"""
+
+import binascii
+import os
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Optional
+
+from flask import Response, g, request
+from werkzeug.datastructures import ImmutableMultiDict
+
+
+def mask_token(token: str) -> str:
+    """
+    Enmascara un token con un pad aleatorio.
+
+    Args:
+        token: Token firmado de Flask-WTF
+
+    Returns:
+        str: Token enmascarado en base64 URL-safe (distinto en cada llamada)
+    """
+    data = token.encode("ascii")
+    pad = os.urandom(len(data))
+    masked = bytes(a ^ b for a, b in zip(data, pad))
+    return urlsafe_b64encode(pad + masked).decode("ascii")
+
+
+def unmask_token(value: str) -> Optional[str]:
+    """
+    Recupera el token original de un valor enmascarado con `mask_token`.
+
+    Args:
+        value: Valor recibido en el formulario
+
+    Returns:
+        Optional[str]: Token original, el mismo valor si no estaba
+        enmascarado o None si está mal formado
+    """
+    if "." in value:
+        return value
+    try:
+        data = urlsafe_b64decode(value.encode("ascii"))
+    except (binascii.Error, UnicodeEncodeError, ValueError):
+        return None
+    half, odd = divmod(len(data), 2)
+    if odd or not half:
+        return None
+    pad, masked = data[:half], data[half:]
+    try:
+        return bytes(a ^ b for a, b in zip(pad, masked)).decode("ascii")
+    except UnicodeDecodeError:
+        return None
+
+
+def _mask_response(field_name: str, response: Response) -> Response:
+    token = g.get(field_name)
+    if token is None or response.mimetype != "text/html" or response.is_streamed:
+        return response
+    body = response.get_data(as_text=True)
+    if token in body:
+        response.set_data(body.replace(token, mask_token(token)))
+    return response
+
+
+def _unmask_form(field_name: str, methods: frozenset) -> None:
+    if request.method not in methods:
+        return
+    value = request.form.get(field_name)
+    if not value:
+        return
+    form = request.form.copy()
+    form[field_name] = unmask_token(value) or ""
+    request.form = ImmutableMultiDict(form)
+
+
+def init_csrf_masking(app) -> None:
+    """
+    Enmascara el token CSRF de las páginas HTML y lo desenmascara al recibirlo.
+
+    Debe llamarse después de `csrf.init_app(app)`: el desenmascarado se
+    registra antes que la validación de `CSRFProtect`.
+
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    field_name = app.config["WTF_CSRF_FIELD_NAME"]
+    methods = frozenset(app.config["WTF_CSRF_METHODS"])
+    app.before_request_funcs.setdefault(None, []).insert(
+        0, lambda: _unmask_form(field_name, methods)
+    )
+    app.after_request(lambda response: _mask_response(field_name, response))
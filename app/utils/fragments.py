@@ -0,0 +1,110 @@
+"""
+Caché de fragmentos HTML renderizados.
+
+Las filas de las tablas de listas se renderizan una vez por versión de
+catálogo y página y se reutilizan como texto. El resto de la plantilla (token
+CSRF, mensajes flash, paginación) se renderiza en cada petición, por lo que
+solo se guarda HTML que no depende del usuario ni de la sesión.
+
+Cada catálogo tiene su `FragmentCache`, una `CatalogCache` cuyo límite se
+mide en caracteres en lugar de registros; se vacía con `catalog_changed` y al
+cambiar la versión compartida del catálogo.
+"""
+
+from functools import partial
+from typing import Any, Hashable
+
+from flask import render_template
+from markupsafe import Markup
+
+from app.signals import catalog_changed
+from app.utils.cache import CatalogCache
+from app.utils.catalog_versions import get_version
+
+
+class FragmentCache(CatalogCache):
+    """
+    Caché LRU con TTL de fragmentos HTML de un catálogo.
+
+    `max_rows` es aquí el total de caracteres guardados.
+    """
+
+    def _weigh(self, value: Any) -> int:
+        return max(len(value), 1)
+
+    def stats(self) -> dict:
+        """
+        Obtiene las métricas de uso de la caché.
+
+        Returns:
+            dict: Contadores de aciertos, fallos y desalojos; ocupación en caracteres
+        """
+        stats = super().stats()
+        stats["chars"] = stats.pop("rows")
+        stats["max_chars"] = stats.pop("max_rows")
+        return stats
+
+
+fragment_caches: dict[str, FragmentCache] = {}
+_settings = {"maxsize": 256, "ttl": 300.0, "max_rows": 8_000_000}
+
+
+def get_fragment_cache(name: str) -> FragmentCache:
+    """
+    Obtiene (o crea) la caché de fragmentos de un catálogo.
+
+    Args:
+        name: Nombre del catálogo
+
+    Returns:
+        FragmentCache: Caché de fragmentos del catálogo
+    """
+    cache = fragment_caches.get(name)
+    if cache is None:
+        cache = fragment_caches.setdefault(
+            name, FragmentCache(name, version_source=partial(get_version, name), **_settings)
+        )
+    return cache
+
+
+def render_fragment(catalog: str, key: Hashable, template: str, **context: Any) -> Markup:
+    """
+    Renderiza una plantilla parcial o la obtiene de la caché de fragmentos.
+
+    La plantilla no debe usar datos de la petición (CSRF, flash, usuario):
+    el resultado se comparte entre todas las peticiones con la misma llave.
+
+    Args:
+        catalog: Catálogo del que dependen los datos
+        key: Llave del fragmento (ej. filtros y cursores de la página)
+        template: Plantilla parcial a renderizar
+        **context: Variables de la plantilla
+
+    Returns:
+        Markup: HTML listo para insertarse en otra plantilla
+    """
+    html = get_fragment_cache(catalog).get_or_load(
+        (template, key), lambda: render_template(template, **context)
+    )
+    return Markup(html)
+
+
+def init_fragment_caches(app) -> None:
+    """
+    Aplica la configuración de la aplicación a las cachés de fragmentos.
+
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    _settings.update(
+        maxsize=app.config["FRAGMENT_CACHE_MAXSIZE"] if app.config["FRAGMENT_CACHE_ENABLED"] else 0,
+        ttl=app.config["FRAGMENT_CACHE_TTL"],
+        max_rows=app.config["FRAGMENT_CACHE_MAX_CHARS"],
+    )
+    for cache in fragment_caches.values():
+        cache.configure(**_settings)
+
+
+@catalog_changed.connect
+def _invalidate_fragment_cache(sender: str, **extra) -> None:
+    get_fragment_cache(sender).invalidate()
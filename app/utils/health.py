@@ -0,0 +1,91 @@
+"""
+Verificación de disponibilidad (readiness) con resultado cacheado.
+
+Los balanceadores consultan `/readyz` con mucha frecuencia; para no ocupar
+conexiones del pool en cada consulta, el ping a la base de datos se ejecuta
+como máximo una vez por TTL y un solo hilo a la vez. El resto de las
+peticiones reciben el último resultado.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import text
+
+from app.extensions import db
+
+
+def ping_database() -> None:
+    """Ejecuta `SELECT 1` con una conexión del pool."""
+    with db.engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+class ReadinessProbe:
+    """
+    Resultado cacheado de un chequeo de disponibilidad.
+
+    Attributes:
+        ttl: Segundos durante los que se reutiliza el último resultado.
+        check: Función que lanza una excepción si el recurso no está disponible.
+    """
+
+    def __init__(self, ttl: float = 5.0, check: Callable[[], None] = ping_database):
+        self.ttl = ttl
+        self.check = check
+        self._lock = threading.Lock()
+        self._ready = False
+        self._error: Optional[str] = None
+        self._checked_at: Optional[float] = None
+
+    def status(self) -> dict:
+        """
+        Obtiene el estado de disponibilidad, ejecutando el chequeo si expiró.
+
+        Si otro hilo ya está ejecutando el chequeo se devuelve el resultado
+        anterior en lugar de esperar.
+
+        Returns:
+            dict: ready, error (nombre de la excepción) y age (segundos desde el chequeo)
+        """
+        if self._expired():
+            # Solo se espera al lock cuando todavía no hay ningún resultado
+            if self._lock.acquire(blocking=self._checked_at is None):
+                try:
+                    if self._expired():
+                        self._run_check()
+                finally:
+                    self._lock.release()
+
+        return {
+            "ready": self._ready,
+            "error": self._error,
+            "age": round(time.monotonic() - self._checked_at, 3),
+        }
+
+    def _expired(self) -> bool:
+        return self._checked_at is None or time.monotonic() - self._checked_at >= self.ttl
+
+    def _run_check(self) -> None:
+        try:
+            self.check()
+            self._ready, self._error = True, None
+        except Exception as e:
+            self._ready, self._error = False, type(e).__name__
+        self._checked_at = time.monotonic()
+
+
+def init_readiness(app) -> ReadinessProbe:
+    """
+    Registra el chequeo de disponibilidad en la aplicación.
+
+    Args:
+        app: Aplicación Flask
+
+    Returns:
+        ReadinessProbe: Chequeo registrado en `app.extensions["readiness"]`
+    """
+    probe = ReadinessProbe(ttl=app.config["READINESS_CACHE_TTL"])
+    app.extensions["readiness"] = probe
+    return probe
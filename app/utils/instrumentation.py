@@ -0,0 +1,107 @@
+"""
+Instrumentación por petición: sentencias SQL, tiempo de BD, de templates y total.
+
+Se habilita con `REQUEST_TIMING_ENABLED`. Los tiempos se acumulan en `flask.g`
+durante la petición y al final se publican en la cabecera `Server-Timing`
+(visible en las herramientas de desarrollo del navegador) y en una línea de
+log JSON por petición.
+
+Example:
+    Server-Timing: db;dur=3.2;desc="4 queries", tpl;dur=1.8, total;dur=7.5
+"""
+
+import json
+import logging
+import time
+
+from flask import Flask, current_app, g, has_request_context, request, template_rendered
+from flask.signals import before_render_template
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def _on_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["_timing_start"] = time.perf_counter()
+
+
+def _on_after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Sin inicio si el listener se registró a mitad de una sentencia
+    start = conn.info.pop("_timing_start", None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    if has_request_context() and "_timing" in g:
+        g._timing["queries"] += 1
+        g._timing["db"] += elapsed
+
+
+def _on_before_render_template(sender, template, context, **extra):
+    if "_timing" in g:
+        g._timing["_tpl_start"] = time.perf_counter()
+
+
+def _on_template_rendered(sender, template, context, **extra):
+    timing = g.get("_timing")
+    if timing and "_tpl_start" in timing:
+        timing["tpl"] += time.perf_counter() - timing.pop("_tpl_start")
+
+
+def _start_timer() -> None:
+    g._timing = {"start": time.perf_counter(), "queries": 0, "db": 0.0, "tpl": 0.0}
+
+
+def _emit_timing(response):
+    timing = g.pop("_timing", None)
+    if timing is None:
+        return response
+
+    total = time.perf_counter() - timing["start"]
+    db_ms, tpl_ms, total_ms = timing["db"] * 1000, timing["tpl"] * 1000, total * 1000
+
+    response.headers.add(
+        "Server-Timing",
+        f'db;dur={db_ms:.1f};desc="{timing["queries"]} queries", '
+        f"tpl;dur={tpl_ms:.1f}, total;dur={total_ms:.1f}",
+    )
+    current_app.logger.getChild("timing").info(json.dumps({
+        "method": request.method,
+        "path": request.path,
+        "endpoint": request.endpoint,
+        "status": response.status_code,
+        "queries": timing["queries"],
+        "db_ms": round(db_ms, 2),
+        "template_ms": round(tpl_ms, 2),
+        "total_ms": round(total_ms, 2),
+    }))
+    return response
+
+
+def init_instrumentation(app: Flask, engine: Engine) -> None:
+    """
+    Registra los hooks de medición si `REQUEST_TIMING_ENABLED` está activo.
+
+    Args:
+        app: Aplicación Flask
+        engine: Engine principal cuyas sentencias se cuentan (también se
+            cuentan las de las réplicas de `init_replicas`)
+    """
+    if not app.config["REQUEST_TIMING_ENABLED"]:
+        return
+
+    # La principal y las réplicas de lectura; una vez por motor aunque se cree otra app
+    replicas = app.extensions.get("replicas")
+    for target in [engine, *(replicas.engines if replicas else [])]:
+        if not event.contains(target, "before_cursor_execute", _on_before_cursor_execute):
+            event.listen(target, "before_cursor_execute", _on_before_cursor_execute)
+            event.listen(target, "after_cursor_execute", _on_after_cursor_execute)
+    before_render_template.connect(_on_before_render_template, app)
+    template_rendered.connect(_on_template_rendered, app)
+
+    # Primer before_request y último after_request (se ejecutan en orden inverso):
+    # el total incluye los demás hooks de la aplicación
+    app.before_request_funcs.setdefault(None, []).insert(0, _start_timer)
+    app.after_request_funcs.setdefault(None, []).insert(0, _emit_timing)
+
+    logger = app.logger.getChild("timing")
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
@@ -0,0 +1,156 @@
+"""
+Utilidades de paginación por cursor (keyset) para los catálogos.
+
+La paginación keyset filtra por la llave primaria (`WHERE id > :after`) en lugar
+de usar OFFSET, por lo que el costo de cada página se mantiene constante sin
+importar el tamaño de la tabla ni la profundidad de la página.
+"""
+
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Select
+from werkzeug.datastructures import MultiDict
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class Page:
+    """
+    Página de resultados obtenida por paginación keyset.
+
+    Attributes:
+        items: Registros de la página en orden ascendente por llave.
+        limit: Tamaño de página solicitado.
+        next_cursor: Llave a usar como `after` para la siguiente página.
+        prev_cursor: Llave a usar como `before` para la página anterior.
+    """
+
+    __slots__ = ("items", "limit", "next_cursor", "prev_cursor")
+
+    def __init__(
+        self,
+        items: Sequence[Any],
+        limit: int,
+        next_cursor: Optional[int] = None,
+        prev_cursor: Optional[int] = None,
+    ):
+        self.items = items
+        self.limit = limit
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    @property
+    def has_next(self) -> bool:
+        """Indica si existe una página siguiente."""
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        """Indica si existe una página anterior."""
+        return self.prev_cursor is not None
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """
+    Normaliza el tamaño de página solicitado.
+
+    Args:
+        limit: Tamaño solicitado (puede ser None o inválido)
+
+    Returns:
+        int: Tamaño de página entre 1 y MAX_PAGE_SIZE
+    """
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def parse_page_args(args: MultiDict) -> tuple[Optional[int], Optional[int], int]:
+    """
+    Obtiene los parámetros de paginación de la query string.
+
+    Args:
+        args: Argumentos de la petición (`request.args`)
+
+    Returns:
+        tuple: (after, before, limit)
+    """
+    after = args.get("after", type=int)
+    before = args.get("before", type=int)
+    limit = clamp_limit(args.get("limit", type=int))
+    return after, before, limit
+
+
+def keyset_select(
+    stmt: Select,
+    key: Any,
+    after: Optional[int] = None,
+    before: Optional[int] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Select:
+    """
+    Aplica el filtro y orden keyset a una consulta.
+
+    Se solicita un registro extra (`limit + 1`) para saber si existe otra
+    página en la misma dirección sin ejecutar un COUNT.
+
+    Args:
+        stmt: Consulta base (con los filtros del catálogo)
+        key: Columna llave usada como cursor (llave primaria)
+        after: Devuelve los registros con llave mayor a este valor
+        before: Devuelve los registros con llave menor a este valor
+        limit: Tamaño de página
+
+    Returns:
+        Select: Consulta paginada
+    """
+    if before is not None:
+        stmt = stmt.where(key < before).order_by(key.desc())
+    else:
+        if after is not None:
+            stmt = stmt.where(key > after)
+        stmt = stmt.order_by(key.asc())
+    return stmt.limit(limit + 1)
+
+
+def build_page(
+    rows: Sequence[Any],
+    key_attr: str,
+    after: Optional[int] = None,
+    before: Optional[int] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Page:
+    """
+    Construye una `Page` a partir del resultado de `keyset_select`.
+
+    Args:
+        rows: Registros obtenidos (hasta `limit + 1`)
+        key_attr: Nombre del atributo llave en cada registro
+        after: Cursor `after` usado en la consulta
+        before: Cursor `before` usado en la consulta
+        limit: Tamaño de página
+
+    Returns:
+        Page: Página con sus cursores de navegación
+    """
+    items = list(rows)
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    if before is not None:
+        # La consulta hacia atrás viene en orden descendente
+        items.reverse()
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = after is not None, has_more
+
+    if not items:
+        return Page(items, limit)
+
+    return Page(
+        items,
+        limit,
+        next_cursor=getattr(items[-1], key_attr) if has_next else None,
+        prev_cursor=getattr(items[0], key_attr) if has_prev else None,
+    )
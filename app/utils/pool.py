@@ -0,0 +1,148 @@
+"""
+Métricas del pool de conexiones a la base de datos.
+
+El tamaño, timeout, reciclado y pre-ping del pool se configuran en
+`Config.SQLALCHEMY_ENGINE_OPTIONS`. `PoolMetrics` se basa solo en los eventos
+del pool (connect, close, invalidate, checkout, checkin):
+
+- Tiempo de retención: cuánto tiempo queda prestada cada conexión, desde el
+  evento checkout hasta el checkin. Retenciones largas son las que hacen
+  esperar a las demás peticiones cuando el pool se llena.
+- Saturación: en cada checkout de un `QueuePool` se toma `checkedout()`; se
+  guarda el máximo alcanzado y cuántos checkouts ocuparon la última conexión
+  disponible (`pool_size + max_overflow`), a partir de los cuales la siguiente
+  petición tiene que esperar.
+"""
+
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+# Llave en `ConnectionPoolEntry.info` con el instante del checkout
+_CHECKOUT_AT = "metrics_checkout_at"
+
+
+class PoolMetrics:
+    """
+    Contadores de actividad del pool de conexiones de un engine.
+
+    Attributes:
+        engine: Engine instrumentado.
+        connects: Conexiones DBAPI abiertas.
+        disconnects: Conexiones DBAPI cerradas.
+        invalidations: Conexiones invalidadas (ej. pre-ping fallido).
+        checkouts: Conexiones entregadas por el pool.
+        checkins: Conexiones devueltas al pool.
+        peak_checked_out: Máximo de conexiones prestadas a la vez.
+        saturated_checkouts: Checkouts que dejaron el pool sin conexiones libres.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.connects = 0
+        self.disconnects = 0
+        self.invalidations = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.peak_checked_out = 0
+        self.saturated_checkouts = 0
+        self.hold_total = 0.0
+        self.hold_max = 0.0
+        self._holds = 0
+        self._lock = threading.Lock()
+
+        # Los eventos registrados en el engine se conservan al recrear el pool (dispose)
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "close_detached", self._on_close)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def _incr(self, attr: str) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        self._incr("connects")
+
+    def _on_close(self, dbapi_connection, *args) -> None:
+        self._incr("disconnects")
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        self._incr("invalidations")
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info[_CHECKOUT_AT] = time.perf_counter()
+        pool = self.engine.pool
+        # checkedout() ya incluye la conexión que se está entregando
+        in_use = pool.checkedout() if isinstance(pool, QueuePool) else None
+        with self._lock:
+            self.checkouts += 1
+            if in_use is not None:
+                self.peak_checked_out = max(self.peak_checked_out, in_use)
+                if in_use >= pool.size() + pool._max_overflow:
+                    self.saturated_checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        checkout_at = connection_record.info.pop(_CHECKOUT_AT, None)
+        with self._lock:
+            self.checkins += 1
+            if checkout_at is not None:
+                held = time.perf_counter() - checkout_at
+                self._holds += 1
+                self.hold_total += held
+                if held > self.hold_max:
+                    self.hold_max = held
+
+    def stats(self) -> dict:
+        """
+        Obtiene el estado actual del pool y los contadores acumulados.
+
+        Returns:
+            dict: Ocupación del pool, contadores de eventos y tiempos de retención
+        """
+        pool = self.engine.pool
+        data = {"pool": type(pool).__name__, "status": pool.status()}
+        if isinstance(pool, QueuePool):
+            data.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                max_overflow=pool._max_overflow,
+                timeout=pool.timeout(),
+            )
+        with self._lock:
+            data.update(
+                connects=self.connects,
+                disconnects=self.disconnects,
+                invalidations=self.invalidations,
+                checkouts=self.checkouts,
+                checkins=self.checkins,
+                peak_checked_out=self.peak_checked_out,
+                saturated_checkouts=self.saturated_checkouts,
+                hold_total=round(self.hold_total, 6),
+                hold_max=round(self.hold_max, 6),
+                hold_avg=round(self.hold_total / self._holds, 6) if self._holds else 0.0,
+            )
+        return data
+
+
+def init_pool_metrics(app, engine: Engine) -> PoolMetrics:
+    """
+    Registra las métricas del pool del engine en la aplicación.
+
+    Args:
+        app: Aplicación Flask
+        engine: Engine de SQLAlchemy a instrumentar
+
+    Returns:
+        PoolMetrics: Métricas registradas en `app.extensions["pool_metrics"]`
+    """
+    metrics = PoolMetrics(engine)
+    app.extensions["pool_metrics"] = metrics
+    return metrics
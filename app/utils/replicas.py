@@ -0,0 +1,219 @@
+"""
+Enrutamiento de lecturas a réplicas de la base de datos.
+
+Con `REPLICA_DATABASE_URIS` se crea un motor por réplica (con las mismas
+`SQLALCHEMY_ENGINE_OPTIONS` que la principal) y `RoutingSession` envía los
+`SELECT` de una petición a uno de ellos, elegida por round-robin una vez por
+petición: la versión del catálogo y los datos se leen así de la misma réplica
+y la caché nunca guarda datos más viejos que su versión. Las escrituras,
+los `SELECT ... FOR UPDATE` y todo lo que ocurre fuera de una petición (CLI,
+importaciones) usan la base principal.
+
+Lectura de las propias escrituras: cuando una petición escribe en un
+catálogo, el resto de la petición lee de la principal y la sesión del usuario
+queda fijada a la principal durante `REPLICA_STICKY_SECONDS`.
+
+Una réplica que falla (ping periódico o error de conexión en una consulta)
+se expulsa durante `REPLICA_EJECT_SECONDS`; sin réplicas disponibles las
+lecturas van a la principal.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+from flask import current_app, g, has_request_context, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import Select
+
+from app.signals import catalog_changed
+
+# Llave de la sesión de Flask con el instante (epoch) hasta el que se lee de la principal
+STICKY_SESSION_KEY = "_read_primary_until"
+
+
+class ReplicaSet:
+    """
+    Réplicas de lectura con round-robin y expulsión por salud.
+
+    Attributes:
+        engines: Motores de las réplicas.
+        eject_seconds: Segundos que una réplica fallida queda fuera de la rotación.
+        check_interval: Segundos entre pings de salud de cada réplica.
+        logger: Logger de las expulsiones.
+    """
+
+    def __init__(
+        self,
+        engines: list[Engine],
+        eject_seconds: float = 30.0,
+        check_interval: float = 10.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.engines = list(engines)
+        self.eject_seconds = eject_seconds
+        self.check_interval = check_interval
+        self.logger = logger or logging.getLogger(__name__)
+        self.ejections = 0
+        self._next = 0
+        self._ejected_until: dict[Engine, float] = {}
+        self._checked_at: dict[Engine, float] = {}
+        self._lock = threading.Lock()
+
+    def pick(self) -> Optional[Engine]:
+        """
+        Elige la siguiente réplica disponible.
+
+        Returns:
+            Optional[Engine]: Motor de la réplica o None si ninguna está disponible
+        """
+        if not self.engines:
+            return None
+
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % len(self.engines)
+
+        for offset in range(len(self.engines)):
+            engine = self.engines[(start + offset) % len(self.engines)]
+            if self._available(engine):
+                return engine
+        return None
+
+    def eject(self, engine: Engine) -> None:
+        """Saca una réplica de la rotación durante `eject_seconds`."""
+        with self._lock:
+            already_ejected = self._ejected_until.get(engine, 0.0) > time.monotonic()
+            self._ejected_until[engine] = time.monotonic() + self.eject_seconds
+            if not already_ejected:
+                self.ejections += 1
+        if not already_ejected:
+            self.logger.warning(
+                "Réplica %s expulsada por %.0f s", _display_url(engine), self.eject_seconds
+            )
+
+    def stats(self) -> dict:
+        """
+        Obtiene el estado de las réplicas.
+
+        Returns:
+            dict: Expulsiones y, por réplica, URL (sin contraseña) y segundos
+            restantes de expulsión
+        """
+        now = time.monotonic()
+        return {
+            "ejections": self.ejections,
+            "replicas": [
+                {
+                    "url": _display_url(engine),
+                    "ejected_for": round(max(self._ejected_until.get(engine, 0.0) - now, 0.0), 1),
+                }
+                for engine in self.engines
+            ],
+        }
+
+    def _available(self, engine: Engine) -> bool:
+        now = time.monotonic()
+        if self._ejected_until.get(engine, 0.0) > now:
+            return False
+        if now - self._checked_at.get(engine, float("-inf")) < self.check_interval:
+            return True
+
+        self._checked_at[engine] = now
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except SQLAlchemyError:
+            self.eject(engine)
+            return False
+        return True
+
+
+def _display_url(engine: Engine) -> str:
+    return engine.url.render_as_string(hide_password=True)
+
+
+def read_engine() -> Optional[Engine]:
+    """
+    Obtiene la réplica que usa la petición actual para sus lecturas.
+
+    Returns:
+        Optional[Engine]: Motor de la réplica o None para leer de la principal
+    """
+    if not has_request_context():
+        return None
+    replicas: Optional[ReplicaSet] = current_app.extensions.get("replicas")
+    if replicas is None:
+        return None
+
+    if "_read_engine" not in g:
+        sticky_until = session.get(STICKY_SESSION_KEY, 0)
+        g._read_engine = None if sticky_until > time.time() else replicas.pick()
+    return g._read_engine
+
+
+class RoutingSession(Session):
+    """Sesión de Flask-SQLAlchemy que envía los SELECT de las peticiones a una réplica."""
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, bind: Any = None, **kwargs: Any):
+        if (
+            bind is None
+            and not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            engine = read_engine()
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def init_replicas(app) -> None:
+    """
+    Activa el enrutamiento de lecturas si hay réplicas configuradas.
+
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    uris = app.config["REPLICA_DATABASE_URIS"]
+    if not uris:
+        return
+
+    options = app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {})
+    replica_engines = [create_engine(uri, **options) for uri in uris]
+    replicas = ReplicaSet(
+        replica_engines,
+        eject_seconds=app.config["REPLICA_EJECT_SECONDS"],
+        check_interval=app.config["REPLICA_CHECK_INTERVAL"],
+        logger=app.logger,
+    )
+    app.extensions["replicas"] = replicas
+
+    for engine in replica_engines:
+        # Un error de conexión en una consulta también expulsa la réplica
+        event.listen(engine, "handle_error", _ejector(replicas, engine))
+
+    @app.before_request
+    def _reset_read_engine():
+        g.pop("_read_engine", None)
+
+
+def _ejector(replicas: ReplicaSet, engine: Engine):
+    def handle_error(context) -> None:
+        # Desconexión o error al abrir la conexión; los errores de SQL no expulsan
+        if context.is_disconnect or context.connection is None:
+            replicas.eject(engine)
+
+    return handle_error
+
+
+@catalog_changed.connect
+def _read_own_writes(sender: str, **extra) -> None:
+    if not has_request_context() or "replicas" not in current_app.extensions:
+        return
+    g._read_engine = None
+    session[STICKY_SESSION_KEY] = time.time() + current_app.config["REPLICA_STICKY_SECONDS"]
@@ -0,0 +1,158 @@
+"""
+Serialización JSON precompilada por modelo.
+
+Para cada modelo se construye una sola vez un `ModelSerializer`: un
+`attrgetter` con las columnas públicas, un codificador por tipo de columna y
+las llaves JSON ya codificadas. Cada registro se escribe directo como texto
+JSON, sin construir diccionarios intermedios, por lo que el costo de una
+respuesta grande crece solo con el número de valores.
+
+Funciona igual con instancias del ORM y con filas `Row` de una consulta
+proyectada (ej. `select(Color.id_color, Color.name)`), lo que permite leer
+solo las columnas de un sparse fieldset.
+"""
+
+import json
+from datetime import date
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from sqlalchemy import Boolean, Date, DateTime, Integer
+
+from app.exceptions import ValidationError
+
+# Columnas internas que no se exponen en la API
+PRIVATE_COLUMNS = frozenset({"name_normalized", "created_by", "updated_by", "deleted_by"})
+
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _encode_int(value: Any) -> str:
+    return "null" if value is None else str(int(value))
+
+
+def _encode_bool(value: Any) -> str:
+    return "null" if value is None else ("true" if value else "false")
+
+
+def _encode_temporal(value: Optional[date]) -> str:
+    return "null" if value is None else f'"{value.isoformat()}"'
+
+
+def _encoder_for(column: Any) -> Callable[[Any], str]:
+    """Codificador JSON según el tipo de la columna."""
+    if isinstance(column.type, Boolean):
+        return _encode_bool
+    if isinstance(column.type, Integer):
+        return _encode_int
+    if isinstance(column.type, (DateTime, Date)):
+        return _encode_temporal
+    return _encode_json
+
+
+class ModelSerializer:
+    """
+    Serializador JSON de un conjunto fijo de columnas de un modelo.
+
+    Attributes:
+        model: Modelo SQLAlchemy serializado.
+        fields: Columnas incluidas, en orden de salida.
+    """
+
+    def __init__(self, model: Any, fields: Sequence[str]):
+        self.model = model
+        self.fields = tuple(fields)
+        columns = model.__table__.c
+        getter = attrgetter(*self.fields)
+        # attrgetter con un solo campo devuelve el valor, no una tupla
+        self._values = getter if len(self.fields) > 1 else (lambda obj: (getter(obj),))
+        self._parts = tuple(
+            (('{' if i == 0 else ',') + _encode_json(field) + ":", _encoder_for(columns[field]))
+            for i, field in enumerate(self.fields)
+        )
+        self._subsets: dict[tuple[str, ...], "ModelSerializer"] = {}
+
+    @property
+    def columns(self) -> list:
+        """Columnas del modelo en el orden de `fields` (para consultas proyectadas)."""
+        return [getattr(self.model, field) for field in self.fields]
+
+    def dumps(self, obj: Any) -> str:
+        """
+        Serializa un registro a texto JSON.
+
+        Args:
+            obj: Instancia del modelo o fila con los atributos de `fields`
+
+        Returns:
+            str: Objeto JSON
+        """
+        return "".join(
+            [prefix + encode(value) for (prefix, encode), value in zip(self._parts, self._values(obj))]
+        ) + "}"
+
+    def dumps_many(self, objs: Iterable[Any]) -> str:
+        """
+        Serializa varios registros a un arreglo JSON.
+
+        Args:
+            objs: Instancias o filas
+
+        Returns:
+            str: Arreglo JSON
+        """
+        return "[" + ",".join(map(self.dumps, objs)) + "]"
+
+    def subset(self, requested: Optional[str], always: Sequence[str] = ()) -> "ModelSerializer":
+        """
+        Obtiene el serializador de un sparse fieldset (`?fields=a,b`).
+
+        Los serializadores de cada combinación se compilan una vez y se reutilizan.
+
+        Args:
+            requested: Lista de campos separada por comas (None o vacío = todos)
+            always: Campos que se incluyen siempre (ej. la llave primaria)
+
+        Returns:
+            ModelSerializer: Serializador con los campos pedidos, en el orden del modelo
+
+        Raises:
+            ValidationError: Si se pide un campo inexistente o privado
+        """
+        if not requested:
+            return self
+
+        wanted = {field.strip() for field in requested.split(",") if field.strip()}
+        unknown = wanted.difference(self.fields)
+        if unknown:
+            raise ValidationError(
+                f"Campos desconocidos: {', '.join(sorted(unknown))}",
+                payload={"allowed": list(self.fields)},
+            )
+
+        wanted.update(always)
+        key = tuple(field for field in self.fields if field in wanted)
+        serializer = self._subsets.get(key)
+        if serializer is None:
+            serializer = self._subsets[key] = ModelSerializer(self.model, key)
+        return serializer
+
+
+_serializers: dict[Any, ModelSerializer] = {}
+
+
+def get_serializer(model: Any) -> ModelSerializer:
+    """
+    Obtiene el serializador precompilado de un modelo con sus columnas públicas.
+
+    Args:
+        model: Modelo SQLAlchemy
+
+    Returns:
+        ModelSerializer: Serializador compartido del modelo
+    """
+    serializer = _serializers.get(model)
+    if serializer is None:
+        fields = [c.key for c in model.__table__.columns if c.key not in PRIVATE_COLUMNS]
+        serializer = _serializers[model] = ModelSerializer(model, fields)
+    return serializer
@@ -0,0 +1,27 @@
+"""
+Utilidades de normalización de texto.
+"""
+
+import unicodedata
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normaliza un nombre para comparaciones sin distinción de mayúsculas ni acentos.
+
+    Recorta y colapsa espacios, elimina acentos y convierte a minúsculas.
+
+    Args:
+        name: Nombre original
+
+    Returns:
+        str: Nombre normalizado
+
+    Example:
+        >>> normalize_name("  Caoba   Rojiza ")
+        'caoba rojiza'
+        >>> normalize_name("NOGAL ÁMBAR")
+        'nogal ambar'
+    """
+    decomposed = unicodedata.normalize("NFKD", " ".join(name.split()))
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
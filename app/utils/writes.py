@@ -0,0 +1,47 @@
+"""
+Escrituras de un registro que devuelven la fila escrita.
+
+Las fechas de auditoría (`created_at`, `updated_at`, `deleted_at`) las asigna
+el reloj de la base de datos, igual que los `server_default` de los modelos y
+las filas que insertan la importación y el seeder; la fila escrita se obtiene
+con `RETURNING` cuando el dialecto lo soporta, sin recargar la instancia.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+
+from app.extensions import db
+
+
+def execute_returning(stmt: Any, model: Any, pk_column: Any, pk: Any = None) -> Optional[Row]:
+    """
+    Ejecuta un INSERT o UPDATE de un registro y devuelve la fila completa escrita.
+
+    Con `RETURNING` (SQLite, PostgreSQL; MariaDB solo en INSERT) es una sola
+    sentencia. Sin él (MySQL) la fila se lee por su llave con la conexión de
+    la transacción: siempre de la base principal, nunca de una réplica.
+
+    Args:
+        stmt: INSERT o UPDATE de un solo registro
+        model: Modelo del catálogo
+        pk_column: Columna llave primaria
+        pk: ID del registro (requerido para UPDATE)
+
+    Returns:
+        Optional[Row]: Fila con todas las columnas de la tabla o None si el
+        UPDATE no afectó ningún registro
+    """
+    table = model.__table__
+    connection = db.session.connection()
+    dialect = connection.dialect
+    if dialect.insert_returning if stmt.is_insert else dialect.update_returning:
+        return db.session.execute(stmt.returning(*table.c)).first()
+
+    result = db.session.execute(stmt)
+    if stmt.is_insert:
+        pk = result.inserted_primary_key[0]
+    elif result.rowcount == 0:
+        return None
+    return connection.execute(select(table).where(pk_column == pk)).first()
@@ -0,0 +1,9 @@
+"""
+Punto de entrada ASGI (opcional): lecturas de la API asíncronas, resto en Flask.
+
+    uvicorn asgi:app --workers 2
+"""
+
+from app.asgi import create_asgi_app
+
+app = create_asgi_app()
@@ -0,0 +1,7 @@
+"""
+Benchmarks de las rutas de catálogos.
+
+Ejecutar desde la raíz del proyecto:
+
+    python -m benchmarks.run --rows 1000 100000 1000000 --output results.json
+"""
@@ -0,0 +1,103 @@
+"""
+Driver multi-hilo y estadísticas de latencia.
+
+Cada hilo usa su propio cliente de pruebas de Flask (sin cookies, para que los
+mensajes flash no se acumulen en la sesión) y registra la latencia de cada
+petición.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from flask import Flask
+from flask.testing import FlaskClient
+
+# Una operación recibe el cliente del hilo y devuelve la respuesta
+Operation = Callable[[FlaskClient], object]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """
+    Percentil por rango más cercano de una lista ordenada.
+
+    Args:
+        sorted_values: Valores ordenados ascendentemente
+        pct: Percentil entre 0 y 100
+
+    Returns:
+        float: Valor del percentil (0.0 si la lista está vacía)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def run_operation(
+    app: Flask,
+    operation: Operation,
+    requests: int,
+    threads: int,
+    warmup: int = 10,
+    ok_status: tuple = (200, 302),
+) -> dict:
+    """
+    Ejecuta `operation` `requests` veces repartidas entre `threads` hilos.
+
+    Args:
+        app: Aplicación Flask
+        operation: Operación a medir
+        requests: Número total de peticiones medidas
+        threads: Número de hilos concurrentes
+        warmup: Peticiones previas sin medir
+        ok_status: Códigos de estado considerados exitosos
+
+    Returns:
+        dict: Peticiones, errores, throughput (req/s) y latencias en ms
+    """
+    warm_client = app.test_client(use_cookies=False)
+    for _ in range(warmup):
+        operation(warm_client)
+
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    per_thread = [requests // threads + (1 if i < requests % threads else 0) for i in range(threads)]
+
+    def worker(count: int) -> None:
+        nonlocal errors
+        client = app.test_client(use_cookies=False)
+        local_latencies, local_errors = [], 0
+        for _ in range(count):
+            start = time.perf_counter()
+            response = operation(client)
+            local_latencies.append(time.perf_counter() - start)
+            if response.status_code not in ok_status:
+                local_errors += 1
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for future in [pool.submit(worker, count) for count in per_thread]:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    ms = [value * 1000 for value in latencies]
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(ms, 50), 3),
+            "p90": round(percentile(ms, 90), 3),
+            "p99": round(percentile(ms, 99), 3),
+            "mean": round(sum(ms) / len(ms), 3) if ms else 0.0,
+            "max": round(ms[-1], 3) if ms else 0.0,
+        },
+    }
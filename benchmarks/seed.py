@@ -0,0 +1,36 @@
+"""
+Carga de datos para los benchmarks.
+
+Completa cada catálogo hasta el tamaño pedido con los registros sintéticos de
+`app.catalogs.seeder` (INSERT multi-fila por lotes), todos activos para que
+las operaciones medidas encuentren siempre registros válidos.
+"""
+
+from sqlalchemy import func, select
+
+from app.catalogs.registry import CATALOGS
+from app.catalogs.seeder import seed_catalog
+from app.extensions import db
+from app.models import CatalogVersion
+
+BATCH_SIZE = 10000
+
+
+def prepare_database(rows: int, seed: int = 42) -> None:
+    """
+    Crea el esquema y pobla los tres catálogos con `rows` registros cada uno.
+
+    Args:
+        rows: Registros por catálogo
+        seed: Semilla de generación de los registros
+    """
+    db.create_all()
+    for name in CATALOGS:
+        if db.session.get(CatalogVersion, name) is None:
+            db.session.add(CatalogVersion(catalog=name, version=0))
+    db.session.commit()
+
+    for spec in CATALOGS.values():
+        existing = db.session.execute(select(func.count()).select_from(spec.model)).scalar_one()
+        if existing < rows:
+            seed_catalog(spec, rows - existing, seed=seed, batch_size=BATCH_SIZE)
@@ -18,6 +18,92 @@ class Config:
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Optional read replicas (comma-separated URIs): request reads go round-robin to
+    # a healthy replica; writes, and reads right after a user's write, use the primary
+    REPLICA_DATABASE_URIS = [
+        uri.strip() for uri in os.getenv("REPLICA_DATABASE_URIS", "").split(",") if uri.strip()
+    ]
+    REPLICA_EJECT_SECONDS = float(os.getenv("REPLICA_EJECT_SECONDS", "30"))
+    REPLICA_CHECK_INTERVAL = float(os.getenv("REPLICA_CHECK_INTERVAL", "10"))
+    REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "10"))
+
+    # Audit trail: audit_log rows are queued and written in background batches (the
+    # writer thread starts on the first write). *_by columns and audit_log.actor take
+    # the user from AUDIT_ACTOR_HEADER; empty = no actor. The client controls request
+    # headers, so set it only behind a proxy that authenticates and overwrites it
+    AUDIT_ENABLED = os.getenv("AUDIT_ENABLED", "true").lower() == "true"
+    AUDIT_ACTOR_HEADER = os.getenv("AUDIT_ACTOR_HEADER", "")
+    AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "200"))
+    AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", "1"))
+    AUDIT_QUEUE_MAXSIZE = int(os.getenv("AUDIT_QUEUE_MAXSIZE", "10000"))
+
+    # Server-Sent Events at /events/catalogs: replay buffer for Last-Event-ID and timings.
+    # Each open stream holds a request thread for its whole life, also under asgi.py
+    # (Flask runs in the WsgiToAsgi executor), so streams per process are capped at
+    # EVENTS_MAX_SUBSCRIBERS and at EVENTS_THREAD_SHARE of WORKER_THREADS; the other
+    # threads stay free for pages and the API
+    EVENTS_ENABLED = os.getenv("EVENTS_ENABLED", "true").lower() == "true"
+    EVENTS_BUFFER_SIZE = int(os.getenv("EVENTS_BUFFER_SIZE", "1000"))
+    EVENTS_MAX_SUBSCRIBERS = int(os.getenv("EVENTS_MAX_SUBSCRIBERS", "100"))
+    EVENTS_THREAD_SHARE = float(os.getenv("EVENTS_THREAD_SHARE", "0.5"))
+    EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", "100"))
+    EVENTS_POLL_INTERVAL = float(os.getenv("EVENTS_POLL_INTERVAL", "2"))
+    EVENTS_HEARTBEAT_INTERVAL = float(os.getenv("EVENTS_HEARTBEAT_INTERVAL", "15"))
+
+    # Request threads per worker process: must match gunicorn --threads; asgi.py sizes
+    # its WsgiToAsgi executor with it
+    WORKER_THREADS = int(os.getenv("WORKER_THREADS", "8"))
+
+    # Async driver URL for asgi.py; empty = SQLALCHEMY_DATABASE_URI with its async driver
+    ASYNC_DATABASE_URI = os.getenv("ASYNC_DATABASE_URI", "")
+
+    # Connection pool; recycle below MySQL's wait_timeout and pre-ping to avoid
+    # "server has gone away" after idle periods
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "280")),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
+
+    # In-process cache for catalog reads (see app/utils/cache.py)
+    CATALOG_CACHE_ENABLED = os.getenv("CATALOG_CACHE_ENABLED", "true").lower() == "true"
+    CATALOG_CACHE_MAXSIZE = int(os.getenv("CATALOG_CACHE_MAXSIZE", "128"))
+    CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "60"))
+    CATALOG_CACHE_MAX_ROWS = int(os.getenv("CATALOG_CACHE_MAX_ROWS", "20000"))
+
+    # Rendered list-table rows, keyed by catalog version and page (see app/utils/fragments.py)
+    FRAGMENT_CACHE_ENABLED = os.getenv("FRAGMENT_CACHE_ENABLED", "true").lower() == "true"
+    FRAGMENT_CACHE_MAXSIZE = int(os.getenv("FRAGMENT_CACHE_MAXSIZE", "256"))
+    FRAGMENT_CACHE_TTL = float(os.getenv("FRAGMENT_CACHE_TTL", "300"))
+    FRAGMENT_CACHE_MAX_CHARS = int(os.getenv("FRAGMENT_CACHE_MAX_CHARS", "8000000"))
+
+    # Seconds between shared-version checks of the /<catalog>/suggest indexes
+    SUGGEST_REFRESH_INTERVAL = float(os.getenv("SUGGEST_REFRESH_INTERVAL", "5"))
+
+    # gzip/brotli response compression and precompressed static files
+    COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "true").lower() == "true"
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "500"))
+    COMPRESS_LEVEL = int(os.getenv("COMPRESS_LEVEL", "6"))
+    COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", "5"))
+    COMPRESS_STATIC = os.getenv("COMPRESS_STATIC", "true").lower() == "true"
+
+    # Jinja bytecode cache directory (empty = disabled) and template warm-up at startup
+    TEMPLATE_BYTECODE_CACHE_DIR = os.getenv("TEMPLATE_BYTECODE_CACHE_DIR", "")
+    TEMPLATE_PRECOMPILE = os.getenv("TEMPLATE_PRECOMPILE", "false").lower() == "true"
+
+    # Seconds /readyz reuses the last database ping
+    READINESS_CACHE_TTL = float(os.getenv("READINESS_CACHE_TTL", "5"))
+
+    # Per-request SQL/template timing in Server-Timing headers and logs
+    REQUEST_TIMING_ENABLED = os.getenv("REQUEST_TIMING_ENABLED", "false").lower() == "true"
+
+    # Internal diagnostic endpoints (/internal/...): unauthenticated and they expose
+    # cache, pool and replica details (hosts, database names), so they are opt-in;
+    # enable them only where /internal is not reachable from outside
+    INTERNAL_ENDPOINTS_ENABLED = os.getenv("INTERNAL_ENDPOINTS_ENABLED", "false").lower() == "true"
+
     # SECRET_KEY is required for session management and CSRF protection
     SECRET_KEY = os.getenv("SECRET_KEY")
     if not SECRET_KEY:
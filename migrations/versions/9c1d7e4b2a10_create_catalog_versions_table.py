@@ -0,0 +1,34 @@
+"""create catalog_versions table
+
+Revision ID: 9c1d7e4b2a10
+Revises: 6067bf0c7322
+Create Date: 2026-10-16 10:12:41.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c1d7e4b2a10'
+down_revision = '6067bf0c7322'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    catalog_versions = op.create_table('catalog_versions',
+    sa.Column('catalog', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.PrimaryKeyConstraint('catalog')
+    )
+    op.bulk_insert(catalog_versions, [
+        {'catalog': 'colors', 'version': 0},
+        {'catalog': 'roles', 'version': 0},
+        {'catalog': 'wood_types', 'version': 0},
+    ])
+
+
+def downgrade():
+    op.drop_table('catalog_versions')
@@ -0,0 +1,86 @@
+"""add name_normalized to catalogs
+
+Revision ID: b3f58a0e6d21
+Revises: 9c1d7e4b2a10
+Create Date: 2026-10-16 12:40:05.902114
+
+"""
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f58a0e6d21'
+down_revision = '9c1d7e4b2a10'
+branch_labels = None
+depends_on = None
+
+# (tabla, llave primaria, longitud de name_normalized)
+CATALOG_TABLES = [
+    ('colors', 'id_color', 100),
+    ('roles', 'id_role', 100),
+    ('wood_types', 'id_wood_type', 200),
+]
+
+BATCH_SIZE = 1000
+
+
+def normalize_name(name):
+    # Copia congelada de app.utils.text.normalize_name
+    decomposed = unicodedata.normalize('NFKD', ' '.join(name.split()))
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def backfill(table_name, pk):
+    conn = op.get_bind()
+    table = sa.table(table_name, sa.column(pk), sa.column('name'), sa.column('name_normalized'))
+
+    seen = {}
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(table.c[pk], table.c.name)
+            .where(table.c[pk] > last_id)
+            .order_by(table.c[pk])
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        params = []
+        for row_id, name in rows:
+            normalized = normalize_name(name)
+            if normalized in seen:
+                raise RuntimeError(
+                    f"{table_name}: los registros {seen[normalized]} y {row_id} "
+                    f"tienen el mismo nombre normalizado '{normalized}'; "
+                    "resolver el duplicado antes de migrar"
+                )
+            seen[normalized] = row_id
+            params.append({'b_id': row_id, 'b_normalized': normalized})
+
+        conn.execute(
+            table.update()
+            .where(table.c[pk] == sa.bindparam('b_id'))
+            .values(name_normalized=sa.bindparam('b_normalized')),
+            params,
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    for table_name, pk, length in CATALOG_TABLES:
+        op.add_column(table_name, sa.Column('name_normalized', sa.String(length=length), nullable=True))
+        backfill(table_name, pk)
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.alter_column('name_normalized', existing_type=sa.String(length=length), nullable=False)
+            batch_op.create_index(f'ix_{table_name}_name_normalized', ['name_normalized'], unique=True)
+
+
+def downgrade():
+    for table_name, _, length in reversed(CATALOG_TABLES):
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_index(f'ix_{table_name}_name_normalized')
+            batch_op.drop_column('name_normalized')
@@ -0,0 +1,35 @@
+"""create audit_log table
+
+Revision ID: d41c8f2a7e35
+Revises: b3f58a0e6d21
+Create Date: 2026-10-16 16:05:27.311842
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41c8f2a7e35'
+down_revision = 'b3f58a0e6d21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('audit_log',
+    sa.Column('id_audit_log', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+    sa.Column('catalog', sa.String(length=50), nullable=False),
+    sa.Column('action', sa.String(length=20), nullable=False),
+    sa.Column('record_id', sa.Integer(), nullable=True),
+    sa.Column('affected', sa.Integer(), nullable=False),
+    sa.Column('actor', sa.String(length=100), nullable=True),
+    sa.Column('created_at', sa.TIMESTAMP(), nullable=False),
+    sa.PrimaryKeyConstraint('id_audit_log')
+    )
+    op.create_index('ix_audit_log_catalog_record', 'audit_log', ['catalog', 'record_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_audit_log_catalog_record', table_name='audit_log')
+    op.drop_table('audit_log')
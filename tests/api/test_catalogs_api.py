@@ -0,0 +1,94 @@
+"""
+Tests de la API JSON de catálogos (/api/v1/<catalog>).
+"""
+
+import pytest
+
+pytestmark = pytest.mark.usefixtures("catalog_data")
+
+
+def test_list_colors_returns_page_with_links(client):
+    """Test: GET /api/v1/colors devuelve registros activos, metadatos y enlaces."""
+    response = client.get("/api/v1/colors?limit=1")
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [item["name"] for item in body["data"]] == ["Rojo"]
+    assert body["meta"] == {"limit": 1, "next_cursor": None, "prev_cursor": None}
+
+
+def test_list_colors_sparse_fieldset_keeps_primary_key(client, max_queries):
+    """Test: ?fields=name devuelve solo el nombre y la llave primaria en una consulta de página."""
+    with max_queries(3):
+        response = client.get("/api/v1/colors?fields=name")
+
+    assert response.get_json()["data"] == [{"id_color": 1, "name": "Rojo"}]
+
+
+def test_list_with_unknown_field_returns_400(client):
+    """Test: ?fields con un campo privado o inexistente responde 400 en JSON."""
+    response = client.get("/api/v1/roles?fields=name_normalized")
+
+    assert response.status_code == 400
+    assert response.get_json()["success"] is False
+
+
+def test_get_wood_type_serializes_dates_as_iso(client):
+    """Test: GET /api/v1/wood-types/1 devuelve fechas ISO 8601."""
+    data = client.get("/api/v1/wood-types/1").get_json()["data"]
+
+    assert data["description"] == "Madera suave"
+    assert isinstance(data["created_at"], str)
+    assert data["deleted_at"] is None
+
+
+def test_create_role_returns_201_with_location(client):
+    """Test: POST /api/v1/roles crea el registro y devuelve Location."""
+    response = client.post("/api/v1/roles", json={"name": "Supervisor"})
+
+    assert response.status_code == 201
+    assert response.headers["Location"].endswith(f"/api/v1/roles/{response.get_json()['data']['id_role']}")
+
+
+def test_write_responses_are_the_full_record(client):
+    """Test: POST y PUT devuelven el registro completo, igual que GET /api/v1/<catalog>/<id>."""
+    created = client.post("/api/v1/wood-types", json={"name": "Roble"}).get_json()["data"]
+    assert created == client.get("/api/v1/wood-types/3").get_json()["data"]
+    assert set(created) == {
+        "id_wood_type", "name", "description", "active", "created_at", "updated_at", "deleted_at"
+    }
+
+    response = client.put("/api/v1/wood-types/3", json={"name": "Roble", "description": "Dura"})
+    updated = response.get_json()["data"]
+    assert updated == client.get("/api/v1/wood-types/3").get_json()["data"]
+    assert (updated["description"], updated["created_at"]) == ("Dura", created["created_at"])
+
+
+def test_create_duplicate_returns_409(client):
+    """Test: POST /api/v1/colors con nombre duplicado responde 409."""
+    response = client.post("/api/v1/colors", json={"name": "ROJO"})
+
+    assert response.status_code == 409
+
+
+def test_create_requires_json_body(client):
+    """Test: POST /api/v1/colors con un formulario responde 415."""
+    response = client.post("/api/v1/colors", data={"name": "Verde"})
+
+    assert response.status_code == 415
+
+
+def test_update_missing_wood_type_returns_404(client):
+    """Test: PUT /api/v1/wood-types/99 responde 404 en JSON."""
+    response = client.put("/api/v1/wood-types/99", json={"name": "Roble"})
+
+    assert response.status_code == 404
+    assert response.get_json()["error"]["code"] == 404
+
+
+def test_delete_color_then_list_deleted(client):
+    """Test: DELETE /api/v1/colors/1 lo mueve a ?deleted=1."""
+    assert client.delete("/api/v1/colors/1").status_code == 204
+
+    names = [item["name"] for item in client.get("/api/v1/colors?deleted=1").get_json()["data"]]
+    assert names == ["Rojo", "Azul"]
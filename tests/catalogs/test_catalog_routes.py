@@ -0,0 +1,217 @@
+"""
+Tests de las rutas HTML de los catálogos (colores, roles y tipos de madera).
+
+Cada prueba corre para todos los catálogos de `CATALOGS`. Los presupuestos
+fijan el máximo de sentencias que emite una ruta con la caché de catálogos
+deshabilitada; una consulta extra (N+1, búsqueda redundante) las hace fallar.
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.api.services import SERVICES
+from app.catalogs.registry import CATALOGS
+from app.extensions import db
+
+pytestmark = pytest.mark.usefixtures("catalog_data")
+
+# Datos de cada catálogo; `catalog_data` deja el ID 1 activo y el 2 eliminado
+CASES = {
+    "colors": {
+        "url": "/colors",
+        "new": {"name": "Verde"},
+        "duplicate": "rojo",
+        "rename": {"name": "Rojo oscuro"},
+        "missing_edit_status": 302,
+    },
+    "roles": {
+        "url": "/roles",
+        "new": {"name": "Supervisor"},
+        "duplicate": "administrador",
+        "rename": {"name": "Administrador general"},
+        "missing_edit_status": 302,
+    },
+    "wood_types": {
+        "url": "/wood-types",
+        "new": {"name": "Roble", "description": "Madera dura"},
+        "duplicate": "pino",
+        "rename": {"name": "Pino blanco", "description": "Madera suave"},
+        "missing_edit_status": 404,
+    },
+}
+
+
+@pytest.fixture(params=sorted(CATALOGS))
+def catalog(request):
+    """Catálogo probado con su `CatalogSpec` en `spec`."""
+    return {"spec": CATALOGS[request.param], **CASES[request.param]}
+
+
+def _add(spec, *names: str) -> None:
+    db.session.add_all(spec.model(name=name) for name in names)
+    db.session.commit()
+
+
+def _active(spec) -> dict[int, bool]:
+    rows = db.session.execute(select(spec.pk_column, spec.model.active)).all()
+    return dict(rows)
+
+
+# Presupuestos de consultas
+
+
+def test_list_query_budget(client, max_queries, catalog):
+    """Test: la lista consulta versión, validador y página."""
+    with max_queries(3):
+        response = client.get(f"{catalog['url']}/")
+    assert response.status_code == 200
+
+
+def test_list_query_count_does_not_grow_with_rows(client, max_queries, catalog):
+    """Test: la lista no emite una consulta por registro."""
+    _add(catalog["spec"], *(f"Registro {i}" for i in range(30)))
+
+    with max_queries(3):
+        response = client.get(f"{catalog['url']}/")
+    assert response.status_code == 200
+
+
+def test_list_deleted_query_budget(client, max_queries, catalog):
+    """Test: la lista de eliminados consulta versión, validador y página."""
+    with max_queries(3):
+        response = client.get(f"{catalog['url']}/?deleted=1")
+    assert response.status_code == 200
+
+
+def test_list_not_modified_query_budget(client, max_queries, catalog):
+    """Test: con If-None-Match vigente se responde 304 sin leer la página."""
+    etag = client.get(f"{catalog['url']}/").headers["ETag"]
+
+    with max_queries(2):
+        response = client.get(f"{catalog['url']}/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_export_query_budget(client, max_queries, catalog, fmt):
+    """Test: la exportación lee los registros en una sola consulta."""
+    with max_queries(1):
+        response = client.get(f"{catalog['url']}/export?format={fmt}")
+        response.get_data()
+    assert response.status_code == 200
+
+
+def test_create_form_query_budget(client, max_queries, catalog):
+    """Test: el formulario de alta no consulta la base de datos."""
+    with max_queries(0):
+        response = client.get(f"{catalog['url']}/create")
+    assert response.status_code == 200
+
+
+def test_create_query_budget(client, max_queries, catalog):
+    """Test: el alta emite el INSERT y el incremento de versión."""
+    with max_queries(2):
+        response = client.post(f"{catalog['url']}/create", data=catalog["new"])
+    assert response.status_code == 302
+
+
+def test_create_duplicate_query_budget(client, max_queries, catalog):
+    """Test: un nombre duplicado solo intenta el INSERT."""
+    with max_queries(1):
+        response = client.post(f"{catalog['url']}/create", data={"name": catalog["duplicate"]})
+    assert response.status_code == 200
+
+
+def test_edit_form_query_budget(client, max_queries, catalog):
+    """Test: el formulario de edición carga el registro una sola vez."""
+    with max_queries(1):
+        response = client.get(f"{catalog['url']}/1/edit")
+    assert response.status_code == 200
+
+
+def test_edit_not_found_query_budget(client, max_queries, catalog):
+    """Test: editar un ID inexistente responde tras buscar el registro."""
+    with max_queries(2):
+        response = client.get(f"{catalog['url']}/99/edit")
+    assert response.status_code == catalog["missing_edit_status"]
+
+
+def test_update_query_budget(client, max_queries, catalog):
+    """Test: la edición emite el UPDATE y el incremento de versión."""
+    with max_queries(2):
+        response = client.post(f"{catalog['url']}/1/edit", data=catalog["rename"])
+    assert response.status_code == 302
+
+
+def test_delete_query_budget(client, max_queries, catalog):
+    """Test: eliminar emite el UPDATE y el incremento de versión."""
+    with max_queries(2):
+        response = client.post(f"{catalog['url']}/1/delete")
+    assert response.status_code == 302
+
+
+def test_delete_not_found_query_budget(client, max_queries, catalog):
+    """Test: eliminar un ID inexistente solo intenta el UPDATE."""
+    with max_queries(1):
+        response = client.post(f"{catalog['url']}/99/delete")
+    assert response.status_code == 302
+
+
+def test_bulk_delete_query_budget(client, max_queries, catalog):
+    """Test: la eliminación masiva emite un UPDATE por lote y el incremento de versión."""
+    with max_queries(2):
+        response = client.post(f"{catalog['url']}/bulk-delete", data={"ids": ["1", "2"]})
+    assert response.status_code == 302
+
+
+def test_bulk_restore_query_budget(client, max_queries, catalog):
+    """Test: la restauración masiva emite un UPDATE por lote y el incremento de versión."""
+    with max_queries(2):
+        response = client.post(f"{catalog['url']}/bulk-restore", data={"ids": ["1", "2"]})
+    assert response.status_code == 302
+
+
+# Comportamiento
+
+
+def test_keyset_pages_link_forward_and_back(client, catalog):
+    """Test: los cursores next/prev recorren las páginas y `after` pasado el final queda vacío."""
+    spec = catalog["spec"]
+    service = SERVICES[spec.name]
+    _add(spec, *(f"Registro {i}" for i in range(3, 8)))
+    # Activos: 1, 3, 4, 5, 6, 7 (el 2 está eliminado)
+
+    first = service.get_page(limit=2)
+    assert [getattr(row, spec.pk) for row in first.items] == [1, 3]
+    assert (first.prev_cursor, first.next_cursor) == (None, 3)
+
+    second = service.get_page(after=first.next_cursor, limit=2)
+    assert [getattr(row, spec.pk) for row in second.items] == [4, 5]
+    assert (second.prev_cursor, second.next_cursor) == (4, 5)
+
+    back = service.get_page(before=second.prev_cursor, limit=2)
+    assert [getattr(row, spec.pk) for row in back.items] == [1, 3]
+    assert back.has_prev is False
+
+    last = service.get_page(after=5, limit=2)
+    assert [getattr(row, spec.pk) for row in last.items] == [6, 7]
+    assert last.has_next is False
+
+    past_end = service.get_page(after=99, limit=2)
+    assert (past_end.items, past_end.has_next) == ([], False)
+    assert client.get(f"{catalog['url']}/?after=99").status_code == 200
+
+
+def test_bulk_delete_and_restore_flip_only_this_catalog(client, catalog):
+    """Test: las operaciones masivas cambian los registros y omiten IDs de otros catálogos."""
+    spec = catalog["spec"]
+    other = next(candidate for candidate in CATALOGS.values() if candidate is not spec)
+    _add(other, "De otro catálogo")
+
+    client.post(f"{catalog['url']}/bulk-delete", data={"ids": ["1", "3"]})
+    assert _active(spec) == {1: False, 2: False}
+    assert _active(other)[3] is True
+
+    client.post(f"{catalog['url']}/bulk-restore", data={"ids": ["1", "2", "3"]})
+    assert _active(spec) == {1: True, 2: True}
+    assert _active(other)[3] is True
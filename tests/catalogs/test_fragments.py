@@ -0,0 +1,69 @@
+"""
+Tests de la caché de fragmentos HTML de las listas de catálogos.
+"""
+
+import re
+
+import pytest
+
+from app import create_app
+from app.catalogs.registry import CATALOGS
+from app.extensions import db
+from app.models import CatalogVersion, Color, Role, WoodType
+from app.utils import fragments
+from conftest import TestConfig
+
+CASES = {
+    "colors": {"url": "/colors", "new": {"name": "Verde"}},
+    "roles": {"url": "/roles", "new": {"name": "Supervisor"}},
+    "wood_types": {"url": "/wood-types", "new": {"name": "Roble", "description": "Madera dura"}},
+}
+
+
+@pytest.fixture
+def fragment_app(monkeypatch):
+    """Aplicación con la caché de fragmentos habilitada y un registro activo por catálogo."""
+    class FragmentConfig(TestConfig):
+        FRAGMENT_CACHE_ENABLED = True
+
+    # Cachés propias de la prueba: las globales del módulo quedan intactas
+    monkeypatch.setattr(fragments, "fragment_caches", {})
+    monkeypatch.setattr(fragments, "_settings", dict(fragments._settings))
+
+    app = create_app(FragmentConfig)
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(
+            CatalogVersion(catalog=name, version=0) for name in ("colors", "roles", "wood_types")
+        )
+        db.session.add_all([
+            Color(name="Rojo"),
+            Role(name="Administrador"),
+            WoodType(name="Pino", description="Madera suave"),
+        ])
+        db.session.commit()
+        yield app
+        db.session.remove()
+
+
+def _rows(response) -> str:
+    # El token CSRF va enmascarado distinto en cada respuesta: se comparan las filas
+    return re.search(r"<tbody>.*</tbody>", response.get_data(as_text=True), re.S).group(0)
+
+
+@pytest.mark.parametrize("name", sorted(CATALOGS))
+def test_list_rows_fragment_is_reused_until_write(fragment_app, name):
+    """Test: las filas se renderizan una vez por página y se vuelven a renderizar tras escribir."""
+    client = fragment_app.test_client()
+    cache = fragments.get_fragment_cache(name)
+    url = f"{CASES[name]['url']}/"
+
+    first = _rows(client.get(url))
+    assert _rows(client.get(url)) == first
+    client.get(f"{url}?deleted=1")
+    assert (cache.stats()["hits"], cache.stats()["misses"], cache.stats()["entries"]) == (1, 2, 2)
+
+    client.post(f"{CASES[name]['url']}/create", data=CASES[name]["new"])
+    assert cache.stats()["entries"] == 0
+    assert CASES[name]["new"]["name"] in client.get(url).get_data(as_text=True)
+    assert cache.stats()["misses"] == 3
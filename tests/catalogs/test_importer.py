@@ -0,0 +1,107 @@
+"""
+Tests de la importación masiva de catálogos.
+"""
+
+import csv
+import io
+
+from sqlalchemy import select
+
+from app.catalogs.importer import CatalogImporter, read_records
+from app.catalogs.registry import get_catalog
+from app.extensions import db
+from app.models import Color, WoodType
+from app.utils.catalog_versions import get_version
+
+
+def _import(catalog: str, content: str, fmt: str, **options):
+    """Importa `content` y devuelve el resumen y las filas del reporte."""
+    report = io.StringIO()
+    importer = CatalogImporter(get_catalog(catalog), report, **options)
+    result = importer.run(read_records(io.StringIO(content), fmt))
+    rows = list(csv.DictReader(io.StringIO(report.getvalue())))
+    return result, rows
+
+
+def _names(model) -> list[str]:
+    return list(db.session.execute(select(model.name).order_by(model.name)).scalars())
+
+
+def test_import_inserts_valid_batch(app):
+    """Test: un CSV válido se inserta completo e incrementa la versión del catálogo."""
+    result, report = _import("colors", "name\nRojo\nVerde\nAzul\n", "csv", batch_size=2)
+
+    assert (result.read, result.inserted, result.duplicates, result.rejected) == (3, 3, 0, 0)
+    assert report == []
+    assert _names(Color) == ["Azul", "Rojo", "Verde"]
+    assert get_version("colors") == 2
+
+
+def test_import_reports_duplicates_in_batch_and_database(app, catalog_data):
+    """Test: los repetidos en el archivo y los que ya existen se omiten y se reportan."""
+    content = "name\nVerde\nVerde\nRojo\n"
+    result, report = _import("colors", content, "csv")
+
+    assert (result.inserted, result.duplicates) == (1, 2)
+    assert [(r["line"], r["name"], r["status"]) for r in report] == [
+        ("3", "Verde", "duplicate"),
+        ("4", "Rojo", "duplicate"),
+    ]
+    assert _names(Color) == ["Azul", "Rojo", "Verde"]
+
+
+def test_import_detects_accent_and_case_collisions(app, catalog_data):
+    """Test: los nombres que solo difieren en acentos o mayúsculas son duplicados."""
+    content = '{"name": "Café"}\n{"name": "CAFE"}\n{"name": "azúl"}\n'
+    result, report = _import("colors", content, "jsonl")
+
+    assert (result.inserted, result.duplicates) == (1, 2)
+    assert [r["name"] for r in report] == ["CAFE", "azúl"]
+
+
+def test_import_rejects_too_long_fields(app):
+    """Test: un campo que excede la longitud de la columna se rechaza."""
+    content = f'{{"name": "{"x" * 101}"}}\n{{"name": "Roble", "description": "{"d" * 256}"}}\n'
+    result, report = _import("wood_types", content, "jsonl")
+
+    assert (result.inserted, result.rejected) == (0, 2)
+    assert [r["reason"] for r in report] == [
+        "'name' excede 100 caracteres",
+        "'description' excede 255 caracteres",
+    ]
+
+
+def test_import_rejects_bad_json_and_continues(app):
+    """Test: una línea JSON ilegible o que no es objeto se rechaza sin detener la importación."""
+    content = '{"name": "Verde"}\n{"name": \n[1, 2]\n{"name": "Negro"}\n'
+    result, report = _import("colors", content, "jsonl")
+
+    assert (result.read, result.inserted, result.rejected) == (4, 2, 2)
+    assert [(r["line"], r["status"]) for r in report] == [("2", "rejected"), ("3", "rejected")]
+    assert report[0]["reason"].startswith("JSON inválido")
+    assert report[1]["reason"] == "Se esperaba un objeto JSON"
+
+
+def test_import_rejects_non_string_fields(app):
+    """Test: un nombre o descripción que no es texto se rechaza sin detener la importación."""
+    content = (
+        '{"name": "Pino"}\n{"name": 123}\n'
+        '{"name": "Roble", "description": 5}\n{"name": "Cedro", "description": "Aromática"}\n'
+    )
+    result, report = _import("wood_types", content, "jsonl")
+
+    assert (result.inserted, result.rejected) == (2, 2)
+    assert [(r["line"], r["reason"]) for r in report] == [
+        ("2", "'name' debe ser texto"),
+        ("3", "'description' debe ser texto"),
+    ]
+    assert _names(WoodType) == ["Cedro", "Pino"]
+
+
+def test_import_dry_run_leaves_no_rows(app):
+    """Test: en modo simulación se cuentan los registros pero no se guarda nada."""
+    result, report = _import("colors", "name\nRojo\nVerde\n", "csv", batch_size=1, dry_run=True)
+
+    assert result.inserted == 2
+    assert _names(Color) == []
+    assert get_version("colors") == 0
@@ -0,0 +1,67 @@
+"""
+Tests de la generación de datos sintéticos de los catálogos.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.catalogs.registry import CATALOGS
+from app.catalogs.seeder import generate_records, seed_catalog
+from app.extensions import db
+
+pytestmark = pytest.mark.usefixtures("catalog_data")
+
+
+@pytest.fixture(params=sorted(CATALOGS))
+def spec(request):
+    """Cada catálogo registrado."""
+    return CATALOGS[request.param]
+
+
+def _names(spec) -> list[str]:
+    return db.session.execute(select(spec.model.name)).scalars().all()
+
+
+def test_same_seed_generates_same_records(spec):
+    """Test: la misma semilla genera los mismos registros y otra semilla, otros."""
+    until = datetime(2026, 1, 1)
+
+    def records(seed):
+        return list(generate_records(spec, 20, seed=seed, deleted_fraction=0.3, until=until))
+
+    assert records(7) == records(7)
+    assert records(7) != records(8)
+
+
+def test_seeding_again_continues_without_repeating_names(spec):
+    """Test: una segunda ejecución con la misma semilla agrega nombres nuevos."""
+    assert seed_catalog(spec, 10, seed=7, batch_size=4) == 10
+    assert seed_catalog(spec, 10, seed=7, batch_size=4) == 10
+
+    names = _names(spec)
+    assert len(names) == len(set(names)) == 22
+
+
+def test_seeding_with_another_seed_skips_existing_names(spec):
+    """Test: con otra semilla los nombres repetidos se omiten y se completan los solicitados."""
+    assert seed_catalog(spec, 500, seed=42, batch_size=100) == 500
+    assert seed_catalog(spec, 500, seed=7, batch_size=100) == 500
+
+    names = _names(spec)
+    assert len(names) == len(set(names)) == 1002
+
+
+def test_existing_names_are_skipped_in_batch(spec):
+    """Test: si los siguientes nombres ya existen, se descartan y se generan otros."""
+    # Los nombres que el seeder generaría a continuación, capturados antes
+    taken = [record["name"] for record in generate_records(spec, 3, seed=7, start=5)]
+    db.session.add_all(spec.model(name=name) for name in taken)
+    db.session.commit()
+
+    assert seed_catalog(spec, 4, seed=7, batch_size=4) == 4
+
+    names = _names(spec)
+    assert len(names) == len(set(names)) == 9
+    assert set(taken) <= set(names)
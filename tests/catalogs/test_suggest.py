@@ -0,0 +1,91 @@
+"""
+Tests del índice de autocompletado de los catálogos.
+"""
+
+import pytest
+
+from app.catalogs.registry import CATALOGS
+from app.extensions import db
+from app.utils.catalog_versions import bump_version
+
+pytestmark = pytest.mark.usefixtures("catalog_data")
+
+# `catalog_data` deja activo el ID 1 de cada catálogo
+CASES = {
+    "colors": {
+        "url": "/colors",
+        "active": "Rojo",
+        "new": {"name": "Verde"},
+        "rename": {"name": "Rojo oscuro"},
+        "prefix": "RÓ",
+        "missing": "azu",
+    },
+    "roles": {
+        "url": "/roles",
+        "active": "Administrador",
+        "new": {"name": "Supervisor"},
+        "rename": {"name": "Administrador general"},
+        "prefix": "adm",
+        "missing": "vend",
+    },
+    "wood_types": {
+        "url": "/wood-types",
+        "active": "Pino",
+        "new": {"name": "Roble", "description": "Madera dura"},
+        "rename": {"name": "Pino blanco", "description": "Madera suave"},
+        "prefix": "pi",
+        "missing": "",
+    },
+}
+
+
+@pytest.fixture(params=sorted(CATALOGS))
+def catalog(request):
+    """Catálogo probado con su `CatalogSpec` en `spec`."""
+    return {"spec": CATALOGS[request.param], **CASES[request.param]}
+
+
+def test_suggest_reads_index_once(client, max_queries, catalog):
+    """Test: las sugerencias construyen el índice una vez y después no consultan."""
+    pk = catalog["spec"].pk
+
+    with max_queries(2):
+        response = client.get(f"{catalog['url']}/suggest?q={catalog['prefix']}")
+    assert response.get_json() == {"data": [{pk: 1, "name": catalog["active"]}]}
+
+    with max_queries(0):
+        response = client.get(f"{catalog['url']}/suggest?q={catalog['missing']}")
+    assert response.get_json() == {"data": []}
+
+
+def test_suggest_applies_writes_without_rebuilding(client, max_queries, catalog):
+    """Test: altas, ediciones y bajas se aplican al índice sin volver a leer la tabla."""
+    url, name, prefix = catalog["url"], catalog["new"]["name"], catalog["prefix"]
+
+    def suggest(q):
+        with max_queries(0):
+            return [item["name"] for item in client.get(f"{url}/suggest?q={q}").get_json()["data"]]
+
+    client.get(f"{url}/suggest?q={prefix}")
+    client.post(f"{url}/create", data=catalog["new"])
+    assert suggest(name[:2]) == [name]
+
+    client.post(f"{url}/1/edit", data=catalog["rename"])
+    assert suggest(prefix) == [catalog["rename"]["name"]]
+
+    client.post(f"{url}/1/delete")
+    assert suggest(prefix) == []
+
+
+def test_suggest_rebuilds_after_write_from_other_process(client, num_queries, catalog):
+    """Test: si la versión salta por una escritura de otro proceso, el índice se reconstruye."""
+    url, name = catalog["url"], catalog["new"]["name"]
+    client.get(f"{url}/suggest?q={name[:2]}")
+    # Otro proceso escribió sin emitir la señal en este
+    bump_version(catalog["spec"].name)
+    db.session.commit()
+
+    client.post(f"{url}/create", data=catalog["new"])
+    with num_queries(2):
+        data = client.get(f"{url}/suggest?q={name[:2]}").get_json()["data"]
+    assert [item["name"] for item in data] == [name]
@@ -0,0 +1,82 @@
+"""
+Tests del número exacto de sentencias SQL de las escrituras de catálogos.
+
+Cada escritura es la sentencia de datos más el incremento de la versión del
+catálogo; las fechas las asigna la base de datos y se leen con RETURNING.
+"""
+
+import pytest
+
+from app.api.services import SERVICES
+from app.catalogs.registry import CATALOGS
+from app.exceptions import ConflictError
+from app.extensions import db
+from app.utils.catalog_versions import get_version
+
+pytestmark = pytest.mark.usefixtures("catalog_data")
+
+
+@pytest.fixture(params=sorted(CATALOGS))
+def spec(request):
+    """Cada catálogo registrado."""
+    return CATALOGS[request.param]
+
+
+def test_create_is_insert_and_version_bump(spec, num_queries):
+    """Test: crear es un INSERT ... RETURNING y el incremento de versión."""
+    with num_queries(2):
+        record = SERVICES[spec.name].create({"name": "Nuevo"})
+
+    assert getattr(record, spec.pk) == 3
+    assert record.created_at is not None
+
+
+def test_create_duplicate_is_single_insert(spec, num_queries):
+    """Test: un nombre duplicado se detecta con el INSERT, sin consulta previa."""
+    name = {"colors": "ROJO", "roles": "administrador", "wood_types": "Pinó"}[spec.name]
+
+    with num_queries(1), pytest.raises(ConflictError):
+        SERVICES[spec.name].create({"name": name})
+
+
+def test_update_is_update_and_version_bump(spec, num_queries):
+    """Test: actualizar es un UPDATE ... RETURNING y el incremento de versión."""
+    with num_queries(2):
+        record = SERVICES[spec.name].update(1, {"name": "Renombrado"})
+
+    assert (getattr(record, spec.pk), record.name) == (1, "Renombrado")
+    assert record.created_at is not None
+
+
+def test_delete_is_update_and_version_bump(spec, num_queries):
+    """Test: eliminar es un UPDATE por llave primaria y el incremento de versión."""
+    with num_queries(2):
+        SERVICES[spec.name].delete(1)
+
+
+def test_bulk_writes_are_one_update_per_batch(spec, num_queries):
+    """Test: eliminar o restaurar varios IDs es un UPDATE por lote y un incremento de versión."""
+    service = SERVICES[spec.name]
+
+    with num_queries(2):
+        assert service.bulk_delete([1, 1, 99]) == 1
+    with num_queries(2):
+        assert service.bulk_restore([1, 2]) == 2
+    with num_queries(1):
+        assert service.bulk_restore([1, 2]) == 0
+
+
+def test_without_returning_rows_are_read_back_by_key(spec, num_queries, monkeypatch):
+    """Test: sin RETURNING (MySQL) la fila escrita y la versión se leen por llave."""
+    monkeypatch.setattr(db.engine.dialect, "insert_returning", False)
+    monkeypatch.setattr(db.engine.dialect, "update_returning", False)
+    service = SERVICES[spec.name]
+
+    with num_queries(4):
+        created = service.create({"name": "Nuevo"})
+    with num_queries(4):
+        updated = service.update(getattr(created, spec.pk), {"name": "Renombrado"})
+
+    assert updated.name == "Renombrado"
+    assert updated.created_at == created.created_at
+    assert get_version(spec.name) == 2
@@ -0,0 +1,177 @@
+"""
+Fixtures compartidos de las pruebas.
+
+La aplicación se crea con SQLite en memoria, sin CSRF, sin auditoría, sin
+eventos y sin cachés de catálogos ni de fragmentos, para que cada prueba mida
+el camino completo a la base de datos.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import create_app
+from app.extensions import db
+from app.models import CatalogVersion, Color, Role, WoodType
+from config import Config
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    SQLALCHEMY_ENGINE_OPTIONS: dict = {}
+    WTF_CSRF_ENABLED = False
+    CATALOG_CACHE_ENABLED = False
+    FRAGMENT_CACHE_ENABLED = False
+    AUDIT_ENABLED = False
+    EVENTS_ENABLED = False
+    INTERNAL_ENDPOINTS_ENABLED = True
+
+
+class QueryCounter:
+    """
+    Registro de las sentencias ejecutadas en un motor.
+
+    Attributes:
+        statements: Sentencias SQL ejecutadas, en orden.
+        commits: Número de COMMIT emitidos.
+    """
+
+    def __init__(self):
+        self.statements: list[str] = []
+        self.commits = 0
+
+    @property
+    def count(self) -> int:
+        """Número de sentencias ejecutadas (sin contar COMMIT)."""
+        return len(self.statements)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+    def __str__(self) -> str:
+        return "\n".join(f"{i}. {sql}" for i, sql in enumerate(self.statements, start=1))
+
+
+@contextmanager
+def count_queries(engine: Optional[Engine] = None) -> Iterator[QueryCounter]:
+    """
+    Cuenta las sentencias ejecutadas dentro del bloque.
+
+    Args:
+        engine: Motor a observar (por defecto `db.engine`; requiere contexto de app)
+
+    Yields:
+        QueryCounter: Registro de sentencias
+    """
+    engine = engine if engine is not None else db.engine
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter._on_execute)
+    event.listen(engine, "commit", counter._on_commit)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter._on_execute)
+        event.remove(engine, "commit", counter._on_commit)
+
+
+def enable_sqlite_savepoints(engine) -> None:
+    """
+    Hace que pysqlite abra transacciones reales para que SAVEPOINT y rollback funcionen.
+
+    Receta de la documentación de SQLAlchemy: sin ella pysqlite confirma al
+    liberar el SAVEPOINT más externo (ej. el modo simulación del importador).
+    """
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        # Directo en la conexión DBAPI: como en MySQL, el BEGIN no cuenta como consulta
+        connection.connection.driver_connection.execute("BEGIN")
+
+
+@pytest.fixture
+def app():
+    """Aplicación con el esquema creado y las versiones de catálogo inicializadas."""
+    app = create_app(TestConfig)
+    with app.app_context():
+        enable_sqlite_savepoints(db.engine)
+        db.create_all()
+        db.session.add_all(
+            CatalogVersion(catalog=name, version=0) for name in ("colors", "roles", "wood_types")
+        )
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    """Cliente de pruebas de Flask."""
+    return app.test_client()
+
+
+@pytest.fixture
+def catalog_data(app):
+    """Un registro activo (ID 1) y uno eliminado (ID 2) en cada catálogo."""
+    db.session.add_all([
+        Color(name="Rojo"),
+        Color(name="Azul", active=False),
+        Role(name="Administrador"),
+        Role(name="Vendedor", active=False),
+        WoodType(name="Pino", description="Madera suave"),
+        WoodType(name="Cedro", description="Madera aromática", active=False),
+    ])
+    db.session.commit()
+    db.session.expunge_all()
+
+
+@pytest.fixture
+def num_queries(app):
+    """
+    Context manager que falla si el bloque no ejecuta exactamente N sentencias SQL.
+
+    Fija el costo de las escrituras para detectar viajes extra a la base de datos.
+
+    Example:
+        >>> with num_queries(2):
+        ...     ColorService.create({"name": "Rojo"})
+    """
+    @contextmanager
+    def _num_queries(expected: int):
+        with count_queries() as counter:
+            yield counter
+        assert counter.count == expected, (
+            f"Se esperaban {expected} sentencias y se ejecutaron {counter.count}:\n{counter}"
+        )
+
+    return _num_queries
+
+
+@pytest.fixture
+def max_queries(app):
+    """
+    Context manager que falla si el bloque excede un presupuesto de sentencias SQL.
+
+    Example:
+        >>> with max_queries(2):
+        ...     client.get("/colors/")
+    """
+    @contextmanager
+    def _max_queries(maximum: int):
+        with count_queries() as counter:
+            yield counter
+        assert counter.count <= maximum, (
+            f"Se permitían {maximum} sentencias y se ejecutaron {counter.count}:\n{counter}"
+        )
+
+    return _max_queries
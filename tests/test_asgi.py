@@ -0,0 +1,275 @@
+"""
+Tests de la aplicación ASGI (lecturas asíncronas de la API y delegación a Flask).
+"""
+
+import asyncio
+import gzip
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+from app.asgi import create_asgi_app  # noqa: E402
+from app.events.broker import SubscriberLimitError  # noqa: E402
+from app.extensions import db  # noqa: E402
+from app.models import CatalogVersion, Color, WoodType  # noqa: E402
+from app.utils.async_db import async_engine_options  # noqa: E402
+from conftest import TestConfig  # noqa: E402
+from config import Config  # noqa: E402
+
+
+def _create_app(tmp_path, **config):
+    """Aplicación ASGI sobre un archivo SQLite que comparten los drivers síncrono y asíncrono."""
+    config_class = type(
+        "AsgiConfig",
+        (TestConfig,),
+        {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'asgi.db'}", **config},
+    )
+    return create_asgi_app(config_class)
+
+
+@pytest.fixture
+def asgi_app(tmp_path):
+    """Aplicación ASGI con colores y tipos de madera de prueba."""
+    asgi_app = _create_app(tmp_path)
+    with asgi_app.flask_app.app_context():
+        db.create_all()
+        db.session.add_all(
+            CatalogVersion(catalog=name, version=0) for name in ("colors", "roles", "wood_types")
+        )
+        db.session.add_all([
+            *(Color(name=f"Color {i}") for i in range(1, 31)),
+            WoodType(name="Pino", description="Madera suave"),
+        ])
+        db.session.commit()
+        yield asgi_app
+        db.session.remove()
+
+
+def _scope(path, query="", headers=()):
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(key.lower().encode(), value.encode()) for key, value in headers],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+
+def _receive(disconnected=None):
+    """`receive` de ASGI: el cuerpo vacío y después espera a que el cliente se desconecte."""
+    disconnected = disconnected or asyncio.Event()
+    messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+    async def receive():
+        message = next(messages, None)
+        if message is None:
+            await disconnected.wait()
+            message = {"type": "http.disconnect"}
+        return message
+
+    return receive
+
+
+async def _get(app, path, query="", headers=()):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app(_scope(path, query, headers), _receive(), send)
+    start = messages[0]
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}, body
+
+
+def _run(app, scenario):
+    async def main():
+        try:
+            return await scenario()
+        finally:
+            await app.engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_list_is_served_async_with_links(asgi_app):
+    """Test: GET /api/v1/colors pagina con keyset y enlaces, igual que la ruta de Flask."""
+    status, headers, body = _run(
+        asgi_app, lambda: _get(asgi_app, "/api/v1/colors", "limit=10&fields=name")
+    )
+
+    document = json.loads(body)
+    assert status == 200
+    assert document["data"][0] == {"id_color": 1, "name": "Color 1"}
+    assert document["links"]["next"] == "/api/v1/colors?after=10&limit=10&fields=id_color%2Cname"
+    assert headers["etag"].startswith('W/"colors-')
+
+
+def test_list_revalidation_returns_304(asgi_app):
+    """Test: If-None-Match con la versión vigente responde 304 sin cuerpo."""
+    async def scenario():
+        _, headers, _ = await _get(asgi_app, "/api/v1/colors")
+        return await _get(asgi_app, "/api/v1/colors", headers=[("If-None-Match", headers["etag"])])
+
+    status, _, body = _run(asgi_app, scenario)
+    assert status == 304
+    assert body == b""
+
+
+def test_list_is_compressed(asgi_app):
+    """Test: las respuestas asíncronas también se comprimen según Accept-Encoding."""
+    status, headers, body = _run(
+        asgi_app, lambda: _get(asgi_app, "/api/v1/colors", headers=[("Accept-Encoding", "gzip")])
+    )
+
+    assert headers["content-encoding"] == "gzip"
+    assert len(json.loads(gzip.decompress(body))["data"]) == 30
+
+
+def test_item_and_errors(asgi_app):
+    """Test: GET /api/v1/wood-types/1 devuelve el registro; IDs o catálogos inexistentes, 404."""
+    async def scenario():
+        return (
+            await _get(asgi_app, "/api/v1/wood-types/1"),
+            await _get(asgi_app, "/api/v1/wood-types/99"),
+            await _get(asgi_app, "/api/v1/sillas"),
+            await _get(asgi_app, "/api/v1/colors", "fields=created_by"),
+        )
+
+    item, missing, unknown, private = _run(asgi_app, scenario)
+    assert json.loads(item[2])["data"]["description"] == "Madera suave"
+    assert [missing[0], unknown[0], private[0]] == [404, 404, 400]
+    assert json.loads(missing[2])["success"] is False
+
+
+def test_other_routes_are_delegated_to_flask(asgi_app):
+    """Test: las páginas HTML se atienden con la aplicación Flask."""
+    status, headers, body = _run(asgi_app, lambda: _get(asgi_app, "/colors/"))
+
+    assert status == 200
+    assert headers["content-type"].startswith("text/html")
+    assert "Color 1" in body.decode()
+
+
+def test_async_engine_reuses_pool_options(tmp_path):
+    """Test: el motor asíncrono usa las opciones de pool de producción que aplican a su driver."""
+    options = {**Config.SQLALCHEMY_ENGINE_OPTIONS, "connect_args": {"charset": "utf8mb4"}}
+
+    assert async_engine_options("mysql+aiomysql://u:p@db/store", options) == (
+        Config.SQLALCHEMY_ENGINE_OPTIONS
+    )
+    assert async_engine_options("sqlite+aiosqlite://", options) == {
+        "pool_recycle": 280,
+        "pool_pre_ping": True,
+    }
+
+    uri = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+    engine = create_async_engine(uri, **async_engine_options(uri, options))
+    assert (engine.pool.size(), engine.pool._recycle, engine.pool._pre_ping) == (10, 280, True)
+    asyncio.run(engine.dispose())
+
+
+def test_lifespan_shutdown_closes_audit_and_events(tmp_path):
+    """Test: al apagar el servidor se escribe la auditoría pendiente y se cierran los streams."""
+    app = _create_app(tmp_path, AUDIT_ENABLED=True, EVENTS_ENABLED=True)
+    writer = app.flask_app.extensions["audit"]
+    broker = app.flask_app.extensions["events"]
+    with app.flask_app.app_context():
+        db.create_all()
+    writer.record({
+        "catalog": "colors", "action": "create", "record_id": 1, "affected": 1,
+        "created_at": datetime(2026, 1, 1),
+    })
+    subscriber = broker.subscribe()
+    stream = broker.stream(subscriber, None)
+    next(stream)
+
+    async def lifespan():
+        messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        await app({"type": "lifespan"}, receive, send)
+        return sent
+
+    assert asyncio.run(lifespan()) == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert writer.stats()["written"] == 1
+    assert list(stream) == []
+    assert broker.stats()["subscribers"] == 0
+    with pytest.raises(SubscriberLimitError):
+        broker.subscribe()
+
+
+
+def test_open_event_stream_does_not_block_pages(tmp_path):
+    """Test: con un stream SSE abierto las páginas de Flask se siguen atendiendo."""
+    app = _create_app(tmp_path, EVENTS_ENABLED=True, EVENTS_POLL_INTERVAL=0.01)
+    with app.flask_app.app_context():
+        db.create_all()
+
+    async def scenario():
+        streaming = asyncio.Event()
+
+        async def stream_send(message):
+            if message["type"] == "http.response.body":
+                streaming.set()
+
+        stream = asyncio.create_task(app(_scope("/events/catalogs"), _receive(), stream_send))
+        await asyncio.wait_for(streaming.wait(), 5)
+        page = await asyncio.wait_for(_get(app, "/colors/"), 5)
+        app.flask_app.extensions["events"].close()
+        await asyncio.wait_for(stream, 5)
+        return page
+
+    status, headers, _ = _run(app, scenario)
+    assert status == 200
+    assert headers["content-type"].startswith("text/html")
+
+
+def test_client_disconnect_closes_event_stream(tmp_path):
+    """Test: al desconectarse el cliente, el stream SSE termina y libera su suscripción."""
+    app = _create_app(
+        tmp_path, EVENTS_ENABLED=True, EVENTS_POLL_INTERVAL=0.01, EVENTS_HEARTBEAT_INTERVAL=0.05
+    )
+    with app.flask_app.app_context():
+        db.create_all()
+    broker = app.flask_app.extensions["events"]
+
+    async def scenario():
+        streaming, disconnected = asyncio.Event(), asyncio.Event()
+
+        async def stream_send(message):
+            if message["type"] == "http.response.body":
+                streaming.set()
+
+        receive = _receive(disconnected)
+        stream = asyncio.create_task(app(_scope("/events/catalogs"), receive, stream_send))
+        await asyncio.wait_for(streaming.wait(), 5)
+        assert broker.stats()["subscribers"] == 1
+
+        disconnected.set()
+        await asyncio.wait_for(stream, 5)
+        # El hilo cierra la respuesta en su siguiente bloque (el keep-alive)
+        for _ in range(100):
+            if broker.stats()["subscribers"] == 0:
+                break
+            await asyncio.sleep(0.05)
+        return broker.stats()["subscribers"]
+
+    assert _run(app, scenario) == 0
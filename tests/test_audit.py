@@ -0,0 +1,96 @@
+"""
+Tests de la auditoría de escrituras.
+
+Se usa un archivo SQLite para que el hilo de fondo del escritor tenga su
+propia conexión.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app import create_app
+from app.extensions import db
+from app.models import AuditLog, CatalogVersion, Color
+from conftest import TestConfig
+
+ACTOR = {"X-Forwarded-User": "ana"}
+
+
+@pytest.fixture
+def audit_app(tmp_path):
+    """Aplicación con auditoría habilitada y el escritor en pausa hasta `close()`."""
+    class AuditConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'audit.db'}"
+        AUDIT_ENABLED = True
+        AUDIT_ACTOR_HEADER = "X-Forwarded-User"
+        AUDIT_FLUSH_INTERVAL = 60
+
+    app = create_app(AuditConfig)
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(
+            CatalogVersion(catalog=name, version=0) for name in ("colors", "roles", "wood_types")
+        )
+        db.session.commit()
+        yield app
+        app.extensions["audit"].close()
+        db.session.remove()
+
+
+def _audit_rows() -> list:
+    return db.session.execute(select(AuditLog).order_by(AuditLog.id_audit_log)).scalars().all()
+
+
+def test_writes_fill_by_columns_from_header(audit_app):
+    """Test: crear, editar y eliminar guardan el usuario del encabezado en las columnas *_by."""
+    client = audit_app.test_client()
+    client.post("/colors/create", data={"name": "Rojo"}, headers=ACTOR)
+    client.post("/colors/1/edit", data={"name": "Carmín"}, headers={"X-Forwarded-User": "luis"})
+    client.post("/colors/1/delete", headers=ACTOR)
+
+    color = db.session.get(Color, 1)
+    assert (color.created_by, color.updated_by, color.deleted_by) == ("ana", "luis", "ana")
+
+
+def test_actor_header_is_ignored_unless_configured(audit_app):
+    """Test: sin AUDIT_ACTOR_HEADER el encabezado del cliente no llega a las columnas *_by."""
+    audit_app.config["AUDIT_ACTOR_HEADER"] = ""
+    audit_app.test_client().post("/colors/create", data={"name": "Rojo"}, headers=ACTOR)
+
+    assert db.session.get(Color, 1).created_by is None
+
+
+def test_writes_are_recorded_in_audit_log(audit_app):
+    """Test: cada escritura queda como evento en audit_log al vaciar la cola."""
+    client = audit_app.test_client()
+    client.post("/colors/create", data={"name": "Rojo"}, headers=ACTOR)
+    client.post("/colors/create", data={"name": "Azul"})
+    client.post("/colors/bulk-delete", data={"ids": [1, 2]}, headers=ACTOR)
+
+    assert _audit_rows() == []
+    audit_app.extensions["audit"].close()
+
+    rows = [(r.catalog, r.action, r.record_id, r.affected, r.actor) for r in _audit_rows()]
+    assert rows == [
+        ("colors", "create", 1, 1, "ana"),
+        ("colors", "create", 2, 1, None),
+        ("colors", "delete", None, 2, "ana"),
+    ]
+
+
+def test_events_are_written_in_multi_row_batches(audit_app):
+    """Test: los eventos se escriben con un INSERT por lote de AUDIT_BATCH_SIZE."""
+    writer = audit_app.extensions["audit"]
+    for record_id in range(7):
+        writer.record({
+            "catalog": "colors", "action": "update", "record_id": record_id,
+            "affected": 1, "actor": None, "created_at": datetime.now(),
+        })
+    writer.batch_size = 3
+
+    writer.close()
+
+    assert len(_audit_rows()) == 7
+    assert writer.stats() == {"queued": 0, "written": 7, "dropped": 0, "failed": 0, "batches": 3}
@@ -0,0 +1,97 @@
+"""
+Tests de la caché de lecturas de catálogos.
+"""
+
+import pytest
+
+from app import create_app
+from app.catalogs.colors.services import ColorService
+from app.signals import catalog_changed
+from app.utils.cache import CatalogCache, get_catalog_cache
+from conftest import TestConfig
+
+
+class CacheConfig(TestConfig):
+    CATALOG_CACHE_ENABLED = True
+
+
+@pytest.fixture
+def cached_app(app):
+    """La aplicación del fixture `app` con la caché de catálogos habilitada."""
+    create_app(CacheConfig)
+    yield app
+    # Las cachés son globales: se restaura la configuración sin caché
+    create_app(TestConfig)
+
+
+def test_cache_hits_after_first_load():
+    """Test: la primera lectura de una llave es un fallo y las siguientes son aciertos."""
+    cache = CatalogCache("test", version_source=lambda: 1)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return ["Rojo"]
+
+    assert cache.get_or_load("all", loader) == ["Rojo"]
+    assert cache.get_or_load("all", loader) == ["Rojo"]
+    assert cache.get_or_load("other", loader) == ["Rojo"]
+
+    assert len(loads) == 2
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 2)
+
+
+def test_cache_evicts_least_recent_entries_over_max_rows():
+    """Test: al exceder max_rows se desaloja la menos usada; las que no caben no se guardan."""
+    cache = CatalogCache("test", maxsize=10, max_rows=5)
+    cache.get_or_load("a", lambda: [1, 2])
+    cache.get_or_load("b", lambda: [1, 2])
+    cache.get_or_load("a", lambda: [1, 2])
+    cache.get_or_load("c", lambda: [1, 2])
+    cache.get_or_load("big", lambda: list(range(6)))
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["rows"], stats["evictions"]) == (2, 4, 1)
+    found_b, _, _ = cache.lookup("b", None)
+    found_a, _, _ = cache.lookup("a", None)
+    assert (found_a, found_b) == (True, False)
+
+
+def test_cache_clears_when_shared_version_changes():
+    """Test: si otro proceso incrementa la versión del catálogo, la caché se vacía."""
+    version = {"value": 1}
+    cache = CatalogCache("test", version_source=lambda: version["value"])
+    cache.get_or_load("all", lambda: ["Rojo"])
+
+    version["value"] = 2
+    assert cache.get_or_load("all", lambda: ["Rojo", "Verde"]) == ["Rojo", "Verde"]
+
+
+@pytest.mark.usefixtures("catalog_data")
+def test_cached_reads_skip_database(cached_app, max_queries):
+    """Test: con la caché habilitada, la segunda lectura solo consulta la versión."""
+    assert [row.name for row in ColorService.get_all()] == ["Rojo"]
+
+    with max_queries(1):
+        assert [row.name for row in ColorService.get_all()] == ["Rojo"]
+
+
+@pytest.mark.usefixtures("catalog_data")
+def test_catalog_changed_invalidates_cache(cached_app, client):
+    """Test: una escritura emite catalog_changed y la siguiente lectura ve el cambio."""
+    ColorService.get_all()
+    assert get_catalog_cache("colors").stats()["entries"] == 1
+
+    catalog_changed.send("colors")
+    assert get_catalog_cache("colors").stats()["entries"] == 0
+
+    client.post("/colors/create", data={"name": "Verde"})
+    assert [row.name for row in ColorService.get_all()] == ["Rojo", "Verde"]
+
+
+def test_internal_endpoints_disabled_by_default():
+    """Test: /internal solo se registra si INTERNAL_ENDPOINTS_ENABLED está activo."""
+    class DefaultConfig(TestConfig):
+        INTERNAL_ENDPOINTS_ENABLED = False
+
+    assert create_app(DefaultConfig).test_client().get("/internal/cache").status_code == 404
@@ -0,0 +1,116 @@
+"""
+Tests de la compresión de respuestas y de los archivos estáticos precomprimidos.
+"""
+
+import gzip
+import re
+
+import pytest
+from flask import Response
+
+from app.models import Color
+from app.extensions import db
+from app.utils import compression
+from app.utils.compression import precompress_static
+from app.utils.csrf import unmask_token
+
+pytestmark = pytest.mark.usefixtures("catalog_data")
+
+
+@pytest.fixture
+def many_colors(app):
+    db.session.add_all(Color(name=f"Color {i}") for i in range(30))
+    db.session.commit()
+
+
+@pytest.mark.usefixtures("many_colors")
+def test_list_is_gzipped_when_accepted(client):
+    """Test: la lista se comprime con gzip y varía por Accept-Encoding."""
+    response = client.get("/api/v1/colors", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert "Color 29" in gzip.decompress(response.data).decode()
+
+
+@pytest.mark.usefixtures("many_colors")
+def test_list_is_not_compressed_without_accept_encoding(client):
+    """Test: sin Accept-Encoding la respuesta sale sin comprimir."""
+    response = client.get("/api/v1/colors")
+
+    assert "Content-Encoding" not in response.headers
+    assert "Color 29" in response.get_data(as_text=True)
+
+
+def test_small_response_is_not_compressed(client):
+    """Test: las respuestas menores a COMPRESS_MIN_SIZE no se comprimen."""
+    response = client.get("/colors/suggest?q=ro", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+@pytest.mark.skipif(compression.brotli is None, reason="brotli no instalado")
+@pytest.mark.usefixtures("many_colors")
+def test_brotli_is_preferred_when_available(client):
+    """Test: con brotli instalado se prefiere 'br' sobre gzip."""
+    response = client.get("/api/v1/colors", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert "Color 29" in compression.brotli.decompress(response.data).decode()
+
+
+@pytest.mark.usefixtures("many_colors")
+def test_page_with_csrf_token_is_compressed_with_masked_token(client):
+    """Test: las páginas con token CSRF se comprimen y el token cambia en cada respuesta."""
+    def token():
+        response = client.get("/colors/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        page = gzip.decompress(response.data).decode()
+        return re.search(r'name="csrf_token" value="([^"]+)"', page).group(1)
+
+    first, second = token(), token()
+    assert first != second
+    assert unmask_token(first) == unmask_token(second)
+
+
+def test_page_without_csrf_token_is_compressed(app):
+    """Test: el HTML que no renderiza el token CSRF sí se comprime."""
+    with app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+        response = app.process_response(Response("<p>Catálogo</p>" * 100, mimetype="text/html"))
+
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+@pytest.mark.usefixtures("many_colors")
+def test_streamed_export_is_compressed(client):
+    """Test: la exportación en streaming se comprime sin Content-Length."""
+    response = client.get("/colors/export?format=csv", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert "Color 29" in gzip.decompress(response.data).decode()
+
+
+def test_not_modified_is_not_compressed(client):
+    """Test: una respuesta 304 se entrega sin cuerpo ni Content-Encoding."""
+    etag = client.get("/colors/").headers["ETag"]
+
+    response = client.get("/colors/", headers={"If-None-Match": etag, "Accept-Encoding": "gzip"})
+
+    assert response.status_code == 304
+    assert "Content-Encoding" not in response.headers
+
+
+def test_static_files_are_served_precompressed(app, client, tmp_path):
+    """Test: los estáticos se sirven desde la variante .gz generada al arrancar."""
+    css = tmp_path / "site.css"
+    css.write_text(".catalog-table { padding: 5px; }\n" * 100)
+    app.static_folder = str(tmp_path)
+
+    assert precompress_static(app) >= 1
+    response = client.get("/static/site.css", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.mimetype == "text/css"
+    assert gzip.decompress(response.data) == css.read_bytes()
+    response.close()
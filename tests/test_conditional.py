@@ -0,0 +1,45 @@
+"""
+Tests del GET condicional de las páginas HTML de catálogos.
+"""
+
+import time
+
+import pytest
+
+from app.utils import conditional
+
+pytestmark = pytest.mark.usefixtures("catalog_data")
+
+FUTURE = "Fri, 01 Jan 2100 00:00:00 GMT"
+
+
+def test_pages_send_etag_without_last_modified(client):
+    """Test: las páginas llevan ETag y no Last-Modified (una fecha no refleja el token CSRF)."""
+    response = client.get("/colors/")
+
+    assert response.headers["ETag"].startswith('W/"')
+    assert "Last-Modified" not in response.headers
+
+
+def test_if_none_match_returns_304(client):
+    """Test: un ETag vigente responde 304 sin cuerpo."""
+    etag = client.get("/colors/").headers["ETag"]
+
+    response = client.get("/colors/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+
+
+def test_if_modified_since_only_renders_page_with_stale_token(client, monkeypatch):
+    """Test: con el token viejo y solo If-Modified-Since se renderiza la página completa."""
+    etag = client.get("/colors/").headers["ETag"]
+    # El bucket de tiempo del token CSRF ya cambió
+    later = time.time() + 3 * 3600
+    monkeypatch.setattr(conditional.time, "time", lambda: later)
+
+    response = client.get("/colors/", headers={"If-Modified-Since": FUTURE})
+    assert response.status_code == 200
+    assert b"Rojo" in response.data
+
+    response = client.get("/colors/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
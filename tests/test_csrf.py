@@ -0,0 +1,76 @@
+"""
+Tests del enmascarado del token CSRF por respuesta.
+"""
+
+import re
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models import CatalogVersion, Color
+from app.utils.csrf import mask_token, unmask_token
+from conftest import TestConfig
+
+
+@pytest.fixture
+def csrf_app():
+    """Aplicación con la validación CSRF habilitada y un color activo."""
+    class CsrfConfig(TestConfig):
+        WTF_CSRF_ENABLED = True
+
+    app = create_app(CsrfConfig)
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(
+            CatalogVersion(catalog=name, version=0) for name in ("colors", "roles", "wood_types")
+        )
+        db.session.add(Color(name="Rojo"))
+        db.session.commit()
+        yield app
+        db.session.remove()
+
+
+def _token(client, url: str) -> str:
+    page = client.get(url).get_data(as_text=True)
+    return re.search(r'name="csrf_token"[^>]*value="([^"]+)"', page).group(1)
+
+
+def test_mask_round_trip():
+    """Test: el token enmascarado cambia en cada llamada y se recupera el original."""
+    token = "IjFhMmIzYyI.Z1x2Yw.firma"
+
+    first, second = mask_token(token), mask_token(token)
+    assert first != second
+    assert unmask_token(first) == unmask_token(second) == token
+    assert unmask_token(token) == token
+    assert unmask_token("abc") is None
+
+
+def test_masked_form_token_is_accepted(csrf_app):
+    """Test: el token enmascarado del formulario de alta pasa la validación CSRF."""
+    client = csrf_app.test_client()
+    token = _token(client, "/colors/create")
+
+    response = client.post("/colors/create", data={"name": "Verde", "csrf_token": token})
+    assert response.status_code == 302
+
+
+def test_masked_list_token_is_accepted(csrf_app):
+    """Test: el token enmascarado de la lista sirve para la eliminación masiva."""
+    client = csrf_app.test_client()
+    token = _token(client, "/colors/")
+
+    response = client.post("/colors/bulk-delete", data={"ids": ["1"], "csrf_token": token})
+    assert response.status_code == 302
+    assert db.session.get(Color, 1).active is False
+
+
+def test_tampered_token_is_rejected(csrf_app):
+    """Test: un token enmascarado que no es el de la sesión no pasa la validación."""
+    client = csrf_app.test_client()
+    _token(client, "/colors/create")
+    tampered = mask_token("IjAwMDAi.Z1x2Yw.firma-falsa")
+
+    response = client.post("/colors/create", data={"name": "Verde", "csrf_token": tampered})
+    assert response.status_code == 400
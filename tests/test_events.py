@@ -0,0 +1,153 @@
+"""
+Tests del stream Server-Sent Events de cambios de catálogos.
+"""
+
+import json
+
+import pytest
+
+from app import create_app
+from app.events import broker as broker_module
+from app.extensions import db
+from app.models import CatalogVersion
+from app.signals import catalog_changed
+from conftest import TestConfig
+
+
+class EventsConfig(TestConfig):
+    EVENTS_ENABLED = True
+    EVENTS_POLL_INTERVAL = 0.01
+    EVENTS_MAX_SUBSCRIBERS = 2
+
+
+@pytest.fixture
+def events_app():
+    """Aplicación con el stream de eventos habilitado."""
+    app = create_app(EventsConfig)
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(
+            CatalogVersion(catalog=name, version=0) for name in ("colors", "roles", "wood_types")
+        )
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def _next_event(chunks) -> dict:
+    """Lee el siguiente evento del stream, omitiendo `retry` y comentarios keep-alive."""
+    for chunk in chunks:
+        text = chunk.decode()
+        if text.startswith(("retry:", ":")):
+            continue
+        fields = dict(line.split(": ", 1) for line in text.strip().splitlines())
+        return {**fields, "data": json.loads(fields["data"])}
+    raise AssertionError("El stream terminó sin eventos")
+
+
+def test_stream_pushes_service_writes(events_app):
+    """Test: cada escritura llega como evento con catálogo, ID, operación y versión."""
+    client = events_app.test_client()
+    response = client.get("/events/catalogs")
+    assert response.mimetype == "text/event-stream"
+    assert "Content-Encoding" not in response.headers
+    chunks = iter(response.response)
+
+    client.post("/colors/create", data={"name": "Rojo"})
+    client.post("/colors/1/delete")
+
+    first, second = _next_event(chunks), _next_event(chunks)
+    assert first["event"] == "change"
+    assert first["data"] == {"catalog": "colors", "id": 1, "op": "create", "version": 1}
+    assert second["data"] == {"catalog": "colors", "id": 1, "op": "delete", "version": 2}
+    response.close()
+
+
+def test_last_event_id_resumes_from_buffer(events_app):
+    """Test: con Last-Event-ID se reenvían solo los eventos posteriores."""
+    client = events_app.test_client()
+    response = client.get("/events/catalogs")
+    chunks = iter(response.response)
+    client.post("/colors/create", data={"name": "Rojo"})
+    last_id = _next_event(chunks)["id"]
+    response.close()
+
+    client.post("/roles/create", data={"name": "Vendedor"})
+
+    response = client.get("/events/catalogs", headers={"Last-Event-ID": last_id})
+    event = _next_event(iter(response.response))
+    assert event["data"] == {"catalog": "roles", "id": 1, "op": "create", "version": 1}
+    response.close()
+
+
+def test_unknown_last_event_id_sends_reset(events_app):
+    """Test: un Last-Event-ID de otro proceso o fuera del buffer produce un evento reset."""
+    response = events_app.test_client().get(
+        "/events/catalogs", headers={"Last-Event-ID": "otroproceso-7"}
+    )
+    assert _next_event(iter(response.response))["event"] == "reset"
+    response.close()
+
+
+def test_changes_from_other_processes_are_detected(events_app):
+    """Test: un incremento de versión hecho por otro proceso se publica como 'change'."""
+    response = events_app.test_client().get("/events/catalogs")
+    chunks = iter(response.response)
+    next(chunks)
+    events_app.extensions["events"].check_versions()
+
+    db.session.execute(
+        CatalogVersion.__table__.update()
+        .where(CatalogVersion.catalog == "wood_types")
+        .values(version=5)
+    )
+    db.session.commit()
+
+    event = _next_event(chunks)
+    assert event["data"] == {"catalog": "wood_types", "id": None, "op": "change", "version": 5}
+    response.close()
+
+
+def test_subscriber_cap_returns_503(events_app):
+    """Test: por encima de EVENTS_MAX_SUBSCRIBERS se responde 503 y al cerrar se libera el lugar."""
+    client = events_app.test_client()
+    open_streams = [client.get("/events/catalogs") for _ in range(2)]
+
+    response = client.get("/events/catalogs")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "30"
+
+    open_streams[0].close()
+    response = client.get("/events/catalogs")
+    assert response.status_code == 200
+    response.close()
+    open_streams[1].close()
+
+
+def test_writes_publish_version_without_reading_it(events_app, monkeypatch):
+    """Test: la versión llega con catalog_changed; publicar no la vuelve a leer."""
+    broker = events_app.extensions["events"]
+
+    def no_read(connection):
+        raise AssertionError("publish_change no debe consultar la base")
+
+    monkeypatch.setattr(broker_module, "read_versions", no_read)
+    client = events_app.test_client()
+    client.post("/colors/create", data={"name": "Rojo"})
+    client.post("/colors/create", data={"name": "Verde"})
+
+    # Sin versión en la señal y sin suscriptores tampoco se consulta
+    catalog_changed.send("colors")
+
+    _, backlog, _ = broker._replay(f"{broker._token}-0")
+    assert [json.loads(text.split("data: ")[1])["version"] for _, text in backlog] == [1, 2]
+
+
+def test_subscriber_cap_leaves_worker_threads_free():
+    """Test: el límite de conexiones no pasa de EVENTS_THREAD_SHARE de WORKER_THREADS."""
+    class SmallPoolConfig(EventsConfig):
+        EVENTS_MAX_SUBSCRIBERS = 100
+        WORKER_THREADS = 6
+
+    assert create_app(SmallPoolConfig).extensions["events"].max_subscribers == 3
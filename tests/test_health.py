@@ -0,0 +1,88 @@
+"""
+Tests de /healthz, /readyz y del chequeo de disponibilidad cacheado.
+"""
+
+import threading
+
+from sqlalchemy.exc import OperationalError
+
+from app.utils.health import ReadinessProbe
+
+
+def _failing_check() -> None:
+    raise OperationalError("SELECT 1", {}, Exception("base de datos caída"))
+
+
+def test_healthz_is_always_ok(app, client, max_queries):
+    """Test: /healthz responde 200 sin consultar la base de datos, aunque esté caída."""
+    app.extensions["readiness"].check = _failing_check
+
+    with max_queries(0):
+        response = client.get("/healthz")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "ok"}
+    assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_readyz_is_ok_when_database_answers(client):
+    """Test: /readyz responde 200 si el ping a la base de datos funciona."""
+    response = client.get("/readyz")
+
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "ok"
+    assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_readyz_is_unavailable_when_check_fails(app, client):
+    """Test: /readyz responde 503 con el nombre de la excepción si el chequeo falla."""
+    app.extensions["readiness"].check = _failing_check
+
+    response = client.get("/readyz")
+
+    assert response.status_code == 503
+    data = response.get_json()
+    assert (data["status"], data["error"]) == ("unavailable", "OperationalError")
+    assert data["ready"] is False
+
+
+def test_result_is_reused_within_ttl():
+    """Test: dentro del TTL se devuelve el último resultado sin repetir el chequeo."""
+    calls = []
+    probe = ReadinessProbe(ttl=60, check=lambda: calls.append(1))
+
+    assert probe.status()["ready"] is True
+    assert probe.status()["ready"] is True
+    assert len(calls) == 1
+
+    probe.ttl = 0
+    probe.status()
+    assert len(calls) == 2
+
+
+def test_concurrent_caller_gets_cached_result_without_waiting():
+    """Test: mientras un hilo ejecuta el chequeo, los demás reciben el resultado anterior."""
+    started, release = threading.Event(), threading.Event()
+
+    def slow_check():
+        started.set()
+        release.wait(5)
+        raise ConnectionError
+
+    probe = ReadinessProbe(ttl=0, check=lambda: None)
+    probe.status()
+    probe.check = slow_check
+
+    worker = threading.Thread(target=probe.status)
+    worker.start()
+    try:
+        assert started.wait(5)
+        # El chequeo lento tiene el candado: esta llamada no debe esperarlo
+        assert probe.status()["ready"] is True
+        assert worker.is_alive()
+    finally:
+        release.set()
+        worker.join(5)
+
+    probe.ttl = 60
+    assert (probe.status()["ready"], probe.status()["error"]) == (False, "ConnectionError")
@@ -0,0 +1,77 @@
+"""
+Tests de la instrumentación Server-Timing por petición.
+"""
+
+import re
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app
+from app.extensions import db
+from app.utils import instrumentation
+from app.utils.instrumentation import init_instrumentation
+from conftest import TestConfig, count_queries
+
+
+class TimingConfig(TestConfig):
+    REQUEST_TIMING_ENABLED = True
+
+
+@pytest.fixture
+def timing_app():
+    """Aplicación de prueba con la instrumentación habilitada."""
+    timing_app = create_app(TimingConfig)
+    with timing_app.app_context():
+        db.create_all()
+        yield timing_app
+        db.session.remove()
+
+
+def _timed_queries(response) -> int:
+    header = response.headers["Server-Timing"]
+    assert re.search(r"tpl;dur=[\d.]+, total;dur=[\d.]+$", header)
+    return int(re.search(r'db;dur=[\d.]+;desc="(\d+) queries"', header).group(1))
+
+
+def test_list_page_reports_server_timing(timing_app):
+    """Test: la lista lleva Server-Timing con el número real de sentencias de la petición."""
+    client = timing_app.test_client()
+    client.post("/colors/create", data={"name": "Rojo"})
+
+    with count_queries() as counter:
+        response = client.get("/colors/")
+
+    assert response.status_code == 200
+    assert _timed_queries(response) == counter.count == 3
+
+
+def test_listeners_are_registered_once_per_engine(timing_app):
+    """Test: volver a inicializar sobre el mismo motor no cuenta dos veces cada sentencia."""
+    init_instrumentation(timing_app, db.engine)
+    client = timing_app.test_client()
+
+    with count_queries() as counter:
+        response = client.get("/colors/")
+
+    assert _timed_queries(response) == counter.count
+
+
+def test_replica_engines_are_instrumented(tmp_path):
+    """Test: las sentencias enviadas a las réplicas también se miden."""
+    class ReplicaTimingConfig(TimingConfig):
+        REPLICA_DATABASE_URIS = [f"sqlite:///{tmp_path / 'replica.db'}"]
+
+    app = create_app(ReplicaTimingConfig)
+    replica = app.extensions["replicas"].engines[0]
+    assert event.contains(
+        replica, "after_cursor_execute", instrumentation._on_after_cursor_execute
+    )
+
+
+def test_after_execute_without_start_is_ignored():
+    """Test: una sentencia sin inicio registrado (listener agregado a mitad) no falla."""
+    class Connection:
+        info: dict = {}
+
+    instrumentation._on_after_cursor_execute(Connection(), None, "SELECT 1", (), None, False)
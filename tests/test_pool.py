@@ -0,0 +1,71 @@
+"""
+Tests de las métricas del pool de conexiones y de /internal/pool.
+"""
+
+import time
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app import create_app
+from app.extensions import db
+from conftest import TestConfig
+
+
+@pytest.fixture
+def pool_app(tmp_path):
+    """Aplicación sobre un archivo SQLite con un QueuePool de una conexión, sin espera."""
+    class PoolConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'pool.db'}"
+        SQLALCHEMY_ENGINE_OPTIONS = {"pool_size": 1, "max_overflow": 0, "pool_timeout": 0}
+
+    pool_app = create_app(PoolConfig)
+    with pool_app.app_context():
+        db.create_all()
+        db.session.remove()
+        yield pool_app
+        db.session.remove()
+
+
+def test_pool_endpoint_reports_checkouts_and_hold_times(pool_app):
+    """Test: /internal/pool muestra la ocupación del QueuePool y cuánto se retuvo la conexión."""
+    metrics = pool_app.extensions["pool_metrics"]
+    before = metrics.stats()
+
+    with db.engine.connect():
+        time.sleep(0.01)
+    stats = pool_app.test_client().get("/internal/pool").get_json()
+
+    assert stats["pool"] == "QueuePool"
+    assert (stats["size"], stats["max_overflow"], stats["checked_out"]) == (1, 0, 0)
+    assert stats["checkouts"] == stats["checkins"] == before["checkouts"] + 1
+    assert stats["hold_max"] >= stats["hold_avg"] > 0
+    assert stats["hold_max"] >= 0.01
+
+
+def test_pool_saturation_is_counted(pool_app):
+    """Test: el checkout que ocupa la última conexión se cuenta; el que agota el timeout no."""
+    metrics = pool_app.extensions["pool_metrics"]
+    before = metrics.stats()
+
+    with db.engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            db.engine.connect()
+
+    stats = metrics.stats()
+    assert stats["peak_checked_out"] == 1
+    assert stats["saturated_checkouts"] == before["saturated_checkouts"] + 1
+    assert stats["checkouts"] == before["checkouts"] + 1
+
+
+def test_pool_events_are_counted_after_dispose(pool_app):
+    """Test: tras `dispose()` (pool nuevo) se siguen contando los checkouts."""
+    metrics = pool_app.extensions["pool_metrics"]
+    db.engine.dispose()
+    checkouts = metrics.checkouts
+
+    with db.engine.connect():
+        pass
+
+    assert metrics.checkouts == checkouts + 1
+    assert metrics.stats()["checked_in"] == 1
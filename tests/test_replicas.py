@@ -0,0 +1,81 @@
+"""
+Tests del enrutamiento de lecturas a réplicas.
+
+La base principal y la réplica son dos archivos SQLite con datos distintos,
+así cada respuesta muestra de cuál se leyó.
+"""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app import create_app
+from app.extensions import db
+from app.models import CatalogVersion, Color
+from conftest import TestConfig
+
+
+def _seed(engine, color_name: str) -> None:
+    db.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            CatalogVersion(catalog=name, version=0) for name in ("colors", "roles", "wood_types")
+        )
+        session.add(Color(name=color_name))
+        session.commit()
+
+
+@pytest.fixture
+def replica_app(tmp_path):
+    """Aplicación con una réplica; la principal tiene 'Primario' y la réplica 'Replicado'."""
+    class ReplicaConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'primary.db'}"
+        REPLICA_DATABASE_URIS = [f"sqlite:///{tmp_path / 'replica.db'}"]
+
+    app = create_app(ReplicaConfig)
+    with app.app_context():
+        _seed(db.engine, "Primario")
+        _seed(app.extensions["replicas"].engines[0], "Replicado")
+        yield app
+        db.session.remove()
+
+
+def test_reads_go_to_replica(replica_app):
+    """Test: GET lee de la réplica."""
+    response = replica_app.test_client().get("/colors/")
+
+    assert b"Replicado" in response.data
+    assert b"Primario" not in response.data
+
+
+def test_reads_after_write_stick_to_primary(replica_app):
+    """Test: tras escribir, el cliente lee de la principal; otro cliente sigue en la réplica."""
+    client = replica_app.test_client()
+    response = client.post("/colors/create", data={"name": "Verde"})
+    assert response.status_code == 302
+
+    response = client.get("/colors/")
+    assert b"Primario" in response.data
+    assert b"Verde" in response.data
+
+    response = replica_app.test_client().get("/colors/")
+    assert b"Replicado" in response.data
+
+
+def test_failed_replica_is_ejected(tmp_path):
+    """Test: una réplica inalcanzable se expulsa y las lecturas van a la principal."""
+    class BrokenReplicaConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'primary.db'}"
+        REPLICA_DATABASE_URIS = [f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"]
+
+    app = create_app(BrokenReplicaConfig)
+    with app.app_context():
+        _seed(db.engine, "Primario")
+        client = app.test_client()
+
+        response = client.get("/colors/")
+        assert b"Primario" in response.data
+
+        stats = client.get("/internal/replicas").get_json()
+        assert stats["ejections"] == 1
+        assert stats["replicas"][0]["ejected_for"] > 0
+        db.session.remove()
@@ -0,0 +1,26 @@
+"""
+Tests de la compilación anticipada de plantillas.
+"""
+
+from app import create_app
+from app.utils.templates import warm_templates
+from conftest import TestConfig
+
+
+def test_warm_templates_compiles_every_template(app):
+    """Test: warm_templates deja todas las plantillas en la caché de Jinja."""
+    count = warm_templates(app)
+
+    assert count >= 11
+    cached = {key[1] for key in app.jinja_env.cache.keys()}
+    assert {"base.html", "colors/list.html", "errors/error.html"} <= cached
+
+
+def test_bytecode_cache_writes_to_configured_dir(tmp_path):
+    """Test: con TEMPLATE_BYTECODE_CACHE_DIR la precompilación guarda el bytecode en disco."""
+    class BytecodeConfig(TestConfig):
+        TEMPLATE_BYTECODE_CACHE_DIR = str(tmp_path / "jinja")
+
+    create_app(BytecodeConfig, precompile_templates=True)
+
+    assert len(list((tmp_path / "jinja").iterdir())) >= 11